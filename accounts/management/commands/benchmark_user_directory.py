@@ -0,0 +1,76 @@
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Case, IntegerField, Value, When
+from accounts.models import (
+    DEPARTMENT_DIRECTORY_ORDERING,
+    DIRECTORY_ORDERING,
+    RANK_ORDER,
+)
+
+User = get_user_model()
+
+# 직급 순번을 저장하기 전의 정렬 (요청마다 CASE 식으로 계산)
+LEGACY_ORDERING = [
+    *DIRECTORY_ORDERING[:2],
+    Case(
+        *[
+            When(rank=rank, then=Value(order))
+            for rank, order in RANK_ORDER.items()
+        ],
+        default=Value(len(RANK_ORDER)),
+        output_field=IntegerField(),
+    ),
+    "first_name",
+    "id",
+]
+
+
+class Command(BaseCommand):
+    help = "직원 목록 페이지 쿼리 벤치마크 (직급 CASE 정렬 / 직급 순번 정렬)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--department", type=int, help="부서 ID")
+        parser.add_argument("--page", type=int, default=1, help="페이지 번호")
+        parser.add_argument(
+            "--page-size", type=int, default=10, help="페이지 크기"
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=50, help="반복 횟수"
+        )
+        parser.add_argument(
+            "--explain", action="store_true", help="실행 계획 출력"
+        )
+
+    def handle(self, *args, **options):
+        queryset = User.objects.select_related("department").filter(
+            is_active=True
+        )
+        ordering = DIRECTORY_ORDERING
+        if options["department"]:
+            # 직원 목록 API와 같이 한 부서는 부서 내 정렬만 사용
+            queryset = queryset.filter(department_id=options["department"])
+            ordering = DEPARTMENT_DIRECTORY_ORDERING
+
+        offset = (options["page"] - 1) * options["page_size"]
+        for label, ordering in [
+            ("CASE 정렬", LEGACY_ORDERING),
+            ("직급 순번 정렬", ordering),
+        ]:
+            page = queryset.order_by(*ordering)[
+                offset : offset + options["page_size"]
+            ]
+            elapsed = []
+            for _ in range(options["iterations"]):
+                started = time.perf_counter()
+                # 결과 캐시를 쓰지 않도록 매번 새 쿼리셋으로 조회
+                list(page.all())
+                elapsed.append(time.perf_counter() - started)
+            elapsed.sort()
+
+            self.stdout.write(
+                f"{label}: 평균 {sum(elapsed) / len(elapsed) * 1000:.2f}ms, "
+                f"중앙값 {elapsed[len(elapsed) // 2] * 1000:.2f}ms"
+            )
+            if options["explain"]:
+                self.stdout.write(page.explain())
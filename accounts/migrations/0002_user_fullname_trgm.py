@@ -0,0 +1,23 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:29
+
+import accounts.models
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('organizations', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(accounts.models.FullName(), name='gin_trgm_ops'), name='accounts_user_fullname_trgm'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:55
+
+import accounts.models
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_fullname_trgm'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('organizations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(accounts.models.FullName(), name='text_pattern_ops'), name='accounts_user_fullname_like'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['first_name'], name='accounts_user_first_name_like', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_name_prefix_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmployeeIdCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=5, unique=True)),
+                ('last_number', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': '사번 카운터',
+                'verbose_name_plural': '사번 카운터',
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_employeeidcounter'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('organizations', '0002_directory_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='rank_order',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(rank='DIRECTOR', then=models.Value(0)), models.When(rank='GENERAL_MANAGER', then=models.Value(1)), models.When(rank='DEPUTY_GENERAL_MANAGER', then=models.Value(2)), models.When(rank='MANAGER', then=models.Value(3)), models.When(rank='ASSISTANT_MANAGER', then=models.Value(4)), models.When(rank='SENIOR', then=models.Value(5)), models.When(rank='STAFF', then=models.Value(6)), default=models.Value(7)), output_field=models.PositiveSmallIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['department', 'rank_order', 'first_name', 'id'], name='accounts_user_directory_idx'),
+        ),
+    ]
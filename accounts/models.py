@@ -1,8 +1,46 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 
 # Create your models here.
 
+# 직급 정렬 순서 (높은 직급이 먼저)
+RANK_ORDER = {
+    "DIRECTOR": 0,
+    "GENERAL_MANAGER": 1,
+    "DEPUTY_GENERAL_MANAGER": 2,
+    "MANAGER": 3,
+    "ASSISTANT_MANAGER": 4,
+    "SENIOR": 5,
+    "STAFF": 6,
+}
+
+# 한 부서 안의 직원 정렬 (직급 → 이름)
+DEPARTMENT_DIRECTORY_ORDERING = ["rank_order", "first_name", "id"]
+
+# 직원 목록 정렬 (본부 → 부서명 → 직급 → 이름)
+# 부서 테이블 컬럼으로 먼저 정렬하므로 전체 목록은 인덱스 순서로 읽을 수 없음
+DIRECTORY_ORDERING = [
+    # NULL(본부)이 먼저 오도록 내림차순 정렬
+    models.F("department__parent_id").desc(nulls_first=True),
+    "department__name",
+    *DEPARTMENT_DIRECTORY_ORDERING,
+]
+
+
+class FullName(models.Func):
+    """
+    성+이름 결합 (예: 홍길동)
+    CONCAT()은 IMMUTABLE이 아니어서 인덱스에 쓸 수 없으므로 || 연산자 사용
+    """
+
+    template = "(%(expressions)s)"
+    arg_joiner = " || "
+    output_field = models.CharField()
+
+    def __init__(self, prefix="", **extra):
+        super().__init__(f"{prefix}last_name", f"{prefix}first_name", **extra)
+
 
 class User(AbstractUser):
     ROLE_CHOICES = [
@@ -36,7 +74,61 @@ class User(AbstractUser):
         null=True,
         related_name="employees",
     )
+    # 직급 정렬용 순번 (rank에서 DB가 계산해 저장하므로 bulk_create/update도 반영)
+    rank_order = models.GeneratedField(
+        expression=models.Case(
+            *[
+                models.When(rank=rank, then=models.Value(order))
+                for rank, order in RANK_ORDER.items()
+            ],
+            default=models.Value(len(RANK_ORDER)),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
 
     class Meta:
         verbose_name = "사용자"
         verbose_name_plural = "사용자들"
+        indexes = [
+            # 담당자 이름 검색용 트라이그램 인덱스
+            GinIndex(
+                OpClass(FullName(), name="gin_trgm_ops"),
+                name="accounts_user_fullname_trgm",
+            ),
+            # 자동완성 앞부분 일치(LIKE 'x%')용 패턴 인덱스
+            models.Index(
+                OpClass(FullName(), name="text_pattern_ops"),
+                name="accounts_user_fullname_like",
+            ),
+            models.Index(
+                fields=["first_name"],
+                name="accounts_user_first_name_like",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            # 한 부서 직원 목록용 (재직자만)
+            # department_id = ? ORDER BY rank_order, first_name, id를
+            # 정렬 없이 인덱스 순서로 읽고 LIMIT에서 멈춤
+            models.Index(
+                fields=["department", "rank_order", "first_name", "id"],
+                name="accounts_user_directory_idx",
+                condition=models.Q(is_active=True),
+            ),
+        ]
+
+
+class EmployeeIdCounter(models.Model):
+    """
+    사번 발급 카운터 (접두사별 마지막 번호)
+    행 잠금(SELECT ... FOR UPDATE)으로 동시 등록 시에도 중복 없이 발급
+    """
+
+    prefix = models.CharField(max_length=5, unique=True)
+    last_number = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "사번 카운터"
+        verbose_name_plural = "사번 카운터"
+
+    def __str__(self):
+        return f"{self.prefix}{self.last_number}"
@@ -0,0 +1,91 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from .models import EmployeeIdCounter
+from .signals import users_onboarded
+
+User = get_user_model()
+
+EMPLOYEE_ID_PREFIX = "E"
+EMPLOYEE_ID_DIGITS = 4
+MAX_ONBOARDING_USERS = 500
+
+# PBKDF2 해싱은 GIL을 해제하므로 스레드로 병렬 처리 가능
+PASSWORD_HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def get_last_employee_number(prefix):
+    """기존 사번 중 가장 큰 번호 (카운터를 처음 만들 때 한 번만 사용)"""
+    pattern = re.compile(rf"^{re.escape(prefix)}(\d+)$")
+    numbers = [
+        int(match.group(1))
+        for match in map(
+            pattern.match,
+            User.objects.filter(employee_id__startswith=prefix).values_list(
+                "employee_id", flat=True
+            ),
+        )
+        if match
+    ]
+    return max(numbers, default=0)
+
+
+def allocate_employee_ids(count=1, prefix=EMPLOYEE_ID_PREFIX):
+    """
+    사번 count개 발급 (예: E0001)
+    카운터 행을 잠근 채 번호를 증가시키므로 동시 등록에도 중복되지 않음
+    호출한 트랜잭션이 롤백되면 발급한 번호도 함께 롤백됨
+    """
+    with transaction.atomic():
+        counters = EmployeeIdCounter.objects.select_for_update()
+        counter, _ = counters.get_or_create(
+            prefix=prefix,
+            defaults={"last_number": get_last_employee_number(prefix)},
+        )
+        first = counter.last_number + 1
+        counter.last_number += count
+        counter.save(update_fields=["last_number"])
+
+    return [
+        f"{prefix}{str(number).zfill(EMPLOYEE_ID_DIGITS)}"
+        for number in range(first, first + count)
+    ]
+
+
+def hash_passwords(passwords):
+    """
+    비밀번호 해싱 (스레드 풀에서 병렬 처리)
+    비밀번호가 없으면 사용할 수 없는 비밀번호로 설정
+    """
+    if len(passwords) <= 1:
+        return [make_password(password) for password in passwords]
+    with ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS) as executor:
+        return list(executor.map(make_password, passwords))
+
+
+def bulk_onboard(users_data):
+    """
+    직원 일괄 등록 (트랜잭션 하나, bulk_create 한 번)
+    비밀번호는 잠금을 잡기 전에 미리 해싱
+    bulk_create는 post_save 시그널을 보내지 않으므로 커밋 후 users_onboarded 전송
+    """
+    passwords = hash_passwords(
+        [data.pop("password", None) for data in users_data]
+    )
+    users = [
+        User(password=password, **data)
+        for data, password in zip(users_data, passwords)
+    ]
+
+    with transaction.atomic():
+        employee_ids = allocate_employee_ids(len(users))
+        for user, employee_id in zip(users, employee_ids):
+            user.employee_id = employee_id
+        users = User.objects.bulk_create(users)
+        transaction.on_commit(
+            lambda: users_onboarded.send(sender=User, users=users)
+        )
+    return users
@@ -0,0 +1,58 @@
+from django.db.models import Case, IntegerField, Q, Value, When
+from tasks import search  # noqa: F401 (trgm_icontains 룩업 등록)
+from .models import FullName
+
+AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 50
+
+
+def autocomplete_users(queryset, term, limit=AUTOCOMPLETE_LIMIT):
+    """
+    사용자 자동완성 (상위 limit명)
+    - 성+이름 / 이름 / 사번 앞부분 일치: 패턴 인덱스(LIKE 'x%')로 조회
+    - 성+이름 부분 일치: 트라이그램 인덱스로 조회
+    앞부분 일치가 부분 일치보다 먼저 오고, 같은 순위는 이름순
+    이름 사이 공백은 무시 (예: "홍 길동" → "홍길동")
+    """
+    term = "".join(term.split())
+    if not term:
+        return []
+
+    rows = (
+        queryset.annotate(full_name=FullName())
+        .filter(
+            Q(full_name__startswith=term)
+            | Q(first_name__startswith=term)
+            | Q(employee_id__startswith=term)
+            | Q(full_name__trgm_icontains=term)
+        )
+        .annotate(
+            match_rank=Case(
+                When(full_name__startswith=term, then=Value(0)),
+                When(first_name__startswith=term, then=Value(1)),
+                When(employee_id__startswith=term, then=Value(2)),
+                default=Value(3),
+                output_field=IntegerField(),
+            )
+        )
+        .order_by("match_rank", "full_name", "id")
+        .values(
+            "id",
+            "full_name",
+            "employee_id",
+            "rank",
+            "department_id",
+            "department__name",
+        )[:limit]
+    )
+    return [
+        {
+            "id": row["id"],
+            "name": row["full_name"],
+            "employee_id": row["employee_id"],
+            "rank": row["rank"],
+            "department_id": row["department_id"],
+            "department_name": row["department__name"],
+        }
+        for row in rows
+    ]
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from .onboarding import MAX_ONBOARDING_USERS
 
 User = get_user_model()
 
@@ -37,3 +39,65 @@ class UserDetailSerializer(UserSerializer):
             "first_name",
             "last_name",
         ]
+
+
+class UserCreateSerializer(UserSerializer):
+    """등록용 직원 정보 (사번은 자동 발급)"""
+
+    password = serializers.CharField(
+        write_only=True, required=False, style={"input_type": "password"}
+    )
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ["password"]
+        read_only_fields = ["id", "employee_id"]
+
+
+class OnboardingUserSerializer(serializers.ModelSerializer):
+    """일괄 등록용 직원 정보 (사번은 자동 발급)"""
+
+    password = serializers.CharField(
+        write_only=True, required=False, style={"input_type": "password"}
+    )
+
+    class Meta:
+        model = User
+        fields = [
+            "username",
+            "email",
+            "first_name",
+            "last_name",
+            "role",
+            "rank",
+            "department",
+            "password",
+        ]
+        # 아이디 중복은 목록 전체를 한 번에 검사
+        extra_kwargs = {
+            "username": {"validators": [UnicodeUsernameValidator()]}
+        }
+
+
+class BulkOnboardingSerializer(serializers.Serializer):
+    users = OnboardingUserSerializer(many=True, allow_empty=False)
+
+    def validate_users(self, users):
+        if len(users) > MAX_ONBOARDING_USERS:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {MAX_ONBOARDING_USERS}명까지 등록할 수 있습니다."
+            )
+
+        usernames = [user["username"] for user in users]
+        duplicates = {
+            username for username in usernames if usernames.count(username) > 1
+        }
+        duplicates.update(
+            User.objects.filter(username__in=usernames).values_list(
+                "username", flat=True
+            )
+        )
+        if duplicates:
+            raise serializers.ValidationError(
+                f"이미 사용 중인 아이디입니다: {', '.join(sorted(duplicates))}"
+            )
+        return users
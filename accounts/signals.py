@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# 직원 일괄 등록 완료 (bulk_create는 post_save를 보내지 않으므로 대신 전송)
+# users: 등록된 사용자 목록
+users_onboarded = Signal()
@@ -0,0 +1,131 @@
+from django.db.models import Avg, Count, F, Q
+from django.db.models.functions import TruncMonth
+from tasks.models import DISTRIBUTION_ORDER, TaskEvaluation, get_delayed_q
+
+PRIORITIES = DISTRIBUTION_ORDER["priority"]
+DIFFICULTIES = DISTRIBUTION_ORDER["difficulty"]
+
+
+def get_count_aggregates():
+    """전체/완료/진행/지연 작업 수 조건부 집계"""
+    return {
+        "total": Count("id"),
+        "completed": Count("id", filter=Q(status="DONE")),
+        "in_progress": Count("id", filter=Q(status="IN_PROGRESS")),
+        "delayed": Count("id", filter=get_delayed_q()),
+    }
+
+
+def get_average_completion_time():
+    """완료된 작업의 평균 완료 시간 (시작일 기준)"""
+    return Avg(
+        F("completed_at") - F("start_date"),
+        filter=Q(status="DONE", completed_at__isnull=False),
+    )
+
+
+def to_hours(duration):
+    return duration.total_seconds() / 3600 if duration else 0
+
+
+def build_task_statistics(tasks):
+    """사용자 작업 통계 (조건부 집계 1회)"""
+    summary = tasks.order_by().aggregate(
+        **get_count_aggregates(),
+        **{
+            f"priority_{priority}": Count("id", filter=Q(priority=priority))
+            for priority in ["HIGH", "MEDIUM", "LOW"]
+        },
+    )
+    total_tasks = summary["total"]
+    return {
+        "total_tasks": total_tasks,
+        "completed_tasks": summary["completed"],
+        "in_progress_tasks": summary["in_progress"],
+        "delayed_tasks": summary["delayed"],
+        "completion_rate": (
+            (summary["completed"] / total_tasks * 100)
+            if total_tasks > 0
+            else 0
+        ),
+        "tasks_by_priority": {
+            priority: summary[f"priority_{priority}"]
+            for priority in ["HIGH", "MEDIUM", "LOW"]
+        },
+    }
+
+
+def build_task_statistics_detail(tasks):
+    """
+    사용자 작업 상세 통계 (작업 수와 관계없이 쿼리 3회)
+    - 분포/지연/평균 완료 시간: 조건부 집계 1회
+    - 월별 통계: 시작 월 기준 그룹 집계 1회
+    - 평균 점수: 완료된 작업의 평가 점수 평균 1회
+    """
+    tasks = tasks.order_by()
+    summary = tasks.aggregate(
+        **get_count_aggregates(),
+        completed_with_time=Count(
+            "id", filter=Q(status="DONE", completed_at__isnull=False)
+        ),
+        average_completion_time=get_average_completion_time(),
+        **{
+            f"priority_{priority}": Count("id", filter=Q(priority=priority))
+            for priority in PRIORITIES
+        },
+        **{
+            f"difficulty_{difficulty}": Count(
+                "id", filter=Q(difficulty=difficulty)
+            )
+            for difficulty in DIFFICULTIES
+        },
+    )
+
+    monthly_rows = (
+        tasks.annotate(month=TruncMonth("start_date"))
+        .values("month")
+        .annotate(
+            **get_count_aggregates(),
+            average_completion_time=get_average_completion_time(),
+        )
+        .order_by("month")
+    )
+    monthly_stats = {
+        row["month"].strftime("%Y-%m"): {
+            "total": row["total"],
+            "completed": row["completed"],
+            "delayed": row["delayed"],
+            "avg_completion_time": round(
+                to_hours(row["average_completion_time"]), 2
+            ),
+        }
+        for row in monthly_rows
+    }
+
+    avg_score = TaskEvaluation.objects.filter(
+        task__in=tasks.values("id"), task__status="DONE"
+    ).aggregate(avg_score=Avg("performance_score"))["avg_score"]
+
+    total_tasks = summary["total"]
+    delay_rate = (
+        (summary["delayed"] / total_tasks * 100) if total_tasks > 0 else 0
+    )
+    return {
+        "priority_distribution": {
+            priority: summary[f"priority_{priority}"]
+            for priority in PRIORITIES
+        },
+        "difficulty_distribution": {
+            difficulty: summary[f"difficulty_{difficulty}"]
+            for difficulty in DIFFICULTIES
+        },
+        "avg_completion_time": round(
+            to_hours(summary["average_completion_time"]), 2
+        ),
+        "delay_rate": round(delay_rate, 2),
+        "monthly_stats": monthly_stats,
+        "total_tasks": total_tasks,
+        "completed_tasks": summary["completed_with_time"],
+        "delayed_tasks": summary["delayed"],
+        "avg_score": round(avg_score or 0, 2),
+    }
@@ -1,6 +1,14 @@
+from io import StringIO
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
 from organizations.models import Department
+from tasks.models import Task, TaskEvaluation
+from tasks.performance import get_performance_version
+from .models import RANK_ORDER
+from .onboarding import allocate_employee_ids
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
@@ -89,3 +97,415 @@ class UserAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["username"], "testuser")
         self.assertEqual(response.data["email"], "test@example.com")
+
+
+class UserTaskStatisticsAPITest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="testuser",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+            role="EMPLOYEE",
+            rank="STAFF",
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="EMP002",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse(
+            "user-tasks-statistics-detail", kwargs={"pk": self.user.pk}
+        )
+
+    def create_task(self, start_date, status="TODO", score=None, **kwargs):
+        task = Task.objects.create(
+            title="테스트 작업",
+            description="테스트 설명",
+            status=status,
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date=start_date,
+            due_date="2099-01-01T00:00:00Z",
+            **kwargs,
+        )
+        if score is not None:
+            TaskEvaluation.objects.create(
+                task=task,
+                evaluator=self.user,
+                difficulty="MEDIUM",
+                performance_score=score,
+                feedback="피드백",
+            )
+        return task
+
+    def get_statistics(self, url=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url or self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data, len(context.captured_queries)
+
+    def test_tasks_statistics_detail(self):
+        self.create_task(
+            "2024-03-01T00:00:00Z",
+            status="DONE",
+            score=4,
+            priority="HIGH",
+            completed_at="2024-03-01T06:00:00Z",
+        )
+        self.create_task(
+            "2024-03-10T00:00:00Z",
+            status="DONE",
+            score=2,
+            completed_at="2024-03-10T02:00:00Z",
+        )
+        self.create_task("2024-04-01T00:00:00Z", score=5)
+
+        data, _ = self.get_statistics()
+
+        self.assertEqual(data["total_tasks"], 3)
+        self.assertEqual(data["completed_tasks"], 2)
+        self.assertEqual(data["avg_completion_time"], 4)
+        self.assertEqual(data["avg_score"], 3)
+        self.assertEqual(
+            data["priority_distribution"],
+            {"URGENT": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 0},
+        )
+        self.assertEqual(
+            data["monthly_stats"],
+            {
+                "2024-03": {
+                    "total": 2,
+                    "completed": 2,
+                    "delayed": 0,
+                    "avg_completion_time": 4,
+                },
+                "2024-04": {
+                    "total": 1,
+                    "completed": 0,
+                    "delayed": 0,
+                    "avg_completion_time": 0,
+                },
+            },
+        )
+
+        summary, _ = self.get_statistics(
+            reverse("user-tasks-statistics", kwargs={"pk": self.user.pk})
+        )
+        self.assertEqual(summary["completion_rate"], 2 / 3 * 100)
+        self.assertEqual(
+            summary["tasks_by_priority"], {"HIGH": 1, "MEDIUM": 2, "LOW": 0}
+        )
+
+    def test_tasks_statistics_detail_query_count(self):
+        # 작업 수가 늘어나도 쿼리 수는 동일
+        self.create_task("2024-03-01T00:00:00Z", status="DONE", score=4)
+        _, few = self.get_statistics()
+
+        for month in range(1, 10):
+            self.create_task(
+                f"2023-0{month}-01T00:00:00Z", status="DONE", score=3
+            )
+        _, many = self.get_statistics()
+
+        self.assertEqual(few, many)
+
+
+class UserAutocompleteAPITest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="EMP001",
+            last_name="박",
+            first_name="팀장",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        for index, (last_name, first_name) in enumerate(
+            [("홍", "길동"), ("김", "길동"), ("홍", "길순"), ("이", "동길")]
+        ):
+            User.objects.create_user(
+                username=f"user{index}",
+                password="testpass123",
+                employee_id=f"EMP10{index}",
+                last_name=last_name,
+                first_name=first_name,
+                department=self.department,
+            )
+        # 다른 부서 사용자는 팀장 검색 결과에서 제외
+        User.objects.create_user(
+            username="other",
+            password="testpass123",
+            employee_id="EMP200",
+            last_name="홍",
+            first_name="길자",
+            department=Department.objects.create(name="다른부서", code="T2"),
+        )
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse("user-autocomplete")
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["name"] for row in response.data]
+
+    def test_autocomplete(self):
+        self.assertEqual(self.search(q="홍길"), ["홍길동", "홍길순"])
+        self.assertEqual(self.search(q="홍 길동"), ["홍길동"])
+        # 이름 앞부분 일치가 부분 일치보다 먼저
+        self.assertEqual(self.search(q="동길"), ["이동길"])
+        self.assertEqual(
+            self.search(q="길"), ["김길동", "홍길동", "홍길순", "이동길"]
+        )
+        self.assertEqual(self.search(q="EMP10", limit=2), ["김길동", "이동길"])
+        self.assertEqual(self.search(q=" "), [])
+
+
+class UserOnboardingAPITest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.admin = User.objects.create_user(
+            username="admin",
+            password="testpass123",
+            employee_id="E0005",
+            role="ADMIN",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def test_create_allocates_employee_id(self):
+        url = reverse("user-list")
+        for username, employee_id in [("first", "E0006"), ("second", "E0007")]:
+            response = self.client.post(
+                url,
+                {"username": username, "department": self.department.id},
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(response.data["employee_id"], employee_id)
+
+        # 검증에 실패하면 사번 카운터를 잠그지 않음
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                url, {"username": "first"}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            any(
+                "accounts_employeeidcounter" in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+        self.assertEqual(allocate_employee_ids(), ["E0008"])
+
+    def test_create_hashes_password(self):
+        response = self.client.post(
+            reverse("user-list"),
+            {"username": "new", "password": "newpass123"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("password", response.data)
+        user = User.objects.get(username="new")
+        self.assertEqual(user.employee_id, "E0006")
+        self.assertTrue(user.check_password("newpass123"))
+
+    def test_bulk_onboard(self):
+        url = reverse("user-bulk-onboard")
+        users = [
+            {
+                "username": f"new{index}",
+                "first_name": "신입",
+                "department": self.department.id,
+                "password": f"password{index}",
+            }
+            for index in range(3)
+        ]
+        version = get_performance_version()
+        with (
+            CaptureQueriesContext(connection) as context,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(url, {"users": users}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [row["employee_id"] for row in response.data],
+            ["E0006", "E0007", "E0008"],
+        )
+        # 커밋 후 팀 성과 캐시 무효화
+        self.assertNotEqual(get_performance_version(), version)
+        inserts = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith('INSERT INTO "accounts_user"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertTrue(
+            User.objects.get(username="new2").check_password("password2")
+        )
+
+        response = self.client.post(
+            url, {"users": users[:1] + [{"username": "admin"}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(employee_id="E0009").exists())
+
+
+class UserDirectoryTest(APITestCase):
+    def setUp(self):
+        headquarters = Department.objects.create(name="본부", code="HQ001")
+        team = Department.objects.create(
+            name="개발팀", code="TEAM001", parent=headquarters
+        )
+        self.director = User.objects.create_user(
+            username="director",
+            password="testpass123",
+            employee_id="EMP001",
+            first_name="이사",
+            department=headquarters,
+            rank="DIRECTOR",
+            role="ADMIN",
+        )
+        User.objects.bulk_create(
+            [
+                User(
+                    username=f"user{index}",
+                    employee_id=f"EMP10{index}",
+                    first_name=first_name,
+                    department=team,
+                    rank=rank,
+                )
+                for index, (first_name, rank) in enumerate(
+                    [("가", "STAFF"), ("나", "MANAGER"), ("다", "SENIOR")]
+                )
+            ]
+        )
+        self.client.force_authenticate(user=self.director)
+
+    def test_directory_ordering(self):
+        # bulk_create로 만든 사용자도 직급 순번이 계산됨
+        self.assertEqual(
+            User.objects.get(username="user1").rank_order,
+            RANK_ORDER["MANAGER"],
+        )
+
+        response = self.client.get(reverse("user-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user["first_name"] for user in response.data["results"]],
+            ["이사", "나", "다", "가"],
+        )
+
+    def test_department_directory_ordering(self):
+        # 한 부서만 조회하면 부서 내 정렬(직급 → 이름)만 사용
+        team = Department.objects.get(code="TEAM001")
+        response = self.client.get(
+            reverse("user-list"), {"department": team.id}
+        )
+
+        self.assertEqual(
+            [user["first_name"] for user in response.data["results"]],
+            ["나", "다", "가"],
+        )
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_user_directory", iterations=2, stdout=out)
+        self.assertIn("직급 순번 정렬", out.getvalue())
+
+
+class UserTaskHistoryAPITest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse(
+            "user-tasks-history", kwargs={"pk": self.manager.pk}
+        )
+
+    def create_tasks(self, count):
+        Task.objects.bulk_create(
+            [
+                Task(
+                    title=f"작업 {index}",
+                    description="테스트 설명",
+                    assignee=self.manager,
+                    reporter=self.manager,
+                    department=self.department,
+                    start_date=f"2024-03-{index + 1:02d}T00:00:00Z",
+                    due_date="2024-04-01T00:00:00Z",
+                )
+                for index in range(count)
+            ]
+        )
+
+    def get_history(self, url=None, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url or self.url, params)
+        return response, len(context.captured_queries)
+
+    def test_tasks_history_pagination(self):
+        self.create_tasks(3)
+        response, _ = self.get_history(page_size=2)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [task["title"] for task in response.data["results"]],
+            ["작업 0", "작업 1"],
+        )
+        self.assertEqual(
+            response.data["results"][0]["department_name"], "테스트부서"
+        )
+        self.assertNotIn("comments", response.data["results"][0])
+
+        response, _ = self.get_history(response.data["next"])
+        self.assertEqual(
+            [task["title"] for task in response.data["results"]], ["작업 2"]
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_tasks_history_fields(self):
+        self.create_tasks(1)
+        response, _ = self.get_history(fields="id,title,is_delayed")
+        self.assertEqual(
+            set(response.data["results"][0]), {"id", "title", "is_delayed"}
+        )
+
+        response, _ = self.get_history(fields="id,comments")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_tasks_history_query_count(self):
+        # 페이지 크기만큼 작업이 늘어나도 쿼리 수는 동일
+        self.create_tasks(1)
+        _, few = self.get_history(page_size=20)
+
+        self.create_tasks(10)
+        _, many = self.get_history(page_size=20)
+
+        self.assertEqual(few, many)
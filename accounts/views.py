@@ -1,20 +1,35 @@
 from django.shortcuts import render
 from rest_framework import viewsets, status
 from django.contrib.auth import get_user_model
-from .serializers import UserSerializer, UserDetailSerializer
+from .search import (
+    AUTOCOMPLETE_LIMIT,
+    MAX_AUTOCOMPLETE_LIMIT,
+    autocomplete_users,
+)
+from .models import DEPARTMENT_DIRECTORY_ORDERING, DIRECTORY_ORDERING
+from .onboarding import allocate_employee_ids, bulk_onboard, hash_passwords
+from .serializers import (
+    BulkOnboardingSerializer,
+    UserCreateSerializer,
+    UserDetailSerializer,
+    UserSerializer,
+)
+from .statistics import build_task_statistics, build_task_statistics_detail
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db import transaction
 from django.utils import timezone
 from datetime import datetime
 from tasks.models import Task
-from tasks.serializers import TaskSerializer
+from tasks.serializers import TaskSummarySerializer
+from tasks.pagination import TaskCursorPagination
 from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from rest_framework.pagination import PageNumberPagination
 from organizations.models import Department
-from django.db.models import Case, When, IntegerField, CharField
+from django.db.models import CharField
 from django.db.models.functions import Concat
 from django.db.models import Value
 
@@ -78,6 +93,8 @@ class UserViewSet(viewsets.ModelViewSet):
             == "true"
         )
         rank = self.request.query_params.get("rank")
+        # 조회 대상 부서가 하나로 정해지는 경우 부서 ID
+        single_department_id = None
 
         # 일반 직원은 접근 불가
         if user.role == "EMPLOYEE":
@@ -92,6 +109,7 @@ class UserViewSet(viewsets.ModelViewSet):
         elif user.role == "MANAGER":
             # 팀장은 자신의 팀원만 조회 가능
             queryset = queryset.filter(department=user.department)
+            single_department_id = user.department_id
 
         # 검색어 처리
         search = self.request.query_params.get("search")
@@ -126,29 +144,22 @@ class UserViewSet(viewsets.ModelViewSet):
                 )
                 if dept_ids:
                     queryset = queryset.filter(department_id__in=dept_ids)
+                    if len(dept_ids) == 1:
+                        single_department_id = dept_ids[0]
             except Department.DoesNotExist:
                 return User.objects.none()
 
-        return queryset.order_by(
-            "-department__parent_id",  # NULL(본부)이 먼저 오도록 내림차순 정렬
-            "department__name",  # 부서명으로 정렬
-            Case(  # 직급 순서 정의
-                When(rank="DIRECTOR", then=0),
-                When(rank="GENERAL_MANAGER", then=1),
-                When(rank="DEPUTY_GENERAL_MANAGER", then=2),
-                When(rank="MANAGER", then=3),
-                When(rank="ASSISTANT_MANAGER", then=4),
-                When(rank="SENIOR", then=5),
-                When(rank="STAFF", then=6),
-                default=7,
-                output_field=IntegerField(),
-            ),
-            "first_name",  # 마지막으로 이름순
-        )
+        # 한 부서만 조회하면 부서 정렬 키가 모두 같으므로 부서 내 정렬만 사용
+        # (accounts_user_directory_idx 순서대로 읽어 정렬 없이 페이지 조회)
+        if single_department_id is not None:
+            return queryset.order_by(*DEPARTMENT_DIRECTORY_ORDERING)
+        return queryset.order_by(*DIRECTORY_ORDERING)
 
     def get_serializer_class(self):
         if self.action in ["retrieve", "me", "list"]:
             return UserDetailSerializer
+        if self.action == "create":
+            return UserCreateSerializer
         return UserSerializer
 
     def list(self, request, *args, **kwargs):
@@ -163,210 +174,135 @@ class UserViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"])
+    def autocomplete(self, request):
+        """
+        담당자 선택용 사용자 자동완성
+        - q: 검색어 (이름, 성+이름, 사번)
+        - limit: 최대 결과 수 (기본 10, 최대 50)
+        조회 권한 범위는 사용자 목록과 동일
+        """
+        try:
+            limit = int(request.query_params.get("limit", AUTOCOMPLETE_LIMIT))
+        except ValueError:
+            limit = AUTOCOMPLETE_LIMIT
+        limit = min(max(limit, 1), MAX_AUTOCOMPLETE_LIMIT)
+        return Response(
+            autocomplete_users(
+                self.get_queryset(), request.query_params.get("q", ""), limit
+            )
+        )
+
     @action(detail=False, methods=["get"])
     def me(self, request):
         serializer = self.get_serializer(request.user)
         return Response(serializer.data)
 
+    def paginate_tasks(self, tasks, fields=None):
+        """작업 목록을 (start_date, id) 커서로 페이지네이션해 요약 형식으로 반환"""
+        paginator = TaskCursorPagination()
+        page = paginator.paginate_queryset(
+            TaskSummarySerializer.setup_eager_loading(tasks, fields),
+            self.request,
+            view=self,
+        )
+        serializer = TaskSummarySerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
+
     @action(detail=True, methods=["get"])
     def tasks_current(self, request, pk=None):
         user = self.get_object()
         tasks = Task.objects.filter(assignee=user, status="IN_PROGRESS")
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data)
+        return self.paginate_tasks(tasks)
 
     @action(detail=True, methods=["get"])
     def tasks_history(self, request, pk=None):
+        """
+        사용자 작업 이력 (커서 페이지네이션)
+        - status, start_date, end_date: 필터
+        - fields: 응답에 포함할 필드 (쉼표로 구분, 예: id,title,status)
+        """
         user = self.get_object()
-        status = request.query_params.get("status")
+        status_filter = request.query_params.get("status")
         start_date = request.query_params.get("start_date")
         end_date = request.query_params.get("end_date")
 
+        fields = None
+        if request.query_params.get("fields"):
+            fields = [
+                field.strip()
+                for field in request.query_params["fields"].split(",")
+                if field.strip()
+            ]
+            unknown = set(fields) - set(TaskSummarySerializer.Meta.fields)
+            if unknown:
+                return Response(
+                    {
+                        "error": (
+                            f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"
+                        )
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
         tasks = Task.objects.filter(assignee=user)
 
-        if status:
-            tasks = tasks.filter(status=status)
+        if status_filter:
+            tasks = tasks.filter(status=status_filter)
         if start_date:
             tasks = tasks.filter(start_date__gte=start_date)
         if end_date:
             tasks = tasks.filter(due_date__lte=end_date)
 
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data)
-
-    @action(detail=True, methods=["get"])
-    def tasks_statistics(self, request, pk=None):
-        user = self.get_object()
-        current_user = request.user
-
-        # 권한 체크
-        if current_user.role == "ADMIN":
-            pass  # 관리자는 모든 접근 가능
-        elif current_user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            pass  # 본부장/이사도 모든 접근 가능
-        elif current_user.role == "MANAGER":
-            # 팀장은 자신의 팀원만 조회 가능
-            if user.department != current_user.department:
-                return Response(
-                    {"detail": "접근 권한이 없습니다."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-        else:
-            # 일반 직원은 자신의 정보만 조회 가능
-            if user.id != current_user.id:
-                return Response(
-                    {"detail": "접근 권한이 없습니다."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
-
+        return self.paginate_tasks(tasks, fields)
+
+    def can_view_statistics(self, user):
+        """작업 통계 조회 권한 확인"""
+        current_user = self.request.user
+        # 관리자와 본부장/이사는 모든 접근 가능
+        if current_user.role == "ADMIN" or current_user.rank in [
+            "DIRECTOR",
+            "GENERAL_MANAGER",
+        ]:
+            return True
+        # 팀장은 자신의 팀원만 조회 가능
+        if current_user.role == "MANAGER":
+            return user.department_id == current_user.department_id
+        # 일반 직원은 자신의 정보만 조회 가능
+        return user.id == current_user.id
+
+    def get_statistics_tasks(self, user):
         tasks = Task.objects.filter(assignee=user)
+        start_date = self.request.query_params.get("start_date")
+        end_date = self.request.query_params.get("end_date")
         if start_date:
             tasks = tasks.filter(start_date__gte=start_date)
         if end_date:
             tasks = tasks.filter(due_date__lte=end_date)
+        return tasks
 
-        total_tasks = tasks.count()
-        completed_tasks = tasks.filter(status="DONE").count()
-        in_progress_tasks = tasks.filter(status="IN_PROGRESS").count()
-        delayed_tasks = len([task for task in tasks if task.is_delayed])
-
-        completion_rate = (
-            (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        )
-
-        tasks_by_priority = {
-            "HIGH": tasks.filter(priority="HIGH").count(),
-            "MEDIUM": tasks.filter(priority="MEDIUM").count(),
-            "LOW": tasks.filter(priority="LOW").count(),
-        }
-
+    @action(detail=True, methods=["get"])
+    def tasks_statistics(self, request, pk=None):
+        user = self.get_object()
+        if not self.can_view_statistics(user):
+            return Response(
+                {"detail": "접근 권한이 없습니다."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
         return Response(
-            {
-                "total_tasks": total_tasks,
-                "completed_tasks": completed_tasks,
-                "in_progress_tasks": in_progress_tasks,
-                "delayed_tasks": delayed_tasks,
-                "completion_rate": completion_rate,
-                "tasks_by_priority": tasks_by_priority,
-            }
+            build_task_statistics(self.get_statistics_tasks(user))
         )
 
     @action(detail=True, methods=["get"])
     def tasks_statistics_detail(self, request, pk=None):
         user = self.get_object()
-        current_user = request.user
-
-        # 권한 체크
-        if current_user.role == "ADMIN":
-            pass  # 관리자는 모든 접근 가능
-        elif current_user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            pass  # 본부장/이사도 모든 접근 가능
-        elif current_user.role == "MANAGER":
-            # 팀장은 자신의 팀원만 조회 가능
-            if user.department != current_user.department:
-                return Response(
-                    {"detail": "접근 권한이 없습니다."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-        else:
-            # 일반 직원은 자신의 정보만 조회 가능
-            if user.id != current_user.id:
-                return Response(
-                    {"detail": "접근 권한이 없습니다."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
-
-        tasks = Task.objects.filter(assignee=user)
-        if start_date:
-            tasks = tasks.filter(start_date__gte=start_date)
-        if end_date:
-            tasks = tasks.filter(due_date__lte=end_date)
-
-        # 우선순위 분포
-        priority_distribution = {
-            "URGENT": tasks.filter(priority="URGENT").count(),
-            "HIGH": tasks.filter(priority="HIGH").count(),
-            "MEDIUM": tasks.filter(priority="MEDIUM").count(),
-            "LOW": tasks.filter(priority="LOW").count(),
-        }
-
-        # 난이도 분포
-        difficulty_distribution = {
-            "VERY_HARD": tasks.filter(difficulty="VERY_HARD").count(),
-            "HARD": tasks.filter(difficulty="HARD").count(),
-            "MEDIUM": tasks.filter(difficulty="MEDIUM").count(),
-            "EASY": tasks.filter(difficulty="EASY").count(),
-        }
-
-        # 평균 작업 완료 시간 (완료된 작업만)
-        completed_tasks = tasks.filter(
-            status="DONE", completed_at__isnull=False
-        )
-        avg_completion_time = 0
-        if completed_tasks.exists():
-            total_hours = sum(
-                (task.completed_at - task.start_date).total_seconds() / 3600
-                for task in completed_tasks
-                if task.completed_at and task.start_date
-            )
-            avg_completion_time = total_hours / completed_tasks.count()
-
-        # 지연된 작업 비율
-        total_tasks = tasks.count()
-        delayed_tasks = len([task for task in tasks if task.is_delayed])
-        delay_rate = (
-            (delayed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        )
-
-        # 월별 통계
-        monthly_stats = {}
-        for task in tasks:
-            month_key = task.start_date.strftime("%Y-%m")
-            if month_key not in monthly_stats:
-                monthly_stats[month_key] = {
-                    "total": 0,
-                    "completed": 0,
-                    "delayed": 0,
-                    "avg_completion_time": 0,
-                }
-
-            monthly_stats[month_key]["total"] += 1
-            if task.status == "DONE":
-                monthly_stats[month_key]["completed"] += 1
-            if task.is_delayed:
-                monthly_stats[month_key]["delayed"] += 1
-
-        # 평균 점수 계산 (평가가 있는 완료된 작업만)
-        completed_tasks_with_eval = tasks.filter(
-            status="DONE", evaluations__isnull=False
-        )
-        avg_score = 0
-        if completed_tasks_with_eval.exists():
-            total_score = sum(
-                task.evaluations.first().performance_score
-                for task in completed_tasks_with_eval
-                if task.evaluations.exists()
+        if not self.can_view_statistics(user):
+            return Response(
+                {"detail": "접근 권한이 없습니다."},
+                status=status.HTTP_403_FORBIDDEN,
             )
-            avg_score = total_score / completed_tasks_with_eval.count()
-
         return Response(
-            {
-                "priority_distribution": priority_distribution,
-                "difficulty_distribution": difficulty_distribution,
-                "avg_completion_time": round(avg_completion_time, 2),
-                "delay_rate": round(delay_rate, 2),
-                "monthly_stats": monthly_stats,
-                "total_tasks": total_tasks,
-                "completed_tasks": completed_tasks.count(),
-                "delayed_tasks": delayed_tasks,
-                "avg_score": round(avg_score, 2),
-            }
+            build_task_statistics_detail(self.get_statistics_tasks(user))
         )
 
     def create(self, request, *args, **kwargs):
@@ -380,22 +316,44 @@ class UserViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # 사번 자동 생성 로직
-        last_employee = User.objects.order_by("-employee_id").first()
-        if last_employee and last_employee.employee_id.startswith("E"):
-            last_number = int(last_employee.employee_id[1:])
-            new_employee_id = f"E{str(last_number + 1).zfill(4)}"
-        else:
-            new_employee_id = "E0001"
-
-        # 사번 추가
-        request.data["employee_id"] = new_employee_id
-
+        # 검증과 비밀번호 해싱은 사번 카운터 잠금 전에 처리
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        password = hash_passwords(
+            [serializer.validated_data.pop("password", None)]
+        )[0]
+
+        # 사번은 저장 직전에 발급 (저장에 실패하면 발급한 번호도 롤백)
+        with transaction.atomic():
+            serializer.save(
+                employee_id=allocate_employee_ids()[0], password=password
+            )
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"])
+    def bulk_onboard(self, request):
+        """
+        직원 일괄 등록
+        - users: 직원 정보 목록 (최대 500명, password는 선택)
+        사번은 한 번에 연속 발급하고 bulk_create로 한 번에 저장
+        """
+        if not (
+            request.user.role == "ADMIN"
+            or request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]
+        ):
+            return Response(
+                {"detail": "직원을 등록할 권한이 없습니다."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = BulkOnboardingSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        users = bulk_onboard(serializer.validated_data["users"])
+        return Response(
+            UserSerializer(users, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
     def update(self, request, *args, **kwargs):
         """직원 정보 수정"""
         if not (
@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third party apps
     "rest_framework",
     "rest_framework_simplejwt",
@@ -154,6 +155,29 @@ DATABASES = {
 }
 
 
+# Cache
+# 웹 워커와 보고서 워커가 같은 캐시를 공유해야 버전 키 무효화와
+# 워커가 저장한 보고서 결과가 모든 프로세스에 반영되므로 Redis 사용
+# 운영 환경에서는 웹/워커 서비스 모두 REDIS_URL을 설정해야 함
+# (설정하지 않으면 로컬 개발/테스트용 프로세스별 메모리 캐시 사용)
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -42,7 +42,7 @@ from tasks.views import (
 )
 from notifications.views import NotificationViewSet
 from accounts.auth_views import logout
-from reports.views import ReportViewSet
+from reports.views import ReportJobViewSet, ReportViewSet
 from activities.views import ActivityViewSet
 from experiments.views import LLMAnalysisViewSet
 
@@ -57,6 +57,7 @@ router.register(r"task-time-logs", TaskTimeLogViewSet)
 router.register(r"task-evaluations", TaskEvaluationViewSet)
 router.register(r"notifications", NotificationViewSet, basename="notification")
 router.register(r"reports", ReportViewSet, basename="report")
+router.register(r"report-jobs", ReportJobViewSet, basename="report-job")
 router.register(r"activities", ActivityViewSet, basename="activity")
 router.register(r"experiments/llm", LLMAnalysisViewSet, basename="llm")
 
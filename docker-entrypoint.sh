@@ -0,0 +1,20 @@
+#!/bin/sh
+# 컨테이너 실행 역할 선택
+#   web    : API 서버 (gunicorn, 기본값)
+#   worker : 보고서 작업 워커 (manage.py run_report_jobs)
+# 그 밖의 인자는 그대로 실행 (예: python manage.py migrate)
+set -e
+
+case "$1" in
+    web)
+        exec gunicorn config.wsgi:application \
+            --bind 0.0.0.0:8080 --workers 2 --timeout 120
+        ;;
+    worker)
+        shift
+        exec python manage.py run_report_jobs "$@"
+        ;;
+    *)
+        exec "$@"
+        ;;
+esac
@@ -6,4 +6,4 @@ class OrganizationsConfig(AppConfig):
     name = "organizations"
 
     def ready(self):
-        pass
+        from . import signals  # noqa: F401
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['-parent', 'name'], name='organizations_dept_order_idx'),
+        ),
+    ]
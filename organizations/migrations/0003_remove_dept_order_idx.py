@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-18 06:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0002_directory_ordering'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='department',
+            name='organizations_dept_order_idx',
+        ),
+    ]
@@ -0,0 +1,90 @@
+from django.core.cache import cache
+from django.db.models import Q
+from .models import Department
+
+# 본부 단위 조회 권한을 가진 직급
+HEADQUARTERS_RANKS = ["DIRECTOR", "GENERAL_MANAGER"]
+
+SCOPE_CACHE_TIMEOUT = 60 * 10
+SCOPE_VERSION_KEY = "department_scope:version"
+
+
+def get_scope_version():
+    """부서 범위 캐시 버전 (부서 변경 시 증가)"""
+    version = cache.get(SCOPE_VERSION_KEY)
+    if version is None:
+        cache.add(SCOPE_VERSION_KEY, 1, None)
+        version = cache.get(SCOPE_VERSION_KEY, 1)
+    return version
+
+
+def invalidate_department_scopes():
+    """모든 부서 범위 캐시 무효화"""
+    cache.add(SCOPE_VERSION_KEY, 1, None)
+    try:
+        cache.incr(SCOPE_VERSION_KEY)
+    except ValueError:
+        cache.set(SCOPE_VERSION_KEY, 1, None)
+
+
+def get_department_subtree_ids(department_id):
+    """
+    부서 ID와 하위 부서 ID 목록 반환
+    - 본부: 본부 + 산하 팀
+    - 팀: 해당 팀만
+    - 존재하지 않는 부서: 빈 목록
+    """
+    # 버전과 캐시된 값을 한 번에 조회 (공유 캐시 왕복 1회)
+    cache_key = f"department_scope:{department_id}"
+    cached = cache.get_many([SCOPE_VERSION_KEY, cache_key])
+    version = cached.get(SCOPE_VERSION_KEY) or get_scope_version()
+    entry = cached.get(cache_key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    rows = list(
+        Department.objects.filter(
+            Q(id=department_id) | Q(parent_id=department_id)
+        ).values_list("id", "parent_id")
+    )
+    own = [row for row in rows if row[0] == department_id]
+    if not own:
+        dept_ids = []
+    elif own[0][1] is None:  # 본부인 경우
+        dept_ids = [department_id] + [
+            dept_id for dept_id, _ in rows if dept_id != department_id
+        ]
+    else:  # 팀인 경우
+        dept_ids = [department_id]
+
+    cache.set(cache_key, (version, dept_ids), SCOPE_CACHE_TIMEOUT)
+    return dept_ids
+
+
+def get_visible_department_ids(user):
+    """
+    사용자가 조회 가능한 부서 ID 목록 반환
+    - None: 모든 부서 조회 가능 (ADMIN)
+    - []: 부서 단위 조회 불가 (자신의 작업만 조회)
+    역할/직급/부서는 요청마다 사용자 객체에서 읽으므로 변경 즉시 반영되고,
+    부서 구조는 캐시되어 부서 변경 시 무효화됨
+    """
+    scope_key = (user.role, user.rank, user.department_id)
+    cached = getattr(user, "_department_scope", None)
+    if cached is not None and cached[0] == scope_key:
+        return cached[1]
+
+    if user.role == "ADMIN":
+        dept_ids = None
+    elif not user.department_id:
+        dept_ids = []
+    elif user.rank in HEADQUARTERS_RANKS:
+        dept_ids = get_department_subtree_ids(user.department_id)
+    elif user.role == "MANAGER":
+        dept_ids = [user.department_id]
+    else:
+        dept_ids = []
+
+    # 요청 내 재사용을 위해 사용자 객체에 저장
+    user._department_scope = (scope_key, dept_ids)
+    return dept_ids
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Department
+from .scope import invalidate_department_scopes
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def department_changed(sender, **kwargs):
+    """부서 생성/수정/삭제 시 부서 범위 캐시 무효화"""
+    invalidate_department_scopes()
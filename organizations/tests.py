@@ -1,9 +1,13 @@
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
+from django.core.cache import cache
 from .models import Department
+from .scope import get_visible_department_ids
 
 User = get_user_model()
 
@@ -46,3 +50,55 @@ class DepartmentAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["name"], "테스트부서")
+
+
+class DepartmentScopeTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.headquarters = Department.objects.create(
+            name="본부", code="HQ001"
+        )
+        self.team = Department.objects.create(
+            name="팀", code="TEAM001", parent=self.headquarters
+        )
+        self.director = User.objects.create_user(
+            username="director",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.headquarters,
+            role="MANAGER",
+            rank="GENERAL_MANAGER",
+        )
+
+    def test_visible_department_ids_cached(self):
+        self.assertEqual(
+            sorted(get_visible_department_ids(self.director)),
+            [self.headquarters.id, self.team.id],
+        )
+
+        # 부서 테이블은 다시 조회하지 않고 공유 캐시 왕복 1회로 처리
+        director = User.objects.get(id=self.director.id)
+        with CaptureQueriesContext(connection) as context:
+            get_visible_department_ids(director)
+        queries = [query["sql"] for query in context.captured_queries]
+        self.assertLessEqual(len(queries), 1)
+        self.assertFalse(
+            any(Department._meta.db_table in sql for sql in queries)
+        )
+
+    def test_department_change_invalidates_scope(self):
+        get_visible_department_ids(self.director)
+        new_team = Department.objects.create(
+            name="신규팀", code="TEAM002", parent=self.headquarters
+        )
+
+        director = User.objects.get(id=self.director.id)
+        self.assertIn(new_team.id, get_visible_department_ids(director))
+
+    def test_rank_change_applies_immediately(self):
+        get_visible_department_ids(self.director)
+        self.director.rank = "STAFF"
+        self.director.role = "EMPLOYEE"
+        self.director.save()
+
+        self.assertEqual(get_visible_department_ids(self.director), [])
@@ -0,0 +1,101 @@
+import threading
+import uuid
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from organizations.scope import get_department_subtree_ids
+
+User = get_user_model()
+
+REPORT_CACHE_TIMEOUT = 60 * 10
+
+# 적중/실패 횟수 (프로세스별)
+# 조회 경로에서 캐시에 쓰지 않도록 프로세스 메모리에만 집계
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_user_version_key(user_id):
+    return f"report_cache:user:{user_id}:version"
+
+
+def get_department_version_key(department_id):
+    return f"report_cache:department:{department_id}:version"
+
+
+def bump_versions(keys):
+    """버전 키들을 새 값으로 교체 (set_many 한 번)"""
+    if keys:
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+
+def get_report_cache_key(viewer, report_user, start_date, end_date):
+    """
+    보고서 캐시 키
+    - 조회자 범위(역할/직급/부서)가 같으면 결과가 같으므로 공유
+    - 보고 대상 사용자와 소속 부서의 버전이 바뀌면 새 키가 됨
+    """
+    version_keys = [
+        get_user_version_key(report_user.id),
+        get_department_version_key(report_user.department_id),
+    ]
+    versions = cache.get_many(version_keys)
+    user_version, department_version = (
+        versions.get(key, 1) for key in version_keys
+    )
+    scope = f"{viewer.role}:{viewer.rank}:{viewer.department_id}"
+    return (
+        f"report_cache:{scope}:{report_user.id}:{user_version}:"
+        f"{department_version}:{start_date}:{end_date}"
+    )
+
+
+def get_cached_report(cache_key):
+    """캐시된 보고서 조회 (적중/실패 횟수 기록)"""
+    report = cache.get(cache_key)
+    with _stats_lock:
+        _stats["misses" if report is None else "hits"] += 1
+    return report
+
+
+def set_cached_report(cache_key, report):
+    cache.set(cache_key, report, REPORT_CACHE_TIMEOUT)
+
+
+def get_report_cache_stats():
+    """현재 프로세스의 보고서 캐시 적중/실패 횟수"""
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total * 100, 1) if total > 0 else 0,
+    }
+
+
+def invalidate_user_reports(user_ids):
+    """
+    사용자의 보고서 캐시 무효화
+    비교 통계는 같은 본부 소속 작업을 사용하므로
+    본부와 산하 팀의 보고서 캐시도 함께 무효화
+    """
+    user_ids = [user_id for user_id in set(user_ids) if user_id]
+    if not user_ids:
+        return
+
+    version_keys = set()
+    rows = User.objects.filter(id__in=user_ids).values_list(
+        "id", "department_id", "department__parent_id"
+    )
+    for user_id, department_id, parent_id in rows:
+        version_keys.add(get_user_version_key(user_id))
+        if department_id:
+            version_keys.update(
+                get_department_version_key(subtree_id)
+                for subtree_id in get_department_subtree_ids(
+                    parent_id or department_id
+                )
+            )
+
+    # 사용자/부서 버전을 한 번에 교체
+    bump_versions(version_keys)
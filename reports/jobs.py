@@ -0,0 +1,108 @@
+import json
+import threading
+import traceback
+from contextlib import contextmanager
+from datetime import timedelta
+from django.db import (
+    DatabaseError,
+    close_old_connections,
+    connections,
+    transaction,
+)
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+from .cache import get_report_cache_key, set_cached_report
+from .models import ReportJob
+from .stats import build_personal_report
+
+# 실행 중인 작업은 HEARTBEAT_INTERVAL마다 heartbeat_at을 갱신
+# 갱신이 HEARTBEAT_TIMEOUT 동안 없으면 워커가 종료된 것으로 보고 다시 대기시킴
+# (실행 시간이 긴 작업도 워커가 살아 있으면 다시 실행되지 않음)
+HEARTBEAT_INTERVAL = timedelta(seconds=30)
+HEARTBEAT_TIMEOUT = timedelta(minutes=2)
+
+
+def claim_next_job():
+    """
+    대기 중인 작업 하나를 실행 중으로 변경해 반환 (없으면 None)
+    여러 워커가 동시에 실행되어도 같은 작업을 가져가지 않도록 잠긴 행은 건너뜀
+    """
+    with transaction.atomic():
+        job = (
+            ReportJob.objects.select_for_update(skip_locked=True)
+            .filter(status="PENDING")
+            .order_by("created_at", "id")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = "RUNNING"
+        job.started_at = job.heartbeat_at = timezone.now()
+        job.save(update_fields=["status", "started_at", "heartbeat_at"])
+    return job
+
+
+def requeue_stale_jobs():
+    """heartbeat가 끊긴 실행 중 작업을 다시 대기시킴"""
+    return ReportJob.objects.filter(
+        status="RUNNING", heartbeat_at__lt=timezone.now() - HEARTBEAT_TIMEOUT
+    ).update(status="PENDING", started_at=None, heartbeat_at=None)
+
+
+@contextmanager
+def job_heartbeat(job, interval=HEARTBEAT_INTERVAL):
+    """
+    블록이 실행되는 동안 별도 스레드에서 작업의 heartbeat_at을 주기적으로 갱신
+    스레드는 자체 DB 연결을 사용하고 종료할 때 닫음
+    """
+    stopped = threading.Event()
+
+    def beat():
+        try:
+            while not stopped.wait(interval.total_seconds()):
+                close_old_connections()
+                try:
+                    ReportJob.objects.filter(
+                        id=job.id, status="RUNNING"
+                    ).update(heartbeat_at=timezone.now())
+                except DatabaseError:
+                    # 연결이 끊겨도 다음 주기에 다시 연결해 갱신
+                    continue
+        finally:
+            connections.close_all()
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def run_report_job(job):
+    """보고서를 계산해 결과를 저장하고 동기 조회용 캐시에도 저장"""
+    viewer = job.requested_by
+    start_date = job.start_date.isoformat()
+    end_date = job.end_date.isoformat()
+    try:
+        with job_heartbeat(job):
+            report = build_personal_report(
+                viewer, job.report_user, start_date, end_date
+            )
+    except Exception:
+        job.status = "FAILED"
+        job.error = traceback.format_exc()
+    else:
+        # API 응답과 같은 형식으로 저장 (기간 값 등은 JSON 변환)
+        job.result = json.loads(json.dumps(report, cls=JSONEncoder))
+        job.status = "DONE"
+        set_cached_report(
+            get_report_cache_key(
+                viewer, job.report_user, start_date, end_date
+            ),
+            job.result,
+        )
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "result", "error", "finished_at"])
+    return job
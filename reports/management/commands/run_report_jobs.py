@@ -0,0 +1,50 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+from reports.jobs import claim_next_job, requeue_stale_jobs, run_report_job
+
+
+class Command(BaseCommand):
+    help = "대기 중인 보고서 작업 실행 (백그라운드 워커)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기 중인 작업을 모두 처리한 뒤 종료",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="대기 작업이 없을 때 다시 확인하기까지의 시간(초)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            # 끊겼거나 오래된 DB 연결은 매 작업 전에 정리하고 다시 연결
+            close_old_connections()
+            try:
+                requeue_stale_jobs()
+                job = claim_next_job()
+                if job is not None:
+                    job = run_report_job(job)
+            except DatabaseError as error:
+                # DB 오류로 워커가 종료되지 않도록 잠시 후 다시 시도
+                # (결과를 저장하지 못한 작업은 heartbeat가 끊겨 다시 대기됨)
+                self.stderr.write(f"Report worker database error: {error}")
+                time.sleep(options["interval"])
+                continue
+
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+                continue
+
+            if job.status == "DONE":
+                self.stdout.write(
+                    self.style.SUCCESS(f"Report job {job.id} completed")
+                )
+            else:
+                self.stderr.write(f"Report job {job.id} failed")
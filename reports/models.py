@@ -9,3 +9,52 @@ class ReportTemplate(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE
     )
     created_at = models.DateTimeField(auto_now_add=True)
+
+
+class ReportJob(models.Model):
+    """
+    비동기 보고서 작업
+    기간이 긴 보고서는 요청 처리 워커 대신 백그라운드 워커
+    (manage.py run_report_jobs)에서 계산하고 결과를 저장함
+    """
+
+    STATUS_CHOICES = [
+        ("PENDING", "대기"),
+        ("RUNNING", "실행중"),
+        ("DONE", "완료"),
+        ("FAILED", "실패"),
+    ]
+
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="report_jobs",
+        verbose_name="요청자",
+    )
+    report_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="보고 대상",
+    )
+    start_date = models.DateField(verbose_name="시작일")
+    end_date = models.DateField(verbose_name="종료일")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="PENDING",
+        verbose_name="상태",
+    )
+    result = models.JSONField(null=True, blank=True, verbose_name="결과")
+    error = models.TextField(blank=True, verbose_name="오류 내용")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # 실행 중인 워커가 주기적으로 갱신 (갱신이 끊긴 작업만 다시 대기시킴)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "보고서 작업"
+        verbose_name_plural = "보고서 작업들"
+        # 워커의 대기 작업 조회용 인덱스
+        indexes = [models.Index(fields=["status", "created_at"])]
@@ -0,0 +1,121 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Avg, F, FloatField, Q, Value, Window
+from django.db.models.functions import Coalesce, Rank
+from organizations.scope import HEADQUARTERS_RANKS, get_department_subtree_ids
+
+User = get_user_model()
+
+# 순위 기준 (팀 / 본부)
+RANKING_SCOPES = ["team", "headquarters"]
+
+
+def get_partition_members(user, scope):
+    """사용자가 속한 순위 구간(팀 또는 본부)의 구성원"""
+    members = User.objects.filter(is_active=True)
+    if not user.department_id:
+        return members.none()
+    if scope == "team":
+        return members.filter(department_id=user.department_id)
+
+    headquarters_id = user.department.parent_id or user.department_id
+    return members.filter(
+        department_id__in=get_department_subtree_ids(headquarters_id)
+    )
+
+
+def get_visible_members(viewer):
+    """
+    조회자가 순위를 볼 수 있는 구성원 (팀장 이상만 사용)
+    - ADMIN: 전체
+    - 본부장/이사: 소속 본부 전체
+    - 팀장: 자신의 팀 (부서 보고서와 같은 범위)
+    팀장 미만은 자신의 순위만 조회 가능 (get_user_rank 사용)
+    """
+    if viewer.role == "ADMIN":
+        return User.objects.filter(is_active=True)
+    if viewer.rank in HEADQUARTERS_RANKS:
+        return get_partition_members(viewer, "headquarters")
+    return get_partition_members(viewer, "team")
+
+
+def build_visible_rankings(viewer, scope="team"):
+    """
+    조회자가 볼 수 있는 구성원의 순위
+    팀장의 본부 순위도 본부 전체 기준으로 계산하되 자신의 팀원 행만 반환
+    """
+    if viewer.role == "ADMIN" or viewer.rank in HEADQUARTERS_RANKS:
+        return build_rankings(get_visible_members(viewer), scope)
+    rows = build_rankings(get_partition_members(viewer, scope), scope)
+    return [
+        row for row in rows if row["department_id"] == viewer.department_id
+    ]
+
+
+def build_rankings(members, scope="team"):
+    """
+    평가 점수 순위 (쿼리 1회)
+    완료된 작업의 평균 평가 점수를 구한 뒤
+    RANK() OVER (PARTITION BY 팀/본부 ORDER BY 평균 점수 DESC)로 순위 계산
+    평가가 없으면 0점으로 봄
+    """
+    if scope == "team":
+        partition = F("department_id")
+    else:
+        # 본부 소속은 본부, 팀 소속은 상위 본부 기준
+        partition = Coalesce("department__parent_id", "department_id")
+
+    rows = (
+        members.filter(department__isnull=False)
+        .annotate(
+            partition_id=partition,
+            average_score=Coalesce(
+                Avg(
+                    "assigned_tasks__evaluations__performance_score",
+                    filter=Q(assigned_tasks__status="DONE"),
+                ),
+                Value(0.0),
+                output_field=FloatField(),
+            ),
+        )
+        .annotate(
+            score_rank=Window(
+                Rank(),
+                partition_by=F("partition_id"),
+                order_by=F("average_score").desc(),
+            )
+        )
+        .order_by("partition_id", "score_rank", "id")
+        .values(
+            "id",
+            "first_name",
+            "last_name",
+            "department_id",
+            "partition_id",
+            "average_score",
+            "score_rank",
+        )
+    )
+    return [
+        {
+            "user_id": row["id"],
+            "name": f"{row['last_name']}{row['first_name']}",
+            "department_id": row["department_id"],
+            "partition_id": row["partition_id"],
+            "average_score": round(row["average_score"], 1),
+            "rank": row["score_rank"],
+        }
+        for row in rows
+    ]
+
+
+def get_user_rank(user, scope="team", members=None):
+    """
+    사용자 한 명의 순위 (해당 사용자가 속한 팀/본부 구간 전체 기준)
+    members로 조회 가능한 대상을 제한할 수 있음 (대상이 아니면 None)
+    """
+    if members is not None and not members.filter(id=user.id).exists():
+        return None
+    for row in build_rankings(get_partition_members(user, scope), scope):
+        if row["user_id"] == user.id:
+            return row
+    return None
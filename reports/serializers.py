@@ -0,0 +1,55 @@
+from rest_framework import serializers
+from .models import ReportJob
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    employee_id = serializers.IntegerField(write_only=True, required=False)
+    report_user_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            "id",
+            "employee_id",
+            "report_user",
+            "report_user_name",
+            "start_date",
+            "end_date",
+            "status",
+            "result",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = [
+            "id",
+            "report_user",
+            "status",
+            "result",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+
+    def get_report_user_name(self, obj):
+        return f"{obj.report_user.last_name}{obj.report_user.first_name}"
+
+    def validate(self, data):
+        if data["start_date"] > data["end_date"]:
+            raise serializers.ValidationError(
+                "start_date는 end_date보다 이후일 수 없습니다."
+            )
+        return data
+
+
+class ReportJobListSerializer(ReportJobSerializer):
+    """작업 목록용 (결과 본문은 상세 조회에서만 반환)"""
+
+    class Meta(ReportJobSerializer.Meta):
+        fields = [
+            field
+            for field in ReportJobSerializer.Meta.fields
+            if field != "result"
+        ]
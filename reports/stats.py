@@ -0,0 +1,504 @@
+import copy
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from django.db.models import (
+    Avg,
+    Count,
+    DurationField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+)
+from django.contrib.auth import get_user_model
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from organizations.scope import get_department_subtree_ids
+from tasks.models import (
+    DISTRIBUTION_ORDER,
+    Task,
+    TaskEvaluation,
+    TaskHistory,
+    TaskTimeLog,
+    get_delayed_q,
+)
+
+User = get_user_model()
+
+EMPTY_PERSONAL_STATS = {
+    "basic_stats": {
+        "total_tasks": 0,
+        "completed_tasks": 0,
+        "in_progress_tasks": 0,
+        "delayed_tasks": 0,
+    },
+    "time_stats": {
+        "average_completion_time": None,
+        "estimated_vs_actual": 0,
+        "daily_work_hours": [],
+    },
+    "quality_stats": {
+        "average_score": 0,
+        "review_rejection_rate": 0,
+        "rework_rate": 0,
+    },
+    "distribution_stats": {
+        "priority_distribution": [],
+        "difficulty_distribution": [],
+        "status_distribution": [],
+    },
+}
+
+
+def get_report_queryset(viewer):
+    """조회자 권한에 따른 보고서 대상 작업"""
+    queryset = Task.objects.all()
+
+    # ADMIN과 DIRECTOR/GENERAL_MANAGER는 모든 보고서 접근 가능
+    if viewer.role == "ADMIN" or viewer.rank in [
+        "DIRECTOR",
+        "GENERAL_MANAGER",
+    ]:
+        return queryset
+
+    # MANAGER는 팀 보고서만 접근 가능
+    if viewer.role == "MANAGER":
+        return queryset.filter(department=viewer.department)
+
+    # EMPLOYEE는 자신의 보고서만 접근 가능
+    return queryset.filter(assignee=viewer)
+
+
+def build_personal_report(viewer, report_user, start_date, end_date):
+    """
+    개인 보고서 전체 계산 (통계 + 비교 분석)
+    요청 처리와 보고서 작업(ReportJob) 실행에서 함께 사용
+    """
+    tasks = get_report_queryset(viewer).filter(
+        assignee=report_user, created_at__range=[start_date, end_date]
+    )
+    report = build_personal_stats(tasks)
+
+    # 선택된 기간에 작업이 없는 경우 comparison_stats도 null로 반환
+    if not report["basic_stats"]["total_tasks"]:
+        report["comparison_stats"] = None
+        return report
+
+    # 비교 분석 (팀장 이상만)
+    comparison_stats = {}
+    if can_view_team_stats(viewer):
+        comparison_stats = build_comparison_stats(
+            report_user, start_date, end_date
+        )
+    report["comparison_stats"] = comparison_stats
+    return report
+
+
+def build_department_report(viewer, department_id, start_date, end_date):
+    """
+    부서(본부는 산하 팀 포함) 구성원 전체의 개인 보고서 통계
+    구성원 수와 관계없이 담당자별 그룹 집계로 한 번에 계산
+    """
+    members = (
+        User.objects.filter(
+            is_active=True,
+            department_id__in=get_department_subtree_ids(department_id),
+        )
+        .order_by("department_id", "id")
+        .values("id", "first_name", "last_name", "department_id")
+    )
+    members = list(members)
+    tasks = get_report_queryset(viewer).filter(
+        assignee_id__in=[member["id"] for member in members],
+        created_at__range=[start_date, end_date],
+    )
+    member_stats = build_member_stats(tasks)
+
+    return {
+        "department_id": department_id,
+        "members": [
+            {
+                "user_id": member["id"],
+                "name": f"{member['last_name']}{member['first_name']}",
+                "department_id": member["department_id"],
+                **member_stats.get(
+                    member["id"], copy.deepcopy(EMPTY_PERSONAL_STATS)
+                ),
+            }
+            for member in members
+        ],
+    }
+
+
+def percentage(count, total):
+    return (count / total * 100) if total > 0 else 0
+
+
+def annotate_quality_flags(tasks):
+    """품질 지표 계산용 EXISTS 플래그 (평가/반려/재작업 여부)"""
+    return tasks.order_by().annotate(
+        has_evaluation=Exists(
+            TaskEvaluation.objects.filter(task=OuterRef("pk"))
+        ),
+        has_rejection=Exists(
+            TaskEvaluation.objects.filter(
+                task=OuterRef("pk"), performance_score__lt=3
+            )
+        ),
+        # DONE에서 다른 상태로 되돌아간 이력이 있으면 재작업
+        has_rework=Exists(
+            TaskHistory.objects.filter(
+                task=OuterRef("pk"),
+                previous_status="DONE",
+                new_status__in=["IN_PROGRESS", "REVIEW"],
+            )
+        ),
+    )
+
+
+def get_summary_aggregates():
+    """기본/시간/품질 지표 조건부 집계 (annotate_quality_flags 이후 사용)"""
+    done = Q(status="DONE")
+    return {
+        "total": Count("id"),
+        "completed": Count("id", filter=done),
+        "in_progress": Count("id", filter=Q(status="IN_PROGRESS")),
+        "delayed": Count("id", filter=get_delayed_q()),
+        "average_completion_time": Avg(
+            F("completed_at") - F("start_date"),
+            filter=done & Q(completed_at__isnull=False),
+        ),
+        "estimated_total": Sum(
+            "estimated_hours", filter=done & Q(estimated_hours__gt=0)
+        ),
+        "actual_total": Sum(
+            "actual_hours", filter=done & Q(estimated_hours__gt=0)
+        ),
+        "evaluated": Count("id", filter=Q(has_evaluation=True)),
+        "rejected": Count("id", filter=Q(has_rejection=True)),
+        "reworked": Count("id", filter=done & Q(has_rework=True)),
+    }
+
+
+def format_personal_stats(summary, average_score, counts, daily):
+    """집계 결과를 개인 보고서 통계 형식으로 변환"""
+    total = summary["total"]
+    if not total:
+        return copy.deepcopy(EMPTY_PERSONAL_STATS)
+
+    return {
+        "basic_stats": {
+            "total_tasks": total,
+            "completed_tasks": summary["completed"],
+            "in_progress_tasks": summary["in_progress"],
+            "delayed_tasks": summary["delayed"],
+        },
+        "time_stats": {
+            "average_completion_time": summary["average_completion_time"],
+            "estimated_vs_actual": percentage(
+                summary["actual_total"] or 0, summary["estimated_total"] or 0
+            ),
+            "daily_work_hours": format_daily_hours(daily),
+        },
+        "quality_stats": {
+            "average_score": average_score or 0,
+            "review_rejection_rate": percentage(
+                summary["rejected"], summary["evaluated"]
+            ),
+            "rework_rate": percentage(
+                summary["reworked"], summary["completed"]
+            ),
+        },
+        "distribution_stats": format_distributions(counts, total),
+    }
+
+
+def build_personal_stats(tasks):
+    """
+    개인 보고서 통계 계산
+    작업 수와 관계없이 고정된 쿼리 수로 계산
+    - 기본/시간/품질 지표: 조건부 집계 + EXISTS 서브쿼리 1회
+    - 평가 점수 평균: 1회
+    - 작업 분포: 그룹 집계 1회
+    - 일별 작업 시간: 2회 (하루 안에 끝난 기록 / 자정을 넘긴 기록)
+    작업이 없으면 집계 1회 후 빈 통계 반환
+    """
+    summary = annotate_quality_flags(tasks).aggregate(
+        **get_summary_aggregates()
+    )
+    if not summary["total"]:
+        return copy.deepcopy(EMPTY_PERSONAL_STATS)
+
+    average_score = TaskEvaluation.objects.filter(
+        task__in=tasks.order_by().values("id"), task__status="DONE"
+    ).aggregate(avg_score=Avg("performance_score"))["avg_score"]
+
+    return format_personal_stats(
+        summary,
+        average_score,
+        count_distributions(tasks)[None],
+        collect_daily_seconds(tasks)[None],
+    )
+
+
+def build_member_stats(tasks):
+    """
+    담당자별 개인 보고서 통계 (담당자 수와 관계없이 고정된 쿼리 수)
+    build_personal_stats와 같은 집계를 담당자별 그룹 집계로 한 번에 계산
+    반환값: {담당자 ID: 개인 보고서 통계} (작업이 있는 담당자만 포함)
+    """
+    summaries = (
+        annotate_quality_flags(tasks)
+        .values("assignee_id")
+        .annotate(**get_summary_aggregates())
+    )
+    summaries = {row["assignee_id"]: row for row in summaries}
+    if not summaries:
+        return {}
+
+    average_scores = dict(
+        TaskEvaluation.objects.filter(
+            task__in=tasks.order_by().values("id"), task__status="DONE"
+        )
+        .order_by()
+        .values("task__assignee_id")
+        .annotate(avg_score=Avg("performance_score"))
+        .values_list("task__assignee_id", "avg_score")
+    )
+    counts = count_distributions(tasks, "assignee_id")
+    daily = collect_daily_seconds(tasks, "task__assignee_id")
+
+    return {
+        assignee_id: format_personal_stats(
+            summary,
+            average_scores.get(assignee_id),
+            counts[assignee_id],
+            daily[assignee_id],
+        )
+        for assignee_id, summary in summaries.items()
+    }
+
+
+def count_distributions(tasks, group_field=None):
+    """
+    우선순위/난이도/상태별 작업 수 (그룹 집계 1회)
+    반환값: {그룹: {필드: {값: 작업 수}}} (group_field가 없으면 그룹은 None)
+    """
+    group_fields = [group_field] if group_field else []
+    counts = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+    rows = (
+        tasks.order_by()
+        .values(*group_fields, *DISTRIBUTION_ORDER)
+        .annotate(count=Count("id"))
+    )
+    for row in rows:
+        group = row[group_field] if group_field else None
+        for field in DISTRIBUTION_ORDER:
+            counts[group][field][row[field]] += row["count"]
+    return counts
+
+
+def format_distributions(counts, total):
+    """분포별 작업 수를 비율과 함께 정렬된 목록으로 변환"""
+    distribution_stats = {}
+    for field, order in DISTRIBUTION_ORDER.items():
+        result = [
+            {
+                "field": value,
+                "count": count,
+                "percentage": round(percentage(count, total), 1),
+            }
+            for value, count in counts[field].items()
+        ]
+        result.sort(
+            key=lambda x: (
+                order.index(x["field"]) if x["field"] in order else len(order)
+            )
+        )
+        distribution_stats[f"{field}_distribution"] = result
+    return distribution_stats
+
+
+def collect_daily_seconds(tasks, group_field=None):
+    """
+    일별 작업 시간(초) 합산 (종료된 작업 시간 기록 기준)
+    - 하루 안에 끝난 기록은 시작 날짜별로 DB에서 합산
+    - 자정을 넘긴 기록은 날짜별로 나누어 합산
+    반환값: {그룹: {날짜: 초}} (group_field가 없으면 그룹은 None)
+    """
+    group_fields = [group_field] if group_field else []
+    logs = (
+        TaskTimeLog.objects.filter(
+            task__in=tasks.order_by().values("id"),
+            end_time__gt=F("start_time"),
+        )
+        .annotate(
+            start_day=TruncDate("start_time"), end_day=TruncDate("end_time")
+        )
+        .order_by()
+    )
+
+    daily = defaultdict(lambda: defaultdict(float))
+    same_day = (
+        logs.filter(start_day=F("end_day"))
+        .values(*group_fields, "start_day")
+        .annotate(
+            total=Sum(
+                ExpressionWrapper(
+                    F("end_time") - F("start_time"),
+                    output_field=DurationField(),
+                )
+            )
+        )
+    )
+    for row in same_day:
+        group = row[group_field] if group_field else None
+        daily[group][row["start_day"]] += row["total"].total_seconds()
+
+    cross_day = logs.exclude(start_day=F("end_day")).values_list(
+        group_field or "task_id", "start_time", "end_time"
+    )
+    for group, start_time, end_time in cross_day:
+        group = group if group_field else None
+        current = timezone.localtime(start_time)
+        end_time = timezone.localtime(end_time)
+        while current < end_time:
+            next_day = timezone.make_aware(
+                datetime.combine(current.date() + timedelta(days=1), time.min)
+            )
+            daily[group][current.date()] += (
+                min(next_day, end_time) - current
+            ).total_seconds()
+            current = next_day
+    return daily
+
+
+def format_daily_hours(daily):
+    """날짜별 초를 하루당 한 항목의 시간 목록으로 변환"""
+    return [
+        {"date": day.isoformat(), "hours": round(seconds / 3600, 1)}
+        for day, seconds in sorted(daily.items())
+    ]
+
+
+def format_duration(duration):
+    """소요 시간을 "Xh Ym" 형식으로 변환"""
+    if not duration:
+        return "0h 0m"
+    seconds = duration.total_seconds()
+    return f"{int(seconds // 3600)}h {int((seconds % 3600) // 60)}m"
+
+
+def calculate_relative_efficiency(my_time, comparison_time):
+    """
+    상대적 효율성 = (비교군 평균 완료 시간 / 내 평균 완료 시간) * 100
+    즉, 내가 더 빨리 완료할수록 효율성이 높음
+    """
+    if not my_time or not comparison_time:
+        return 0
+    return comparison_time.total_seconds() / my_time.total_seconds() * 100
+
+
+def build_comparison_stats(user, start_date, end_date):
+    """
+    팀/본부 비교 통계 (작업 테이블 조건부 집계 1회)
+    - 나 / 팀(나 제외) / 본부(산하 팀 구성원) 그룹별로
+      평균 완료 시간과 평균 평가 점수를 함께 계산
+    - 평가 점수는 작업별 평가 합계/개수를 서브쿼리로 구해 합산하므로
+      평가 행 기준 평균과 같음
+    """
+    department_id = user.department_id
+    headquarters_id = None
+    if department_id:
+        # 팀인 경우 상위 부서(본부) 기준
+        headquarters_id = user.department.parent_id or department_id
+
+    me = Q(assignee_id=user.id)
+    groups = {
+        "me": me,
+        "team": Q(assignee__department_id=department_id) & ~me,
+        "headquarters": Q(assignee__department__parent_id=headquarters_id),
+    }
+    if not department_id:
+        groups["team"] = groups["headquarters"] = Q(pk__in=[])
+
+    evaluations = (
+        TaskEvaluation.objects.filter(task=OuterRef("pk"))
+        .order_by()
+        .values("task")
+    )
+    done = Q(status="DONE")
+    completed = done & Q(completed_at__isnull=False)
+    aggregates = {}
+    for name, group in groups.items():
+        aggregates[f"{name}_time"] = Avg(
+            F("completed_at") - F("start_date"), filter=group & completed
+        )
+        # 본부 평가 점수는 완료 시각 기록 여부와 관계없이 완료된 작업 기준
+        score_filter = group & (done if name == "headquarters" else completed)
+        aggregates[f"{name}_score_sum"] = Sum(
+            "evaluation_sum", filter=score_filter
+        )
+        aggregates[f"{name}_score_count"] = Sum(
+            "evaluation_count", filter=score_filter
+        )
+
+    result = (
+        Task.objects.filter(
+            groups["me"] | groups["team"] | groups["headquarters"],
+            created_at__range=[start_date, end_date],
+        )
+        .annotate(
+            evaluation_sum=Subquery(
+                evaluations.annotate(total=Sum("performance_score")).values(
+                    "total"
+                )
+            ),
+            evaluation_count=Subquery(
+                evaluations.annotate(total=Count("id")).values("total")
+            ),
+        )
+        .aggregate(**aggregates)
+    )
+
+    def average_score(name):
+        count = result[f"{name}_score_count"]
+        return result[f"{name}_score_sum"] / count if count else 0
+
+    my_time = result["me_time"]
+    return {
+        "team_comparison": {
+            "team_avg_completion_time": format_duration(result["team_time"]),
+            "team_avg_score": round(average_score("team"), 1),
+            "my_completion_time": format_duration(my_time),
+            "my_score": round(average_score("me"), 1),
+            "relative_efficiency": round(
+                calculate_relative_efficiency(my_time, result["team_time"]), 1
+            ),
+        },
+        "department_comparison": {
+            "dept_avg_completion_time": format_duration(
+                result["headquarters_time"]
+            ),
+            "dept_avg_score": round(average_score("headquarters"), 1),
+            "my_completion_time": format_duration(my_time),
+            "my_score": round(average_score("me"), 1),
+            "relative_efficiency": round(
+                calculate_relative_efficiency(
+                    my_time, result["headquarters_time"]
+                ),
+                1,
+            ),
+        },
+    }
+
+
+def can_view_team_stats(user):
+    return (
+        user.role == "ADMIN"
+        or user.role == "MANAGER"
+        or user.rank in ["DIRECTOR", "GENERAL_MANAGER"]
+    )
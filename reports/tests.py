@@ -1,9 +1,21 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
-from .models import ReportTemplate
+from organizations.models import Department
+from tasks.models import Task, TaskEvaluation, TaskHistory, TaskTimeLog
+from .cache import get_report_cache_stats
+from .jobs import HEARTBEAT_TIMEOUT, claim_next_job, requeue_stale_jobs
+from .models import ReportJob, ReportTemplate
 
 User = get_user_model()
 
@@ -50,3 +62,644 @@ class ReportTemplateAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["name"], "테스트 템플릿")
+
+
+class PersonalReportAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+            role="EMPLOYEE",
+            rank="STAFF",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("report-personal-report")
+        self.params = {"start_date": "2000-01-01", "end_date": "2100-01-01"}
+
+    def create_task(self, status="TODO", **kwargs):
+        return Task.objects.create(
+            title="테스트 작업",
+            description="테스트 설명",
+            status=status,
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+            **kwargs,
+        )
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, self.params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(context.captured_queries)
+
+    def test_personal_report(self):
+        done = self.create_task(
+            status="DONE",
+            completed_at="2024-03-21T00:00:00Z",
+            estimated_hours=4,
+            actual_hours=2,
+        )
+        self.create_task(priority="HIGH")
+        TaskEvaluation.objects.create(
+            task=done,
+            evaluator=self.user,
+            difficulty="MEDIUM",
+            performance_score=2,
+            feedback="피드백",
+        )
+        TaskHistory.objects.create(
+            task=done,
+            changed_by=self.user,
+            previous_status="DONE",
+            new_status="IN_PROGRESS",
+        )
+
+        response, _ = self.count_queries()
+
+        self.assertEqual(
+            response.data["basic_stats"],
+            {
+                "total_tasks": 2,
+                "completed_tasks": 1,
+                "in_progress_tasks": 0,
+                "delayed_tasks": 1,
+            },
+        )
+        self.assertEqual(
+            response.data["time_stats"]["estimated_vs_actual"], 50
+        )
+        self.assertEqual(
+            response.data["quality_stats"],
+            {
+                "average_score": 2,
+                "review_rejection_rate": 100,
+                "rework_rate": 100,
+            },
+        )
+        self.assertEqual(
+            [
+                (item["field"], item["count"])
+                for item in response.data["distribution_stats"][
+                    "priority_distribution"
+                ]
+            ],
+            [("HIGH", 1), ("MEDIUM", 1)],
+        )
+
+    def test_personal_report_daily_hours(self):
+        task = self.create_task()
+        for start_time, end_time in [
+            ("2024-03-20T09:00:00Z", "2024-03-20T12:00:00Z"),
+            ("2024-03-20T13:00:00Z", "2024-03-20T15:00:00Z"),
+            # 자정을 넘긴 기록은 날짜별로 나눔
+            ("2024-03-20T22:00:00Z", "2024-03-21T01:30:00Z"),
+        ]:
+            TaskTimeLog.objects.create(
+                task=task,
+                start_time=start_time,
+                end_time=end_time,
+                logged_by=self.user,
+            )
+
+        response, _ = self.count_queries()
+
+        self.assertEqual(
+            response.data["time_stats"]["daily_work_hours"],
+            [
+                {"date": "2024-03-20", "hours": 7.0},
+                {"date": "2024-03-21", "hours": 1.5},
+            ],
+        )
+
+    def test_personal_report_query_count(self):
+        # 작업 수가 늘어나도 쿼리 수는 동일
+        self.create_task()
+        _, single = self.count_queries()
+
+        for _ in range(5):
+            task = self.create_task(status="DONE")
+            TaskEvaluation.objects.create(
+                task=task,
+                evaluator=self.user,
+                difficulty="MEDIUM",
+                performance_score=4,
+                feedback="피드백",
+            )
+        _, many = self.count_queries()
+
+        self.assertEqual(single, many)
+        self.assertLessEqual(many, 5)
+
+    def test_personal_report_cache(self):
+        before = get_report_cache_stats()
+        task = self.create_task(status="DONE")
+        response, _ = self.count_queries()
+        self.assertEqual(response.data["quality_stats"]["average_score"], 0)
+
+        # 같은 조회는 캐시 사용
+        _, queries = self.count_queries()
+        self.assertEqual(queries, 0)
+
+        # 평가가 추가되면 다시 계산
+        TaskEvaluation.objects.create(
+            task=task,
+            evaluator=self.user,
+            difficulty="MEDIUM",
+            performance_score=4,
+            feedback="피드백",
+        )
+        response, _ = self.count_queries()
+        self.assertEqual(response.data["quality_stats"]["average_score"], 4)
+
+        self.user.role = "ADMIN"
+        self.user.save()
+        response = self.client.get(reverse("report-cache-stats"))
+        self.assertEqual(response.data["hits"] - before["hits"], 1)
+        self.assertEqual(response.data["misses"] - before["misses"], 2)
+
+    def test_personal_report_comparison(self):
+        headquarters = Department.objects.create(name="본부", code="HQ001")
+        self.department.parent = headquarters
+        self.department.save()
+        sibling = Department.objects.create(
+            name="다른팀", code="TEST002", parent=headquarters
+        )
+        self.user.role = "MANAGER"
+        self.user.save()
+        peer = User.objects.create_user(
+            username="peer",
+            password="testpass123",
+            employee_id="EMP002",
+            department=self.department,
+        )
+        other = User.objects.create_user(
+            username="other",
+            password="testpass123",
+            employee_id="EMP003",
+            department=sibling,
+        )
+        for assignee, hours, scores in [
+            (self.user, 2, [4]),
+            (peer, 4, [2, 4]),
+            (other, 6, [5]),
+        ]:
+            task = self.create_task(
+                status="DONE", completed_at=f"2024-03-20T0{hours}:00:00Z"
+            )
+            task.assignee = assignee
+            task.save()
+            for score in scores:
+                TaskEvaluation.objects.create(
+                    task=task,
+                    evaluator=self.user,
+                    difficulty="MEDIUM",
+                    performance_score=score,
+                    feedback="피드백",
+                )
+
+        response, _ = self.count_queries()
+
+        comparison = response.data["comparison_stats"]
+        self.assertEqual(
+            comparison["team_comparison"],
+            {
+                "team_avg_completion_time": "4h 0m",
+                "team_avg_score": 3.0,
+                "my_completion_time": "2h 0m",
+                "my_score": 4.0,
+                "relative_efficiency": 200.0,
+            },
+        )
+        self.assertEqual(
+            comparison["department_comparison"],
+            {
+                "dept_avg_completion_time": "4h 0m",
+                "dept_avg_score": 3.8,
+                "my_completion_time": "2h 0m",
+                "my_score": 4.0,
+                "relative_efficiency": 200.0,
+            },
+        )
+
+class DepartmentReportAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.members = [
+            User.objects.create_user(
+                username=f"member{index}",
+                password="testpass123",
+                employee_id=f"EMP10{index}",
+                department=self.department,
+                role="EMPLOYEE",
+                rank="STAFF",
+            )
+            for index in range(2)
+        ]
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse("report-department-report")
+        self.params = {"start_date": "2000-01-01", "end_date": "2100-01-01"}
+
+    def create_task(self, assignee, status="TODO", score=None):
+        task = Task.objects.create(
+            title="테스트 작업",
+            description="테스트 설명",
+            status=status,
+            assignee=assignee,
+            reporter=self.manager,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        if score is not None:
+            TaskEvaluation.objects.create(
+                task=task,
+                evaluator=self.manager,
+                difficulty="MEDIUM",
+                performance_score=score,
+                feedback="피드백",
+            )
+        TaskTimeLog.objects.create(
+            task=task,
+            start_time="2024-03-20T09:00:00Z",
+            end_time="2024-03-20T11:00:00Z",
+            logged_by=assignee,
+        )
+        return task
+
+    def get_report(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, self.params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(context.captured_queries)
+
+    def test_department_report(self):
+        first, second = self.members
+        self.create_task(first, status="DONE", score=4)
+        self.create_task(first)
+        self.create_task(second, status="DONE", score=2)
+
+        response, _ = self.get_report()
+        reports = {row["user_id"]: row for row in response.data["members"]}
+
+        self.assertEqual(len(reports), 3)
+        self.assertEqual(
+            reports[self.manager.id]["basic_stats"]["total_tasks"], 0
+        )
+        self.assertEqual(reports[first.id]["basic_stats"]["total_tasks"], 2)
+        self.assertEqual(
+            reports[first.id]["quality_stats"]["average_score"], 4
+        )
+        self.assertEqual(
+            reports[first.id]["time_stats"]["daily_work_hours"],
+            [{"date": "2024-03-20", "hours": 4.0}],
+        )
+        self.assertEqual(
+            reports[second.id]["quality_stats"]["review_rejection_rate"], 100
+        )
+
+        # 개인 보고서와 같은 통계
+        self.client.force_authenticate(user=first)
+        personal = self.client.get(
+            reverse("report-personal-report"), self.params
+        )
+        del personal.data["comparison_stats"]
+        report = dict(reports[first.id])
+        for key in ["user_id", "name", "department_id"]:
+            del report[key]
+        self.assertEqual(report, personal.data)
+
+    def test_department_report_query_count(self):
+        # 구성원 수가 늘어나도 쿼리 수는 동일
+        self.create_task(self.members[0], status="DONE", score=4)
+        _, few = self.get_report()
+
+        for index in range(3):
+            member = User.objects.create_user(
+                username=f"extra{index}",
+                password="testpass123",
+                employee_id=f"EMP20{index}",
+                department=self.department,
+            )
+            self.create_task(member, status="DONE", score=3)
+        _, many = self.get_report()
+
+        self.assertEqual(few, many)
+
+    def test_department_report_permission(self):
+        other = Department.objects.create(name="다른부서", code="TEST002")
+        response = self.client.get(
+            self.url, {**self.params, "department": other.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.members[0])
+        response = self.client.get(self.url, self.params)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ReportJobAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+            role="EMPLOYEE",
+            rank="STAFF",
+        )
+        self.other = User.objects.create_user(
+            username="otheruser",
+            email="other@example.com",
+            password="testpass123",
+            employee_id="EMP002",
+            department=self.department,
+            role="EMPLOYEE",
+            rank="STAFF",
+        )
+        Task.objects.create(
+            title="테스트 작업",
+            description="테스트 설명",
+            status="DONE",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def run_worker(self, **kwargs):
+        # 테스트 트랜잭션의 연결을 닫지 않도록 연결 정리는 건너뜀
+        with patch(
+            "reports.management.commands.run_report_jobs"
+            ".close_old_connections"
+        ):
+            call_command(
+                "run_report_jobs", "--once", stdout=StringIO(), **kwargs
+            )
+
+    def test_report_job(self):
+        params = {"start_date": "2000-01-01", "end_date": "2100-01-01"}
+        response = self.client.post(
+            reverse("report-job-list"), params, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["status"], "PENDING")
+        url = reverse("report-job-detail", args=[response.data["id"]])
+
+        self.run_worker()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["status"], "DONE")
+        self.assertEqual(
+            response.data["result"],
+            self.client.get(reverse("report-personal-report"), params).data,
+        )
+
+    def test_report_job_list(self):
+        for _ in range(12):
+            ReportJob.objects.create(
+                requested_by=self.user,
+                report_user=self.user,
+                start_date="2024-01-01",
+                end_date="2024-12-31",
+                status="DONE",
+                result={"basic_stats": {"total_tasks": 1}},
+            )
+
+        response = self.client.get(reverse("report-job-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(len(response.data["results"]), 10)
+        # 결과 본문은 상세 조회에서만 반환
+        job = response.data["results"][0]
+        self.assertNotIn("result", job)
+        response = self.client.get(
+            reverse("report-job-detail", args=[job["id"]])
+        )
+        self.assertEqual(
+            response.data["result"], {"basic_stats": {"total_tasks": 1}}
+        )
+
+    def test_report_job_permission(self):
+        response = self.client.post(
+            reverse("report-job-list"),
+            {
+                "start_date": "2024-01-01",
+                "end_date": "2024-12-31",
+                "employee_id": self.other.id,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(ReportJob.objects.exists())
+
+    def test_requeue_only_jobs_without_heartbeat(self):
+        now = timezone.now()
+        running, abandoned = [
+            ReportJob.objects.create(
+                requested_by=self.user,
+                report_user=self.user,
+                start_date="2024-01-01",
+                end_date="2024-12-31",
+                status="RUNNING",
+                started_at=now - timedelta(hours=1),
+                heartbeat_at=heartbeat_at,
+            )
+            for heartbeat_at in [now, now - HEARTBEAT_TIMEOUT * 2]
+        ]
+
+        # 오래 실행 중이어도 heartbeat가 살아 있으면 다시 대기시키지 않음
+        self.assertEqual(requeue_stale_jobs(), 1)
+        running.refresh_from_db()
+        abandoned.refresh_from_db()
+        self.assertEqual(running.status, "RUNNING")
+        self.assertEqual(abandoned.status, "PENDING")
+
+        job = claim_next_job()
+        self.assertEqual(job.id, abandoned.id)
+        self.assertIsNotNone(job.heartbeat_at)
+
+    @patch("reports.management.commands.run_report_jobs.time.sleep")
+    def test_worker_survives_database_error(self, sleep):
+        stderr = StringIO()
+        with patch(
+            "reports.management.commands.run_report_jobs.claim_next_job",
+            side_effect=[OperationalError("connection closed"), None],
+        ):
+            self.run_worker(stderr=stderr)
+        self.assertIn("connection closed", stderr.getvalue())
+        sleep.assert_called_once()
+
+
+class RankingAPITest(APITestCase):
+    def setUp(self):
+        self.headquarters = Department.objects.create(
+            name="본부", code="HQ001"
+        )
+        self.team_a = Department.objects.create(
+            name="A팀", code="TEAM001", parent=self.headquarters
+        )
+        self.team_b = Department.objects.create(
+            name="B팀", code="TEAM002", parent=self.headquarters
+        )
+        self.admin = User.objects.create_user(
+            username="admin",
+            password="testpass123",
+            employee_id="EMP000",
+            department=self.headquarters,
+            role="ADMIN",
+            rank="DIRECTOR",
+        )
+        self.members = {}
+        for index, (name, team, score) in enumerate(
+            [
+                ("a1", self.team_a, 3),
+                ("a2", self.team_a, 5),
+                ("b1", self.team_b, 4),
+                ("b2", self.team_b, None),
+            ],
+            start=1,
+        ):
+            member = User.objects.create_user(
+                username=name,
+                password="testpass123",
+                employee_id=f"EMP00{index}",
+                department=team,
+                role="EMPLOYEE",
+                rank="STAFF",
+            )
+            self.members[name] = member
+            if score is None:
+                continue
+            task = Task.objects.create(
+                title="테스트 작업",
+                description="테스트 설명",
+                status="DONE",
+                assignee=member,
+                reporter=member,
+                department=team,
+                start_date="2024-03-20T00:00:00Z",
+                due_date="2024-03-21T00:00:00Z",
+            )
+            TaskEvaluation.objects.create(
+                task=task,
+                evaluator=self.admin,
+                difficulty="MEDIUM",
+                performance_score=score,
+                feedback="피드백",
+            )
+        self.url = reverse("report-rankings")
+
+    def get_ranks(self, scope):
+        self.client.force_authenticate(user=self.admin)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"scope": scope})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {
+            row["user_id"]: row["rank"] for row in response.data["rankings"]
+        }
+
+    def test_team_rankings(self):
+        ranks = self.get_ranks("team")
+        self.assertEqual(ranks[self.members["a2"].id], 1)
+        self.assertEqual(ranks[self.members["a1"].id], 2)
+        self.assertEqual(ranks[self.members["b1"].id], 1)
+        self.assertEqual(ranks[self.members["b2"].id], 2)
+
+    def test_headquarters_rankings(self):
+        ranks = self.get_ranks("headquarters")
+        self.assertEqual(
+            [
+                ranks[self.members[name].id]
+                for name in ["a2", "b1", "a1", "b2"]
+            ],
+            [1, 2, 3, 4],
+        )
+
+    def test_single_user_rank(self):
+        self.client.force_authenticate(user=self.members["a1"])
+
+        response = self.client.get(
+            self.url, {"user_id": self.members["a1"].id}
+        )
+        self.assertEqual(response.data["rank"], 2)
+
+        # 다른 구성원의 순위는 조회 불가
+        for name in ["a2", "b1"]:
+            response = self.client.get(
+                self.url, {"user_id": self.members[name].id}
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_403_FORBIDDEN
+            )
+
+    def test_employee_sees_only_own_rank(self):
+        self.client.force_authenticate(user=self.members["a1"])
+
+        for scope, rank in [("team", 2), ("headquarters", 3)]:
+            response = self.client.get(self.url, {"scope": scope})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                [
+                    (row["user_id"], row["rank"])
+                    for row in response.data["rankings"]
+                ],
+                [(self.members["a1"].id, rank)],
+            )
+
+    def test_manager_sees_only_own_team_ranks(self):
+        manager = self.members["a1"]
+        manager.role = "MANAGER"
+        manager.save()
+        self.client.force_authenticate(user=manager)
+
+        # 본부 순위도 자신의 팀원 행만 반환 (순위는 본부 전체 기준)
+        response = self.client.get(self.url, {"scope": "headquarters"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                (row["user_id"], row["rank"])
+                for row in response.data["rankings"]
+            ],
+            [(self.members["a2"].id, 1), (self.members["a1"].id, 3)],
+        )
+
+        response = self.client.get(
+            self.url,
+            {"scope": "headquarters", "user_id": self.members["a2"].id},
+        )
+        self.assertEqual(response.data["rank"], 1)
+
+        # 다른 팀 구성원의 순위는 조회 불가
+        response = self.client.get(
+            self.url, {"user_id": self.members["b1"].id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1,35 +1,71 @@
-from rest_framework import viewsets, status
+from rest_framework import mixins, viewsets, status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from django.db.models import Count, Avg, Q, F, Sum
-from datetime import datetime, timedelta
-from tasks.models import Task, TaskEvaluation
-from django.db.models.functions import TruncDate
+from tasks.models import TaskEvaluation
 from django.contrib.auth import get_user_model
-from django.utils import timezone
-from collections import defaultdict
+from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
+from .cache import (
+    get_cached_report,
+    get_report_cache_key,
+    get_report_cache_stats,
+    set_cached_report,
+)
+from tasks.export import EVALUATION_EXPORT_COLUMNS, export_rows, stream_csv
+from .models import ReportJob
+from .rankings import (
+    RANKING_SCOPES,
+    build_visible_rankings,
+    get_user_rank,
+    get_visible_members,
+)
+from .serializers import ReportJobListSerializer, ReportJobSerializer
+from organizations.models import Department
+from organizations.scope import get_visible_department_ids
+from .stats import (
+    build_department_report,
+    build_personal_report,
+    can_view_team_stats,
+    get_report_queryset,
+)
 
 User = get_user_model()
 
 
-class ReportViewSet(viewsets.ViewSet):
-    def get_queryset(self):
-        user = self.request.user
-        queryset = Task.objects.all()
+class StandardResultsSetPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
 
-        # ADMIN과 DIRECTOR/GENERAL_MANAGER는 모든 보고서 접근 가능
-        if user.role == "ADMIN" or user.rank in [
-            "DIRECTOR",
-            "GENERAL_MANAGER",
-        ]:
-            return queryset
 
-        # MANAGER는 팀 보고서만 접근 가능
-        if user.role == "MANAGER":
-            return queryset.filter(department=user.department)
+def get_report_user(viewer, employee_id):
+    """
+    보고 대상 사용자 조회 (권한이 없으면 None)
+    - ADMIN과 DIRECTOR/GENERAL_MANAGER는 모든 보고서 접근 가능
+    - MANAGER는 자신의 팀원 보고서만 접근 가능
+    """
+    if not employee_id or str(employee_id) == str(viewer.id):
+        return viewer
+
+    target_user = get_object_or_404(User, id=employee_id)
+    if viewer.role == "ADMIN" or viewer.rank in [
+        "DIRECTOR",
+        "GENERAL_MANAGER",
+    ]:
+        return target_user
+    if (
+        viewer.role == "MANAGER"
+        and target_user.department_id == viewer.department_id
+    ):
+        return target_user
+    return None
+
 
-        # EMPLOYEE는 자신의 보고서만 접근 가능
-        return queryset.filter(assignee=user)
+class ReportViewSet(viewsets.ViewSet):
+    def get_queryset(self):
+        return get_report_queryset(self.request.user)
 
     @action(detail=False, methods=["get"])
     def personal_report(self, request):
@@ -45,125 +81,92 @@ class ReportViewSet(viewsets.ViewSet):
             )
 
         # 다른 직원의 보고서를 조회하려는 경우 권한 체크
-        if employee_id and employee_id != str(user.id):
-            target_user = User.objects.get(id=employee_id)
-
-            # ADMIN과 DIRECTOR/GENERAL_MANAGER는 모든 보고서 접근 가능
-            if user.role == "ADMIN" or user.rank in [
-                "DIRECTOR",
-                "GENERAL_MANAGER",
-            ]:
-                report_user = target_user
-            # MANAGER는 자신의 팀원 보고서만 접근 가능
-            elif (
-                user.role == "MANAGER"
-                and target_user.department == user.department
-            ):
-                report_user = target_user
-            else:
-                return Response({"error": "권한이 없습니다."}, status=403)
-        else:
-            report_user = user
+        report_user = get_report_user(user, employee_id)
+        if report_user is None:
+            return Response({"error": "권한이 없습니다."}, status=403)
 
-        # 보고서 데이터 조회 로직
-        tasks = self.get_queryset().filter(
-            assignee=report_user, created_at__range=[start_date, end_date]
+        # 같은 조회 범위/대상/기간의 보고서는 캐시된 결과 사용
+        cache_key = get_report_cache_key(
+            user, report_user, start_date, end_date
         )
+        cached = get_cached_report(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        report = build_personal_report(user, report_user, start_date, end_date)
+        set_cached_report(cache_key, report)
+        return Response(report)
 
-        # 선택된 기간에 작업이 없는 경우
-        if not tasks.exists():
+    @action(detail=False, methods=["get"])
+    def department_report(self, request):
+        """
+        부서 구성원 전체의 개인 보고서 통계
+        - department: 부서 ID (기본값: 자신의 부서, 본부는 산하 팀 포함)
+        - ADMIN은 모든 부서, 본부장/이사는 소속 본부, 팀장은 자신의 팀만 조회
+        """
+        user = request.user
+        start_date = request.query_params.get("start_date")
+        end_date = request.query_params.get("end_date")
+        if not start_date or not end_date:
             return Response(
-                {
-                    "basic_stats": {
-                        "total_tasks": 0,
-                        "completed_tasks": 0,
-                        "in_progress_tasks": 0,
-                        "delayed_tasks": 0,
-                    },
-                    "time_stats": {
-                        "average_completion_time": None,
-                        "estimated_vs_actual": 0,
-                        "daily_work_hours": [],
-                    },
-                    "quality_stats": {
-                        "average_score": 0,
-                        "review_rejection_rate": 0,
-                        "rework_rate": 0,
-                    },
-                    "distribution_stats": {
-                        "priority_distribution": [],
-                        "difficulty_distribution": [],
-                        "status_distribution": [],
-                    },
-                    # 작업이 없는 경우 comparison_stats도 null로 반환
-                    "comparison_stats": None,
-                }
+                {"error": "start_date와 end_date는 필수 파라미터입니다."},
+                status=400,
             )
 
-        # 기본 통계
-        basic_stats = {
-            "total_tasks": tasks.count(),
-            "completed_tasks": tasks.filter(status="DONE").count(),
-            "in_progress_tasks": tasks.filter(status="IN_PROGRESS").count(),
-            "delayed_tasks": len([task for task in tasks if task.is_delayed]),
-        }
-
-        # 시간 관리 통계
-        time_stats = {
-            "average_completion_time": tasks.filter(
-                status="DONE", completed_at__isnull=False
-            ).aggregate(avg_time=Avg(F("completed_at") - F("start_date")))[
-                "avg_time"
-            ],
-            "estimated_vs_actual": self.calculate_time_efficiency(tasks),
-            "daily_work_hours": self.calculate_daily_hours(tasks),
-        }
-
-        # 품질 지표
-        quality_stats = {
-            "average_score": TaskEvaluation.objects.filter(
-                task__in=tasks, task__status="DONE"
-            ).aggregate(avg_score=Avg("performance_score"))["avg_score"]
-            or 0,
-            "review_rejection_rate": self.calculate_rejection_rate(tasks),
-            "rework_rate": self.calculate_rework_rate(tasks),
-        }
-
-        # 작업 분포
-        distribution_stats = {
-            "priority_distribution": self.calculate_distribution(
-                tasks, "priority"
-            ),
-            "difficulty_distribution": self.calculate_distribution(
-                tasks, "difficulty"
-            ),
-            "status_distribution": self.calculate_distribution(
-                tasks, "status"
-            ),
-        }
-
-        # 비교 분석 (팀장 이상만)
-        comparison_stats = {}
-        if self.can_view_team_stats(user):
-            comparison_stats = {
-                "team_comparison": self.get_team_comparison(
-                    report_user, start_date, end_date
-                ),
-                "department_comparison": self.get_department_comparison(
-                    report_user, start_date, end_date
-                ),
-            }
+        try:
+            department = get_object_or_404(
+                Department,
+                id=request.query_params.get("department")
+                or user.department_id,
+            )
+        except ValueError:
+            return Response(
+                {"error": "department는 부서 ID여야 합니다."}, status=400
+            )
+        visible_ids = get_visible_department_ids(user)
+        if visible_ids is not None and department.id not in visible_ids:
+            return Response({"error": "권한이 없습니다."}, status=403)
 
         return Response(
-            {
-                "basic_stats": basic_stats,
-                "time_stats": time_stats,
-                "quality_stats": quality_stats,
-                "distribution_stats": distribution_stats,
-                "comparison_stats": comparison_stats,
-            }
+            build_department_report(user, department.id, start_date, end_date)
+        )
+
+    @action(detail=False, methods=["get"])
+    def export_evaluations(self, request):
+        """
+        기간 내 작업 평가 CSV 내보내기 (조회 권한 범위의 작업 대상)
+        서버 측 커서로 스트리밍하므로 행 수와 관계없이 메모리 사용량이 일정함
+        """
+        try:
+            start_date = parse_date(request.query_params.get("start_date", ""))
+            end_date = parse_date(request.query_params.get("end_date", ""))
+        except ValueError:
+            start_date = end_date = None
+        if not start_date or not end_date:
+            return Response(
+                {"error": "start_date와 end_date(YYYY-MM-DD)는 필수입니다."},
+                status=400,
+            )
+
+        evaluations = TaskEvaluation.objects.filter(
+            task__in=self.get_queryset().order_by().values("id"),
+            created_at__date__range=[start_date, end_date],
+        ).order_by("created_at", "id")
+        return stream_csv(
+            f"evaluations_{start_date}_{end_date}.csv",
+            export_rows(evaluations, EVALUATION_EXPORT_COLUMNS),
         )
 
+    @action(detail=False, methods=["get"])
+    def cache_stats(self, request):
+        """보고서 캐시 적중/실패 횟수 (관리자 전용)"""
+        if request.user.role != "ADMIN":
+            return Response(
+                {"error": "권한이 없습니다."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        return Response(get_report_cache_stats())
+
     def can_view_employee_report(self, user, target_user):
         """직원 보고서 조회 권한 확인"""
         if user.is_superuser:
@@ -196,420 +199,94 @@ class ReportViewSet(viewsets.ViewSet):
 
         return False
 
-    def calculate_time_efficiency(self, tasks):
-        """작업 시간 효율성 계산"""
-        completed_tasks = tasks.filter(status="DONE", estimated_hours__gt=0)
-        if not completed_tasks.exists():
-            return 0
-
-        total_estimated = (
-            completed_tasks.aggregate(Sum("estimated_hours"))[
-                "estimated_hours__sum"
-            ]
-            or 0
-        )
-        total_actual = (
-            completed_tasks.aggregate(Sum("actual_hours"))["actual_hours__sum"]
-            or 0
-        )
-
-        if total_estimated == 0:
-            return 0
-
-        return (total_actual / total_estimated) * 100
-
-    def calculate_daily_hours(self, tasks):
-        """일별 작업 시간 계산"""
-        daily_hours = []
-        tasks_with_logs = tasks.filter(time_logs__isnull=False).distinct()
-
-        for task in tasks_with_logs:
-            logs = task.time_logs.all()
-            for log in logs:
-                date = log.start_time.date()
-                hours = 0
-                if log.end_time:
-                    duration = log.end_time - log.start_time
-                    hours = duration.total_seconds() / 3600
-                    daily_hours.append(
-                        {"date": date.isoformat(), "hours": round(hours, 1)}
-                    )
-
-        return sorted(daily_hours, key=lambda x: x["date"])
-
-    def calculate_rejection_rate(self, tasks):
-        """검토 반려율 계산"""
-        evaluated_tasks = tasks.filter(evaluations__isnull=False).distinct()
-        if not evaluated_tasks.exists():
-            return 0
-
-        rejected_tasks = evaluated_tasks.filter(
-            evaluations__performance_score__lt=3
-        )
-        return (rejected_tasks.count() / evaluated_tasks.count()) * 100
-
-    def calculate_rework_rate(self, tasks):
-        """재작업률 계산"""
-        completed_tasks = tasks.filter(status="DONE")
-        if not completed_tasks.exists():
-            return 0
-
-        # 상태가 DONE에서 다른 상태로 변경된 이력이 있는 작업을 재작업으로 간주
-        rework_tasks = completed_tasks.filter(
-            history__previous_status="DONE",
-            history__new_status__in=["IN_PROGRESS", "REVIEW"],
-        ).distinct()
-
-        return (rework_tasks.count() / completed_tasks.count()) * 100
-
-    def calculate_distribution(self, tasks, field):
-        """작업 분포 계산"""
-        distribution = tasks.values(field).annotate(count=Count(field))
-        total = tasks.count()
-
-        # 필드별 정렬 순서 정의
-        field_order = {
-            "priority": ["URGENT", "HIGH", "MEDIUM", "LOW"],
-            "difficulty": ["VERY_HARD", "HARD", "MEDIUM", "EASY"],
-            "status": ["TODO", "IN_PROGRESS", "REVIEW", "DONE", "HOLD"],
-        }
-
-        # 비율 계산 및 필드명 매핑
-        result = []
-        for item in distribution:
-            field_value = item[field]
-            count = item["count"]
-            percentage = (count / total * 100) if total > 0 else 0
-            result.append(
+    @action(detail=False, methods=["get"])
+    def rankings(self, request):
+        """
+        평가 점수 순위
+        - scope: team(팀별 순위, 기본값) 또는 headquarters(본부별 순위)
+        - user_id: 지정하면 해당 사용자의 순위만 반환
+        """
+        scope = request.query_params.get("scope", "team")
+        if scope not in RANKING_SCOPES:
+            return Response(
                 {
-                    "field": field_value,
-                    "count": count,
-                    "percentage": round(percentage, 1),
-                }
+                    "error": (
+                        f"scope는 {', '.join(RANKING_SCOPES)} 중 하나입니다."
+                    )
+                },
+                status=400,
             )
 
-        # 정렬된 결과 반환
-        if field in field_order:
-            result.sort(
-                key=lambda x: (
-                    field_order[field].index(x["field"])
-                    if x["field"] in field_order[field]
-                    else len(field_order[field])
-                )
+        user_id = request.query_params.get("user_id")
+        # 팀장 미만은 다른 사람의 점수를 볼 수 없으므로 자신의 순위만 반환
+        if not can_view_team_stats(request.user):
+            if user_id and str(user_id) != str(request.user.id):
+                return Response({"error": "권한이 없습니다."}, status=403)
+            row = get_user_rank(request.user, scope)
+            if user_id:
+                return Response(row)
+            return Response(
+                {"scope": scope, "rankings": [row] if row else []}
             )
 
-        return result
-
-    def get_team_comparison(self, user, start_date, end_date):
-        """팀 비교 통계 계산"""
-        # 팀의 전체 작업 (나를 제외한)
-        team_tasks = Task.objects.filter(
-            assignee__department=user.department,
-            created_at__range=[start_date, end_date],
-        ).exclude(
-            assignee=user
-        )  # 내 작업 제외
-
-        # 내 작업 데이터
-        my_tasks = Task.objects.filter(
-            assignee=user,
-            created_at__range=[start_date, end_date],
-            status="DONE",
-            completed_at__isnull=False,
-        )
-
-        # 내 평균 완료 시간 계산
-        my_completion_time = None
-        if my_tasks.exists():
-            total_time = sum(
-                (task.completed_at - task.start_date).total_seconds()
-                for task in my_tasks
+        if user_id:
+            target_user = get_object_or_404(
+                User.objects.select_related("department"), id=user_id
             )
-            avg_time = total_time / my_tasks.count()
-            hours = int(avg_time // 3600)
-            minutes = int((avg_time % 3600) // 60)
-            my_completion_time = f"{hours}h {minutes}m"
-        else:
-            my_completion_time = "0h 0m"
-
-        # 팀 평균 완료 시간 계산 (나를 제외한)
-        team_completed_tasks = team_tasks.filter(
-            status="DONE", completed_at__isnull=False
-        )
-
-        if team_completed_tasks.exists():
-            team_total_time = sum(
-                (task.completed_at - task.start_date).total_seconds()
-                for task in team_completed_tasks
+            row = get_user_rank(
+                target_user,
+                scope,
+                members=get_visible_members(request.user),
             )
-            team_avg_time = team_total_time / team_completed_tasks.count()
-            hours = int(team_avg_time // 3600)
-            minutes = int((team_avg_time % 3600) // 60)
-            avg_completion_time_str = f"{hours}h {minutes}m"
-        else:
-            avg_completion_time_str = "0h 0m"
-
-        # 내 평가 점수 계산
-        my_evaluations = TaskEvaluation.objects.filter(
-            task__in=my_tasks, task__status="DONE"
-        )
-        my_score = (
-            my_evaluations.aggregate(avg_score=Avg("performance_score"))[
-                "avg_score"
-            ]
-            or 0
-        )
-
-        # 팀 평균 평가 점수 계산 (나를 제외한)
-        team_evaluations = TaskEvaluation.objects.filter(
-            task__in=team_completed_tasks
-        )
-        team_score = (
-            team_evaluations.aggregate(avg_score=Avg("performance_score"))[
-                "avg_score"
-            ]
-            or 0
-        )
-
-        # 상대적 효율성 계산
-        relative_efficiency = self.calculate_relative_efficiency(
-            my_tasks, team_tasks
-        )
-
-        return {
-            "team_avg_completion_time": avg_completion_time_str,
-            "team_avg_score": round(team_score, 1),
-            "my_completion_time": my_completion_time,
-            "my_score": round(my_score, 1),
-            "relative_efficiency": round(relative_efficiency, 1),
-        }
-
-    def get_department_comparison(self, user, start_date, end_date):
-        """부서 비교 통계 계산"""
-        dept = user.department
-        if dept.parent:  # 팀인 경우 상위 부서(본부) 기준
-            dept = dept.parent
-
-        dept_tasks = Task.objects.filter(
-            assignee__department__parent=dept,
-            created_at__range=[start_date, end_date],
-        )
-
-        # 내 작업 데이터
-        my_tasks = Task.objects.filter(
-            assignee=user,
-            created_at__range=[start_date, end_date],
-            status="DONE",
-            completed_at__isnull=False,
-        )
-
-        # 내 평균 완료 시간 계산
-        my_completion_time = None
-        if my_tasks.exists():
-            total_time = sum(
-                (task.completed_at - task.start_date).total_seconds()
-                for task in my_tasks
-            )
-            avg_time = total_time / my_tasks.count()
-            hours = int(avg_time // 3600)
-            minutes = int((avg_time % 3600) // 60)
-            my_completion_time = f"{hours}h {minutes}m"
-        else:
-            my_completion_time = "0h 0m"
-
-        # 부서 평균 완료 시간 계산
-        avg_completion_time = self.calculate_dept_average(dept_tasks)
-        if avg_completion_time:
-            hours = avg_completion_time.total_seconds() // 3600
-            minutes = (avg_completion_time.total_seconds() % 3600) // 60
-            avg_completion_time_str = f"{int(hours)}h {int(minutes)}m"
-        else:
-            avg_completion_time_str = "0h 0m"
-
-        # 내 평가 점수와 부서 평균 점수 계산
-        my_evaluations = TaskEvaluation.objects.filter(
-            task__in=my_tasks, task__status="DONE"
-        )
-        dept_evaluations = TaskEvaluation.objects.filter(
-            task__in=dept_tasks, task__status="DONE"
-        )
-
-        my_score = (
-            my_evaluations.aggregate(avg_score=Avg("performance_score"))[
-                "avg_score"
-            ]
-            or 0
-        )
-
-        dept_score = (
-            dept_evaluations.aggregate(avg_score=Avg("performance_score"))[
-                "avg_score"
-            ]
-            or 0
-        )
-
-        # 상대적 효율성 계산
-        relative_efficiency = self.calculate_relative_efficiency(
-            my_tasks, dept_tasks
-        )
-
-        return {
-            "dept_avg_completion_time": avg_completion_time_str,
-            "dept_avg_score": round(dept_score, 1),
-            "my_completion_time": my_completion_time,
-            "my_score": round(my_score, 1),
-            "relative_efficiency": round(relative_efficiency, 1),
-        }
-
-    def can_view_team_stats(self, user):
-        return (
-            user.role == "ADMIN"
-            or user.role == "MANAGER"
-            or user.rank in ["DIRECTOR", "GENERAL_MANAGER"]
-        )
-
-    def calculate_team_average(self, tasks):
-        completed_tasks = tasks.filter(
-            status="DONE", completed_at__isnull=False
-        )
-        if not completed_tasks.exists():
-            return None
-
-        return completed_tasks.aggregate(
-            avg_time=Avg(F("completed_at") - F("start_date"))
-        )["avg_time"]
-
-    def calculate_team_score(self, tasks):
-        evaluations = TaskEvaluation.objects.filter(task__in=tasks)
-        if not evaluations.exists():
-            return None
-
-        return evaluations.aggregate(avg_score=Avg("performance_score"))[
-            "avg_score"
-        ]
-
-    def calculate_dept_average(self, tasks):
-        completed_tasks = tasks.filter(
-            status="DONE", completed_at__isnull=False
-        )
-        if not completed_tasks.exists():
-            return None
-
-        return completed_tasks.aggregate(
-            avg_time=Avg(F("completed_at") - F("start_date"))
-        )["avg_time"]
-
-    def calculate_dept_score(self, tasks):
-        evaluations = TaskEvaluation.objects.filter(task__in=tasks)
-        if not evaluations.exists():
-            return None
-
-        return evaluations.aggregate(avg_score=Avg("performance_score"))[
-            "avg_score"
-        ]
-
-    def calculate_team_avg_score(self, team_tasks):
-        """팀 평균 평가 점수 계산"""
-        evaluations = TaskEvaluation.objects.filter(task__in=team_tasks)
-        return (
-            evaluations.aggregate(Avg("performance_score"))[
-                "performance_score__avg"
-            ]
-            or 0
-        )
+            if row is None:
+                return Response({"error": "권한이 없습니다."}, status=403)
+            return Response(row)
 
-    def calculate_dept_avg_score(self, dept_tasks):
-        """부서 평균 평가 점수 계산"""
-        evaluations = TaskEvaluation.objects.filter(task__in=dept_tasks)
-        return (
-            evaluations.aggregate(Avg("performance_score"))[
-                "performance_score__avg"
-            ]
-            or 0
+        return Response(
+            {
+                "scope": scope,
+                "rankings": build_visible_rankings(request.user, scope),
+            }
         )
 
-    def calculate_relative_efficiency(self, user_tasks, comparison_tasks):
-        """상대적 효율성 계산"""
-        # 완료된 작업만 대상으로
-        user_completed_tasks = user_tasks.filter(
-            status="DONE", completed_at__isnull=False, start_date__isnull=False
-        )
-        comparison_completed_tasks = comparison_tasks.filter(
-            status="DONE", completed_at__isnull=False, start_date__isnull=False
-        )
 
-        if (
-            not user_completed_tasks.exists()
-            or not comparison_completed_tasks.exists()
-        ):
-            return 0
+class ReportJobViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    비동기 보고서 작업
+    - POST: 보고서 작업 등록 (start_date, end_date, employee_id)
+    - GET: 작업 상태와 결과 조회 (완료될 때까지 폴링)
+    목록은 페이지 단위로 상태만 반환하고 결과는 상세 조회에서만 반환
+    """
 
-        # 평균 완료 시간 계산 (초 단위)
-        user_avg_time = (
-            sum(
-                (task.completed_at - task.start_date).total_seconds()
-                for task in user_completed_tasks
-            )
-            / user_completed_tasks.count()
-        )
+    serializer_class = ReportJobSerializer
+    pagination_class = StandardResultsSetPagination
 
-        comparison_avg_time = (
-            sum(
-                (task.completed_at - task.start_date).total_seconds()
-                for task in comparison_completed_tasks
-            )
-            / comparison_completed_tasks.count()
+    def get_queryset(self):
+        queryset = (
+            ReportJob.objects.filter(requested_by=self.request.user)
+            .select_related("report_user")
+            .order_by("-created_at", "-id")
         )
-
-        # 상대적 효율성 = (비교군 평균 시간 / 내 평균 시간) * 100
-        # 즉, 내가 더 빨리 완료할수록 효율성이 높음
-        if comparison_avg_time == 0:
-            return 0
-
-        return (comparison_avg_time / user_avg_time) * 100
-
-    def calculate_relative_quality(self, user_tasks, comparison_tasks):
-        """상대적 품질 점수 계산"""
-        user_score = self.calculate_team_avg_score(user_tasks)
-        comparison_score = self.calculate_team_avg_score(comparison_tasks)
-
-        if comparison_score == 0:
-            return 0
-
-        return (user_score / comparison_score) * 100
-
-    def calculate_rank_in_team(self, user):
-        """팀 내 순위 계산"""
-        team_members = User.objects.filter(department=user.department)
-        rankings = []
-
-        for member in team_members:
-            tasks = Task.objects.filter(assignee=member, status="DONE")
-            score = self.calculate_team_avg_score(tasks)
-            rankings.append((member, score))
-
-        rankings.sort(key=lambda x: x[1], reverse=True)
-        for rank, (member, _) in enumerate(rankings, 1):
-            if member == user:
-                return rank
-
-        return len(rankings)
-
-    def calculate_rank_in_department(self, user):
-        """부서 내 순위 계산"""
-        dept_members = User.objects.filter(
-            department__parent=user.department.parent
+        if self.action == "list":
+            # 결과 JSON은 크므로 목록에서는 읽지 않음
+            queryset = queryset.defer("result")
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return ReportJobListSerializer
+        return ReportJobSerializer
+
+    def perform_create(self, serializer):
+        employee_id = serializer.validated_data.pop("employee_id", None)
+        report_user = get_report_user(self.request.user, employee_id)
+        if report_user is None:
+            raise PermissionDenied("권한이 없습니다.")
+        serializer.save(
+            requested_by=self.request.user, report_user=report_user
         )
-        rankings = []
-
-        for member in dept_members:
-            tasks = Task.objects.filter(assignee=member, status="DONE")
-            score = self.calculate_dept_avg_score(tasks)
-            rankings.append((member, score))
-
-        rankings.sort(key=lambda x: x[1], reverse=True)
-        for rank, (member, _) in enumerate(rankings, 1):
-            if member == user:
-                return rank
-
-        return len(rankings)
@@ -0,0 +1,310 @@
+from datetime import datetime, time, timedelta
+from functools import reduce
+from operator import or_
+from django.db.models import (
+    BooleanField,
+    Count,
+    DateField,
+    ExpressionWrapper,
+    Q,
+    Sum,
+)
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from .models import Task, TaskDailyStat, get_delayed_q
+from .scope import get_scope_q
+from .serializers import TaskListSerializer
+
+# 조건부 집계로 계산하는 통계 섹션
+COUNT_SECTIONS = ["stats", "priority_stats", "workload_stats"]
+# 작업 목록을 반환하는 섹션
+LIST_SECTIONS = ["upcoming_deadlines", "today_tasks", "delayed_tasks"]
+DASHBOARD_SECTIONS = COUNT_SECTIONS + LIST_SECTIONS
+
+OPEN_STATUSES = ["TODO", "IN_PROGRESS", "REVIEW"]
+
+# 작업 부하 통계 집계 단위와 최대 조회 기간
+WORKLOAD_BUCKETS = ["day", "week", "month"]
+MAX_WORKLOAD_RANGE_DAYS = 366
+
+
+def calculate_trend(current, previous):
+    """증감률 계산"""
+    if previous == 0:
+        return 100 if current > 0 else 0
+    return round(((current - previous) / previous) * 100, 1)
+
+
+def build_dashboard(user, sections=None, now=None):
+    """
+    대시보드 데이터 계산
+    - 통계 섹션은 조건부 집계(Count(filter=...)) 한 번으로 계산
+    - 작업 목록 섹션은 한 번의 조회 후 섹션별로 분류
+    """
+    sections = sections or DASHBOARD_SECTIONS
+    now = now or timezone.now()
+
+    data = {}
+    count_sections = [s for s in COUNT_SECTIONS if s in sections]
+    if count_sections:
+        data.update(build_count_sections(user, count_sections, now))
+
+    list_sections = [s for s in LIST_SECTIONS if s in sections]
+    if list_sections:
+        data.update(build_list_sections(user, list_sections, now))
+
+    return data
+
+
+def build_count_sections(user, sections, now):
+    """
+    통계 섹션 계산
+    - 상태/우선순위별 작업 수는 일별 통계 롤업(TaskDailyStat)의 누적 합계
+    - 지연 작업 수는 작업 테이블 조건부 집계 (지연 조건은 get_delayed_q)
+    - 작업 부하는 build_workload_series의 최근 7일 구간
+    """
+    # 통계 위젯은 팀장도 자신의 작업 기준
+    scope = get_scope_q(user, include_managers=False)
+    today = now.date()
+    rollup_aggregates = {}
+    aggregates = {}
+
+    if "stats" in sections:
+        last_week = today - timedelta(days=7)
+        previous = Q(date__lte=last_week)
+        rollup_aggregates.update(
+            total=Sum("task_count"),
+            in_progress=Sum("task_count", filter=Q(status="IN_PROGRESS")),
+            completed=Sum("task_count", filter=Q(status="DONE")),
+            last_week_total=Sum("task_count", filter=previous),
+            last_week_in_progress=Sum(
+                "task_count", filter=previous & Q(status="IN_PROGRESS")
+            ),
+            last_week_completed=Sum(
+                "task_count", filter=previous & Q(status="DONE")
+            ),
+        )
+        aggregates.update(
+            delayed=Count("id", filter=get_delayed_q(now=now)),
+            last_week_delayed=Count(
+                "id", filter=get_delayed_q(now=now - timedelta(days=7))
+            ),
+        )
+
+    if "priority_stats" in sections:
+        rollup_aggregates["priority_total"] = Sum("task_count")
+        for priority, _ in Task.PRIORITY_CHOICES:
+            rollup_aggregates[f"priority_{priority}"] = Sum(
+                "task_count", filter=Q(priority=priority)
+            )
+
+    result = {}
+    if rollup_aggregates:
+        rollup = TaskDailyStat.objects.filter(scope).aggregate(
+            **rollup_aggregates
+        )
+        result.update({key: value or 0 for key, value in rollup.items()})
+    if aggregates:
+        result.update(Task.objects.filter(scope).aggregate(**aggregates))
+    data = {}
+
+    if "stats" in sections:
+        data["stats"] = {
+            key: {
+                "count": result[key],
+                "trend": calculate_trend(
+                    result[key], result[f"last_week_{key}"]
+                ),
+            }
+            for key in ["total", "in_progress", "completed", "delayed"]
+        }
+
+    if "priority_stats" in sections:
+        total = result["priority_total"]
+        data["priority_stats"] = []
+        for priority, _ in Task.PRIORITY_CHOICES:
+            count = result[f"priority_{priority}"]
+            percentage = (count / total * 100) if total > 0 else 0
+            data["priority_stats"].append(
+                {
+                    "priority": priority,
+                    "count": count,
+                    "percentage": round(percentage, 1),
+                }
+            )
+
+    if "workload_stats" in sections:
+        # 오늘을 제외한 최근 7일
+        data["workload_stats"] = build_workload_series(
+            user, today - timedelta(days=7), today - timedelta(days=1)
+        )
+
+    return data
+
+
+def build_list_sections(user, sections, now):
+    today = now.date()
+    conditions = {
+        "today_tasks": get_scope_q(user)
+        & Q(
+            start_date__date__lte=today,
+            due_date__date__gte=today,
+            status__in=OPEN_STATUSES,
+        ),
+        # 지연 통계(stats.delayed)와 같은 조건
+        "delayed_tasks": get_scope_q(user) & get_delayed_q(now=now),
+        # 마감 임박 위젯은 팀장도 자신의 작업 기준
+        "upcoming_deadlines": get_scope_q(user, include_managers=False)
+        & Q(
+            due_date__date__range=[today, today + timedelta(days=7)],
+            status__in=["TODO", "IN_PROGRESS"],
+        ),
+    }
+    conditions = {key: conditions[key] for key in sections}
+
+    queryset = Task.objects.filter(reduce(or_, conditions.values())).annotate(
+        **{
+            f"in_{key}": ExpressionWrapper(
+                condition, output_field=BooleanField()
+            )
+            for key, condition in conditions.items()
+        }
+    )
+    tasks = list(
+        TaskListSerializer.setup_eager_loading(queryset).order_by(
+            "due_date", "id"
+        )
+    )
+
+    data = {}
+    for key in sections:
+        section_tasks = [task for task in tasks if getattr(task, f"in_{key}")]
+        if key == "upcoming_deadlines":
+            section_tasks = section_tasks[:5]  # 상위 5개만
+        data[key] = TaskListSerializer(section_tasks, many=True).data
+    return data
+
+
+def iter_buckets(start, end, bucket):
+    """기간 내 집계 구간의 시작 날짜 목록 (주 단위는 월요일, 월 단위는 1일)"""
+    if bucket == "week":
+        current = start - timedelta(days=start.weekday())
+    elif bucket == "month":
+        current = start.replace(day=1)
+    else:
+        current = start
+
+    while current <= end:
+        yield current
+        if bucket == "week":
+            current += timedelta(days=7)
+        elif bucket == "month":
+            current = (current.replace(day=28) + timedelta(days=4)).replace(
+                day=1
+            )
+        else:
+            current += timedelta(days=1)
+
+
+def build_workload_series(user, start, end, bucket="day"):
+    """
+    기간별 작업 부하 통계
+    기준 날짜 컬럼(시작일/완료일/마감일)별 그룹 집계 3회로 계산하고
+    작업이 없는 구간은 0으로 채움
+    """
+    # 통계 위젯은 팀장도 자신의 작업 기준
+    queryset = Task.objects.filter(
+        get_scope_q(user, include_managers=False)
+    ).order_by()
+    start_at = timezone.make_aware(datetime.combine(start, time.min))
+    end_at = timezone.make_aware(
+        datetime.combine(end + timedelta(days=1), time.min)
+    )
+
+    def grouped(field, **filters):
+        return (
+            queryset.filter(
+                **{f"{field}__gte": start_at, f"{field}__lt": end_at},
+                **filters,
+            )
+            .annotate(bucket=Trunc(field, bucket, output_field=DateField()))
+            .values("bucket")
+        )
+
+    series = {
+        key: {"total": 0, "completed": 0, "inProgress": 0, "delayed": 0}
+        for key in iter_buckets(start, end, bucket)
+    }
+
+    for row in grouped("start_date").annotate(
+        total=Count("id"),
+        in_progress=Count("id", filter=Q(status="IN_PROGRESS")),
+    ):
+        series[row["bucket"]]["total"] = row["total"]
+        series[row["bucket"]]["inProgress"] = row["in_progress"]
+
+    for row in grouped("completed_at", status="DONE").annotate(
+        count=Count("id")
+    ):
+        series[row["bucket"]]["completed"] = row["count"]
+
+    for row in grouped(
+        "due_date", status__in=["TODO", "IN_PROGRESS"]
+    ).annotate(count=Count("id")):
+        series[row["bucket"]]["delayed"] = row["count"]
+
+    return [
+        {"date": key.strftime("%Y-%m-%d"), **values}
+        for key, values in series.items()
+    ]
+
+
+def build_workload_matrix(users, start, end):
+    """
+    사용자 × 날짜별 진행 중인 작업 수 (히트맵용)
+    기간과 겹치는 작업을 (assignee, start_date, due_date) 인덱스로 한 번에 조회한 뒤
+    날짜별 증감을 누적해 계산
+    """
+    days = (end - start).days + 1
+    start_at = timezone.make_aware(datetime.combine(start, time.min))
+    end_at = timezone.make_aware(
+        datetime.combine(end + timedelta(days=1), time.min)
+    )
+
+    members = list(users.values("id", "first_name", "last_name"))
+    deltas = {member["id"]: [0] * (days + 1) for member in members}
+
+    tasks = Task.objects.filter(
+        assignee__in=users.values("id"),
+        start_date__lt=end_at,
+        due_date__gte=start_at,
+    ).values_list("assignee_id", "start_date", "due_date")
+
+    for assignee_id, start_date, due_date in tasks:
+        first = (timezone.localtime(start_date).date() - start).days
+        last = (timezone.localtime(due_date).date() - start).days
+        deltas[assignee_id][max(first, 0)] += 1
+        deltas[assignee_id][min(last, days - 1) + 1] -= 1
+
+    result = []
+    for member in members:
+        counts = []
+        running = 0
+        for delta in deltas[member["id"]][:days]:
+            running += delta
+            counts.append(running)
+        result.append(
+            {
+                "user_id": member["id"],
+                "user_name": f"{member['first_name']} {member['last_name']}",
+                "counts": counts,
+            }
+        )
+
+    return {
+        "dates": [
+            (start + timedelta(days=i)).strftime("%Y-%m-%d")
+            for i in range(days)
+        ],
+        "users": result,
+    }
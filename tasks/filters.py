@@ -1,5 +1,6 @@
 from django_filters import rest_framework as filters
 from .models import Task
+from .search import search_tasks
 
 
 class TaskFilter(filters.FilterSet):
@@ -13,8 +14,13 @@ class TaskFilter(filters.FilterSet):
     priority = filters.ChoiceFilter(choices=Task.PRIORITY_CHOICES)
     assignee = filters.NumberFilter()
     department = filters.NumberFilter()
-    search = filters.CharFilter(field_name="title", lookup_expr="icontains")
+    search = filters.CharFilter(method="filter_search")
 
     class Meta:
         model = Task
         fields = ["status", "priority", "assignee", "department"]
+
+    def filter_search(self, queryset, name, value):
+        if not value:
+            return queryset
+        return search_tasks(queryset, value)
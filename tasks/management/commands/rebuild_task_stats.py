@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from tasks.rollup import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = "일별 작업 통계 롤업 전체 재계산"
+
+    def handle(self, *args, **options):
+        count = rebuild_daily_stats()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully rebuilt {count} task stat rows")
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        ('tasks', '0002_task_dependencies_task_is_milestone_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['start_date', 'id'], name='tasks_task_start_d_c2c5b0_idx'),
+        ),
+    ]
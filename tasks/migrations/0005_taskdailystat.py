@@ -0,0 +1,58 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        ('tasks', '0004_task_search_trgm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('status', models.CharField(choices=[('TODO', '예정'), ('IN_PROGRESS', '진행중'), ('REVIEW', '검토중'), ('DONE', '완료'), ('HOLD', '보류')], max_length=20, verbose_name='상태')),
+                ('priority', models.CharField(choices=[('LOW', '낮음'), ('MEDIUM', '보통'), ('HIGH', '높음'), ('URGENT', '긴급')], max_length=20, verbose_name='우선순위')),
+                ('task_count', models.IntegerField(default=0, verbose_name='작업 수 증감')),
+                ('entered_count', models.PositiveIntegerField(default=0, verbose_name='상태 진입 수')),
+            ],
+            options={
+                'verbose_name': '일별 작업 통계',
+                'verbose_name_plural': '일별 작업 통계들',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'due_date'], name='tasks_task_status_0eabcf_idx'),
+        ),
+        migrations.AddField(
+            model_name='taskdailystat',
+            name='assignee',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='task_daily_stats', to=settings.AUTH_USER_MODEL, verbose_name='담당자'),
+        ),
+        migrations.AddField(
+            model_name='taskdailystat',
+            name='department',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='task_daily_stats', to='organizations.department', verbose_name='담당 부서'),
+        ),
+        migrations.AddIndex(
+            model_name='taskdailystat',
+            index=models.Index(fields=['department', 'date'], name='tasks_taskd_departm_357cc5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskdailystat',
+            index=models.Index(fields=['assignee', 'date'], name='tasks_taskd_assigne_bc602f_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='taskdailystat',
+            constraint=models.UniqueConstraint(fields=('date', 'department', 'assignee', 'status', 'priority'), name='unique_task_daily_stat'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-18 05:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        ('tasks', '0005_taskdailystat'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['department', 'start_date', 'due_date'], name='tasks_task_departm_19477e_idx'),
+        ),
+    ]
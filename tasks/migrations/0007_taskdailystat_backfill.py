@@ -0,0 +1,124 @@
+# Generated by Django 5.0.3 on 2026-10-18 06:09
+
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+# 마이그레이션 시점의 롤업 계산 (tasks.rollup을 가져오지 않고 복사해 고정)
+ROLLUP_FIELDS = ["department_id", "assignee_id", "status", "priority"]
+
+
+def compute_daily_deltas(Task, TaskHistory, today):
+    """작업 생성 이력과 상태 변경 이력으로 일별 증감 계산"""
+    tasks = Task.objects.order_by()
+
+    # 최초 상태 = 첫 번째 상태 변경 이력의 이전 상태 (이력이 없으면 현재 상태)
+    first_history = TaskHistory.objects.filter(task=OuterRef("pk")).order_by(
+        "created_at", "id"
+    )
+    created_rows = (
+        tasks.annotate(
+            day=TruncDate("created_at"),
+            initial_status=Coalesce(
+                Subquery(first_history.values("previous_status")[:1]),
+                "status",
+            ),
+        )
+        .values(
+            "day", "department_id", "assignee_id", "initial_status", "priority"
+        )
+        .annotate(count=Count("id"))
+    )
+    history_rows = (
+        TaskHistory.objects.order_by()
+        .annotate(day=TruncDate("created_at"))
+        .values(
+            "day",
+            "task__department_id",
+            "task__assignee_id",
+            "task__priority",
+            "previous_status",
+            "new_status",
+        )
+        .annotate(count=Count("id"))
+    )
+
+    deltas = defaultdict(int)
+    for row in created_rows:
+        key = (
+            row["day"],
+            row["department_id"],
+            row["assignee_id"],
+            row["initial_status"],
+            row["priority"],
+        )
+        deltas[key] += row["count"]
+
+    for row in history_rows:
+        base = (
+            row["day"],
+            row["task__department_id"],
+            row["task__assignee_id"],
+        )
+        priority = row["task__priority"]
+        deltas[base + (row["previous_status"], priority)] -= row["count"]
+        deltas[base + (row["new_status"], priority)] += row["count"]
+
+    # 이력 없이 바뀐 값은 키별 누적 합계와 현재 작업 수의 차이를 오늘 날짜로 보정
+    drift = defaultdict(int)
+    for (_, *key), count in deltas.items():
+        drift[tuple(key)] += count
+    for row in tasks.values(*ROLLUP_FIELDS).annotate(count=Count("id")):
+        drift[tuple(row[field] for field in ROLLUP_FIELDS)] -= row["count"]
+    for key, count in drift.items():
+        deltas[(today, *key)] -= count
+
+    return {key: count for key, count in deltas.items() if count}
+
+
+def backfill_daily_stats(apps, schema_editor):
+    """기존 작업과 상태 변경 이력으로 일별 작업 통계 롤업 생성"""
+    Task = apps.get_model('tasks', 'Task')
+    TaskHistory = apps.get_model('tasks', 'TaskHistory')
+    TaskDailyStat = apps.get_model('tasks', 'TaskDailyStat')
+    deltas = compute_daily_deltas(Task, TaskHistory, timezone.localdate())
+
+    TaskDailyStat.objects.all().delete()
+    TaskDailyStat.objects.bulk_create(
+        [
+            TaskDailyStat(
+                date=date,
+                department_id=department_id,
+                assignee_id=assignee_id,
+                status=status,
+                priority=priority,
+                task_count=task_count,
+            )
+            for (
+                date,
+                department_id,
+                assignee_id,
+                status,
+                priority,
+            ), task_count in deltas.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_department_dates_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='taskdailystat',
+            name='entered_count',
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
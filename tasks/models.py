@@ -1,9 +1,39 @@
 from django.db import models
+from django.db.models import ExpressionWrapper, Q
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.utils import timezone
 
 # Create your models here.
 
+# 분포 통계 필드별 정렬 순서 (보고서/개인 통계 공통)
+DISTRIBUTION_ORDER = {
+    "priority": ["URGENT", "HIGH", "MEDIUM", "LOW"],
+    "difficulty": ["VERY_HARD", "HARD", "MEDIUM", "EASY"],
+    "status": ["TODO", "IN_PROGRESS", "REVIEW", "DONE", "HOLD"],
+}
+
+
+def get_delayed_q(prefix="", now=None):
+    """지연 작업 조건 (마감일이 지났고 완료되지 않은 작업)"""
+    return Q(**{f"{prefix}due_date__lt": now or timezone.now()}) & ~Q(
+        **{f"{prefix}status": "DONE"}
+    )
+
+
+class TaskQuerySet(models.QuerySet):
+    def with_delay(self, now=None):
+        """지연 여부를 DB에서 계산해 delayed 속성으로 추가"""
+        return self.annotate(
+            delayed=ExpressionWrapper(
+                get_delayed_q(now=now), output_field=models.BooleanField()
+            )
+        )
+
+    def delayed(self, now=None):
+        """지연 작업만 조회"""
+        return self.filter(get_delayed_q(now=now))
+
 
 class Task(models.Model):
     STATUS_CHOICES = [
@@ -106,12 +136,31 @@ class Task(models.Model):
         verbose_name="선행 작업",
     )
 
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         verbose_name = "작업"
         verbose_name_plural = "작업들"
         # 시간 충돌 체크를 위한 인덱스 추가
         indexes = [
             models.Index(fields=["assignee", "start_date", "due_date"]),
+            # 부서 캘린더 기간 겹침 조회용 인덱스
+            models.Index(fields=["department", "start_date", "due_date"]),
+            # 커서 페이지네이션 (start_date, id) 키셋 조회용 인덱스
+            models.Index(fields=["start_date", "id"]),
+            # 지연 작업 집계용 인덱스
+            models.Index(fields=["status", "due_date"]),
+            # 제목/설명 검색용 트라이그램 인덱스 (ILIKE 지원)
+            GinIndex(
+                fields=["title"],
+                name="tasks_task_title_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["description"],
+                name="tasks_task_description_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
         ]
 
     def __str__(self):
@@ -119,6 +168,7 @@ class Task(models.Model):
 
     @property
     def is_delayed(self):
+        # DB 조건은 get_delayed_q와 동일
         if self.due_date and self.status != "DONE":
             return timezone.now() > self.due_date
         return False
@@ -260,3 +310,49 @@ class TaskEvaluation(models.Model):
     class Meta:
         verbose_name = "작업 평가"
         verbose_name_plural = "작업 평가들"
+
+
+class TaskDailyStat(models.Model):
+    """
+    일별 작업 통계 롤업
+    (날짜, 부서, 담당자, 상태, 우선순위)별 작업 수 증감을 기록하며,
+    특정 날짜까지의 task_count 합계가 그 날짜 기준 작업 수가 됨
+    """
+
+    date = models.DateField(verbose_name="날짜")
+    # 삭제된 작업의 증감도 남아야 하므로 FK 제약 없이 참조
+    department = models.ForeignKey(
+        "organizations.Department",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="task_daily_stats",
+        verbose_name="담당 부서",
+    )
+    assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="task_daily_stats",
+        verbose_name="담당자",
+    )
+    status = models.CharField(
+        max_length=20, choices=Task.STATUS_CHOICES, verbose_name="상태"
+    )
+    priority = models.CharField(
+        max_length=20, choices=Task.PRIORITY_CHOICES, verbose_name="우선순위"
+    )
+    task_count = models.IntegerField(default=0, verbose_name="작업 수 증감")
+
+    class Meta:
+        verbose_name = "일별 작업 통계"
+        verbose_name_plural = "일별 작업 통계들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "department", "assignee", "status", "priority"],
+                name="unique_task_daily_stat",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["department", "date"]),
+            models.Index(fields=["assignee", "date"]),
+        ]
@@ -0,0 +1,127 @@
+import base64
+import json
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    (start_date, id) 키셋 기반 커서 페이지네이션
+    OFFSET 스캔 없이 다음/이전 페이지를 조회하고, count는 요청 시에만 계산
+    """
+
+    cursor_query_param = "cursor"
+    count_query_param = "with_count"
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, "") == "true":
+            self.count = queryset.count()
+
+        if reverse:
+            queryset = queryset.order_by("-start_date", "-id")
+        else:
+            queryset = queryset.order_by("start_date", "id")
+
+        if position is not None:
+            start_date, task_id = position
+            if reverse:
+                queryset = queryset.filter(
+                    Q(start_date__lt=start_date)
+                    | Q(start_date=start_date, id__lt=task_id)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(start_date__gt=start_date)
+                    | Q(start_date=start_date, id__gt=task_id)
+                )
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        self.page = results[:page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(
+                base64.urlsafe_b64decode(encoded.encode("ascii"))
+            )
+            start_date = parse_datetime(payload["s"])
+            task_id = int(payload["i"])
+            reverse = bool(payload.get("r", False))
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if start_date is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return (start_date, task_id), reverse
+
+    def encode_cursor(self, task, reverse):
+        payload = {
+            "s": task.start_date.isoformat(),
+            "i": task.id,
+            "r": reverse,
+        }
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload).encode("ascii")
+        ).decode("ascii")
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        response = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            response["count"] = self.count
+        return Response(response)
@@ -0,0 +1,111 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q
+
+User = get_user_model()
+
+# 팀 성과 집계 대상 직급 (본부장/이사 제외)
+TEAM_MEMBER_RANKS = [
+    "STAFF",
+    "SENIOR",
+    "ASSISTANT_MANAGER",
+    "MANAGER",
+    "DEPUTY_GENERAL_MANAGER",
+]
+
+PERFORMANCE_CACHE_TIMEOUT = 60 * 10
+PERFORMANCE_VERSION_KEY = "team_performance:version"
+
+
+def get_performance_version():
+    """팀 성과 캐시 버전 (작업/평가/사용자 변경 시 증가)"""
+    version = cache.get(PERFORMANCE_VERSION_KEY)
+    if version is None:
+        cache.add(PERFORMANCE_VERSION_KEY, 1, None)
+        version = cache.get(PERFORMANCE_VERSION_KEY, 1)
+    return version
+
+
+def invalidate_team_performance():
+    """모든 팀 성과 캐시 무효화"""
+    cache.add(PERFORMANCE_VERSION_KEY, 1, None)
+    try:
+        cache.incr(PERFORMANCE_VERSION_KEY)
+    except ValueError:
+        cache.set(PERFORMANCE_VERSION_KEY, 1, None)
+
+
+def build_team_performance(department_ids=None):
+    """
+    팀원별 성과 계산 (그룹 집계 한 번)
+    - department_ids가 None이면 전체 부서
+    - 평가 점수는 완료된 작업의 평가만 대상으로 평균
+    작업 × 평가 조인으로 작업 행이 중복되므로 작업 수는 distinct로 계산
+    """
+    members = User.objects.filter(is_active=True, rank__in=TEAM_MEMBER_RANKS)
+    if department_ids is not None:
+        members = members.filter(department_id__in=department_ids)
+
+    done = Q(assigned_tasks__status="DONE")
+    members = (
+        members.annotate(
+            task_count=Count("assigned_tasks", distinct=True),
+            completed_count=Count("assigned_tasks", filter=done, distinct=True),
+            average_score=Avg(
+                "assigned_tasks__evaluations__performance_score", filter=done
+            ),
+        )
+        .order_by("id")
+        .values(
+            "id",
+            "first_name",
+            "last_name",
+            "task_count",
+            "completed_count",
+            "average_score",
+        )
+    )
+
+    performance_data = []
+    for member in members:
+        total_tasks = member["task_count"]
+        completion_rate = (
+            (member["completed_count"] / total_tasks * 100)
+            if total_tasks > 0
+            else 0
+        )
+        performance_data.append(
+            {
+                "user_id": member["id"],
+                "name": f"{member['last_name']}{member['first_name']}",
+                "completion_rate": round(completion_rate, 1),
+                "task_count": total_tasks,
+                "average_score": round(member["average_score"] or 0, 1),
+            }
+        )
+    return performance_data
+
+
+def get_team_performance(department_ids=None, refresh=False):
+    """
+    캐시된 팀 성과 조회 (없거나 refresh인 경우 다시 계산)
+    작업/평가/사용자가 변경되면 버전이 바뀌어 다음 조회 시 재계산됨
+    """
+    scope = (
+        "all"
+        if department_ids is None
+        else ",".join(str(dept_id) for dept_id in sorted(department_ids))
+    )
+    # 버전과 캐시된 결과를 한 번에 조회 (공유 캐시 왕복 1회)
+    cache_key = f"team_performance:{scope}"
+    cached = cache.get_many([PERFORMANCE_VERSION_KEY, cache_key])
+    version = cached.get(PERFORMANCE_VERSION_KEY) or get_performance_version()
+    entry = cached.get(cache_key)
+    if not refresh and entry is not None and entry[0] == version:
+        return entry[1]
+
+    performance_data = build_team_performance(department_ids)
+    cache.set(
+        cache_key, (version, performance_data), PERFORMANCE_CACHE_TIMEOUT
+    )
+    return performance_data
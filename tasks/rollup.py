@@ -0,0 +1,170 @@
+from collections import defaultdict
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from .models import Task, TaskDailyStat, TaskHistory
+
+# 롤업 키에 포함되는 작업 필드
+ROLLUP_FIELDS = ["department_id", "assignee_id", "status", "priority"]
+
+
+def get_rollup_key(task):
+    return tuple(getattr(task, field) for field in ROLLUP_FIELDS)
+
+
+def apply_delta(date, key, task_count):
+    """롤업 행에 증감 반영 (행이 없으면 생성)"""
+    department_id, assignee_id, status, priority = key
+    lookup = {
+        "date": date,
+        "department_id": department_id,
+        "assignee_id": assignee_id,
+        "status": status,
+        "priority": priority,
+    }
+    updated = TaskDailyStat.objects.filter(**lookup).update(
+        task_count=F("task_count") + task_count
+    )
+    if updated:
+        return
+
+    try:
+        with transaction.atomic():
+            TaskDailyStat.objects.create(task_count=task_count, **lookup)
+    except IntegrityError:
+        # 동시에 같은 행이 생성된 경우 증감만 반영
+        TaskDailyStat.objects.filter(**lookup).update(
+            task_count=F("task_count") + task_count
+        )
+
+
+def record_task_saved(task, previous_key=None):
+    """작업 생성/수정 시 롤업 갱신"""
+    key = get_rollup_key(task)
+    if previous_key == key:
+        return
+
+    today = timezone.localdate()
+    if previous_key is not None:
+        apply_delta(today, previous_key, task_count=-1)
+    apply_delta(today, key, task_count=1)
+
+
+def record_task_deleted(key):
+    """작업 삭제 시 롤업 갱신"""
+    apply_delta(timezone.localdate(), key, task_count=-1)
+
+
+def compute_daily_deltas(today=None):
+    """
+    작업 생성 이력과 상태 변경 이력으로 일별 증감 계산
+    반환값: {(날짜, 부서, 담당자, 상태, 우선순위): 작업 수 증감}
+    (부서/담당자/우선순위는 현재 값 기준, 삭제된 작업은 포함되지 않음)
+
+    이력 없이 바뀐 값(관리자 수정, 일정 변경, 직접 save 등)은 이력으로
+    재구성할 수 없으므로, 키별 누적 합계가 현재 작업 상태와 같아지도록
+    차이를 today 날짜의 증감으로 보정 (증분 롤업과 같은 기준)
+    """
+    today = today or timezone.localdate()
+    tasks = Task.objects.order_by()
+
+    # 최초 상태 = 첫 번째 상태 변경 이력의 이전 상태 (이력이 없으면 현재 상태)
+    first_history = TaskHistory.objects.filter(task=OuterRef("pk")).order_by(
+        "created_at", "id"
+    )
+    created_rows = (
+        tasks.annotate(
+            day=TruncDate("created_at"),
+            initial_status=Coalesce(
+                Subquery(first_history.values("previous_status")[:1]),
+                "status",
+            ),
+        )
+        .values(
+            "day", "department_id", "assignee_id", "initial_status", "priority"
+        )
+        .annotate(count=Count("id"))
+    )
+    history_rows = (
+        TaskHistory.objects.order_by()
+        .annotate(day=TruncDate("created_at"))
+        .values(
+            "day",
+            "task__department_id",
+            "task__assignee_id",
+            "task__priority",
+            "previous_status",
+            "new_status",
+        )
+        .annotate(count=Count("id"))
+    )
+
+    deltas = defaultdict(int)
+    for row in created_rows:
+        key = (
+            row["day"],
+            row["department_id"],
+            row["assignee_id"],
+            row["initial_status"],
+            row["priority"],
+        )
+        deltas[key] += row["count"]
+
+    for row in history_rows:
+        base = (
+            row["day"],
+            row["task__department_id"],
+            row["task__assignee_id"],
+        )
+        priority = row["task__priority"]
+        deltas[base + (row["previous_status"], priority)] -= row["count"]
+        deltas[base + (row["new_status"], priority)] += row["count"]
+
+    # 키별 누적 합계와 현재 작업 수의 차이를 오늘 날짜로 보정
+    drift = defaultdict(int)
+    for (_, *key), count in deltas.items():
+        drift[tuple(key)] += count
+    for row in tasks.values(*ROLLUP_FIELDS).annotate(count=Count("id")):
+        drift[tuple(row[field] for field in ROLLUP_FIELDS)] -= row["count"]
+    for key, count in drift.items():
+        deltas[(today, *key)] -= count
+
+    return {key: count for key, count in deltas.items() if count}
+
+
+def write_daily_stats(deltas):
+    """롤업 전체를 주어진 증감으로 교체"""
+    with transaction.atomic():
+        TaskDailyStat.objects.all().delete()
+        TaskDailyStat.objects.bulk_create(
+            [
+                TaskDailyStat(
+                    date=date,
+                    department_id=department_id,
+                    assignee_id=assignee_id,
+                    status=status,
+                    priority=priority,
+                    task_count=task_count,
+                )
+                for (
+                    date,
+                    department_id,
+                    assignee_id,
+                    status,
+                    priority,
+                ), task_count in deltas.items()
+            ],
+            batch_size=1000,
+        )
+
+
+def rebuild_daily_stats():
+    """
+    롤업 전체 재계산
+    증감 누적 방식이라 일부 기간만 다시 만들면 기간 밖에서 생성된 작업의
+    이동/삭제 증감이 사라져 누적 합계가 틀어지므로 항상 전체를 재계산함
+    """
+    deltas = compute_daily_deltas()
+    write_daily_stats(deltas)
+    return len(deltas)
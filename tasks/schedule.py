@@ -0,0 +1,121 @@
+from functools import reduce
+from operator import or_
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from .models import Task
+
+# 일정 충돌 대상에서 제외하는 상태 (완료된 작업은 충돌로 보지 않음)
+CONFLICT_IGNORED_STATUSES = ["DONE"]
+
+# 일괄 일정 변경 최대 작업 수
+MAX_SCHEDULE_MOVES = 100
+
+
+def parse_schedule_datetime(value):
+    """
+    일정 변경 요청의 날짜 파싱 (값이 없으면 None)
+    형식이 올바르지 않으면 ValueError
+    """
+    if not value:
+        return None
+    parsed = parse_datetime(str(value))
+    if parsed is None:
+        raise ValueError(value)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def get_overlap_q(start, due):
+    """
+    기간 겹침 조건 (시작일 < 다른 기간 끝, 마감일 > 다른 기간 시작)
+    끝과 시작이 맞닿는 경우는 겹치지 않는 것으로 봄
+    """
+    return Q(start_date__lt=due, due_date__gt=start)
+
+
+def find_schedule_conflicts(assignee, start, due, exclude_ids=()):
+    """
+    담당자의 작업 중 기간이 겹치는 작업 조회
+    (assignee, start_date, due_date) 복합 인덱스 사용
+    """
+    return (
+        Task.objects.filter(get_overlap_q(start, due), assignee=assignee)
+        .exclude(status__in=CONFLICT_IGNORED_STATUSES)
+        .exclude(id__in=exclude_ids)
+        .order_by("start_date", "id")
+    )
+
+
+def find_batch_conflicts(moves):
+    """
+    여러 작업의 일정 변경안을 한 번에 검사
+    moves: [(task, start, due), ...]
+    - 변경 대상끼리의 충돌은 담당자별로 비교
+    - 변경 대상이 아닌 작업과의 충돌은 변경안별 겹침 조건을 OR로 묶어 한 번에 조회
+    반환: {task_id: [충돌 작업 정보, ...]} (충돌이 없는 작업은 제외)
+    """
+    moves = [move for move in moves if move[0].assignee_id]
+    if not moves:
+        return {}
+
+    moved_ids = [task.id for task, _, _ in moves]
+    conflicts = {task.id: [] for task, _, _ in moves}
+
+    # 변경 대상 작업끼리의 충돌
+    for i, (task, start, due) in enumerate(moves):
+        if task.status in CONFLICT_IGNORED_STATUSES:
+            continue
+        for other, other_start, other_due in moves[i + 1 :]:
+            if (
+                other.assignee_id != task.assignee_id
+                or other.status in CONFLICT_IGNORED_STATUSES
+            ):
+                continue
+            if start < other_due and due > other_start:
+                conflicts[task.id].append(
+                    get_conflict_data(other, other_start, other_due)
+                )
+                conflicts[other.id].append(
+                    get_conflict_data(task, start, due)
+                )
+
+    # 변경 대상이 아닌 작업과의 충돌
+    condition = reduce(
+        or_,
+        [
+            get_overlap_q(start, due) & Q(assignee_id=task.assignee_id)
+            for task, start, due in moves
+            if task.status not in CONFLICT_IGNORED_STATUSES
+        ],
+        Q(pk__in=[]),
+    )
+    others = list(
+        Task.objects.filter(condition)
+        .exclude(status__in=CONFLICT_IGNORED_STATUSES)
+        .exclude(id__in=moved_ids)
+        .order_by("start_date", "id")
+        .only("id", "title", "assignee_id", "start_date", "due_date")
+    )
+    for task, start, due in moves:
+        if task.status in CONFLICT_IGNORED_STATUSES:
+            continue
+        conflicts[task.id].extend(
+            get_conflict_data(other, other.start_date, other.due_date)
+            for other in others
+            if other.assignee_id == task.assignee_id
+            and other.start_date < due
+            and other.due_date > start
+        )
+
+    return {task_id: items for task_id, items in conflicts.items() if items}
+
+
+def get_conflict_data(task, start, due):
+    return {
+        "id": task.id,
+        "title": task.title,
+        "start_date": start,
+        "due_date": due,
+    }
@@ -0,0 +1,25 @@
+from django.db.models import Q
+from organizations.scope import HEADQUARTERS_RANKS, get_visible_department_ids
+
+
+def get_scope_q(user, prefix="", include_managers=True):
+    """
+    사용자 조회 범위에 해당하는 작업 조건 반환
+    - ADMIN: 전체
+    - 본부장/이사: 본부 및 산하 팀 (팀 소속이면 해당 팀)
+    - 팀장(MANAGER): 소속 팀 (include_managers=False이면 자신의 작업만)
+    - 그 외: 자신의 작업만
+    """
+    dept_ids = get_visible_department_ids(user)
+    if dept_ids is None:
+        return Q()
+    if dept_ids and (include_managers or user.rank in HEADQUARTERS_RANKS):
+        return Q(**{f"{prefix}department_id__in": dept_ids})
+    return Q(**{f"{prefix}assignee": user})
+
+
+def filter_by_scope(queryset, user, prefix="", include_managers=True):
+    """사용자 조회 범위에 따른 쿼리셋 필터링"""
+    return queryset.filter(
+        get_scope_q(user, prefix=prefix, include_managers=include_managers)
+    )
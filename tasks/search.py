@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import CharField, Q, TextField
+from django.db.models.functions import Greatest
+from django.db.models.lookups import IContains
+from accounts.models import FullName
+
+User = get_user_model()
+
+
+@CharField.register_lookup
+@TextField.register_lookup
+class TrigramIContains(IContains):
+    """
+    대소문자 구분 없는 부분 일치 검색
+    PostgreSQL에서는 UPPER() 대신 ILIKE를 사용해 pg_trgm GIN 인덱스를 탈 수 있도록 함
+    """
+
+    lookup_name = "trgm_icontains"
+
+    def as_sql(self, compiler, connection):
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", (*lhs_params, *rhs_params)
+
+
+def search_tasks(queryset, term):
+    """
+    작업 검색 (제목, 설명, 담당자 이름)
+    - 제목/설명은 작업 테이블의 트라이그램 인덱스로 조회
+    - 담당자 이름(성+이름)은 사용자 테이블의 트라이그램 인덱스로 먼저 조회
+    - 제목/담당자 이름 유사도를 search_rank로 추가 (관련도 정렬용)
+    """
+    matching_users = (
+        User.objects.annotate(full_name=FullName())
+        .filter(full_name__trgm_icontains=term)
+        .values("id")
+    )
+
+    return queryset.filter(
+        Q(title__trgm_icontains=term)
+        | Q(description__trgm_icontains=term)
+        | Q(assignee_id__in=matching_users)
+    ).annotate(
+        search_rank=Greatest(
+            TrigramWordSimilarity(term, "title"),
+            TrigramWordSimilarity(term, FullName("assignee__")),
+        )
+    )
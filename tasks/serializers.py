@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from .models import (
     Task,
     TaskComment,
@@ -80,6 +82,94 @@ class TaskSerializer(serializers.ModelSerializer):
         return ""
 
 
+class TaskListSerializer(TaskSerializer):
+    """목록용 작업 시리얼라이저 (코멘트 목록 대신 코멘트 수/최근 코멘트 시각)"""
+
+    comments = None
+    comment_count = serializers.IntegerField(read_only=True)
+    last_comment_at = serializers.DateTimeField(read_only=True)
+
+    class Meta(TaskSerializer.Meta):
+        fields = [
+            field for field in TaskSerializer.Meta.fields if field != "comments"
+        ] + ["comment_count", "last_comment_at"]
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """연관 객체와 코멘트 요약을 한 번의 쿼리로 조회"""
+        comments = TaskComment.objects.filter(task=OuterRef("pk")).order_by()
+        return queryset.select_related(
+            "assignee", "reporter", "department", "department__parent"
+        ).annotate(
+            comment_count=Coalesce(
+                Subquery(
+                    comments.values("task")
+                    .annotate(count=Count("id"))
+                    .values("count")
+                ),
+                0,
+            ),
+            last_comment_at=Subquery(
+                comments.order_by("-created_at").values("created_at")[:1]
+            ),
+        )
+
+
+class TaskSummarySerializer(serializers.ModelSerializer):
+    """
+    사용자 작업 이력용 요약 시리얼라이저 (코멘트/담당자/보고자 제외)
+    fields 인자로 필요한 필드만 선택 가능
+    """
+
+    department_name = serializers.CharField(
+        source="department.name", read_only=True
+    )
+    is_delayed = serializers.BooleanField(read_only=True)
+
+    # 모델 필드가 아닌 항목을 계산하는 데 필요한 컬럼
+    SOURCE_COLUMNS = {
+        "department_name": ["department__name"],
+        "is_delayed": ["status", "due_date"],
+    }
+
+    class Meta:
+        model = Task
+        fields = [
+            "id",
+            "title",
+            "status",
+            "priority",
+            "difficulty",
+            "department",
+            "department_name",
+            "start_date",
+            "due_date",
+            "completed_at",
+            "estimated_hours",
+            "actual_hours",
+            "is_delayed",
+        ]
+        read_only_fields = fields
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None):
+        """선택한 필드에 필요한 컬럼만 조회 (부서명은 조인으로 함께 조회)"""
+        fields = fields or cls.Meta.fields
+        # 커서 페이지네이션 키는 항상 포함
+        columns = {"id", "start_date"}
+        for field in fields:
+            columns.update(cls.SOURCE_COLUMNS.get(field, [field]))
+        if "department_name" in fields:
+            queryset = queryset.select_related("department")
+        return queryset.only(*columns)
+
+
 class TaskAttachmentSerializer(serializers.ModelSerializer):
     uploaded_by_name = serializers.CharField(
         source="uploaded_by.username", read_only=True
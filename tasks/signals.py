@@ -0,0 +1,116 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.contrib.auth import get_user_model
+from django.dispatch import receiver
+from accounts.signals import users_onboarded
+from reports.cache import invalidate_user_reports
+from .models import Task, TaskEvaluation, TaskHistory, TaskTimeLog
+from .performance import invalidate_team_performance
+from .rollup import (
+    ROLLUP_FIELDS,
+    get_rollup_key,
+    record_task_deleted,
+    record_task_saved,
+)
+
+# 롤업 키에 포함되는 필드 이름 (save(update_fields=...) 비교용)
+ROLLUP_FIELD_NAMES = {
+    Task._meta.get_field(field).name for field in ROLLUP_FIELDS
+}
+
+
+@receiver(pre_save, sender=Task)
+def load_rollup_key(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """수정 시 DB에 저장된 롤업 키 조회 (변경 감지용)"""
+    instance._previous_rollup_key = None
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not ROLLUP_FIELD_NAMES & update_fields:
+        # 롤업 필드를 저장하지 않으므로 키가 바뀌지 않음
+        instance._previous_rollup_key = get_rollup_key(instance)
+        return
+    instance._previous_rollup_key = (
+        Task.objects.filter(pk=instance.pk)
+        .values_list(*ROLLUP_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Task)
+def update_rollup_on_save(sender, instance, created, raw=False, **kwargs):
+    """작업 생성/상태 변경 시 일별 통계 롤업 갱신"""
+    if raw:
+        return
+    previous_key = None if created else instance._previous_rollup_key
+    record_task_saved(instance, previous_key=previous_key)
+
+
+@receiver(post_delete, sender=Task)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    """작업 삭제 시 일별 통계 롤업 갱신"""
+    record_task_deleted(get_rollup_key(instance))
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=TaskEvaluation)
+@receiver(post_delete, sender=TaskEvaluation)
+@receiver(post_delete, sender=get_user_model())
+def invalidate_performance(sender, raw=False, **kwargs):
+    """작업/평가/사용자 변경 시 팀 성과 캐시 무효화"""
+    if not raw:
+        invalidate_team_performance()
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_performance_on_user_save(
+    sender, instance, update_fields=None, raw=False, **kwargs
+):
+    # 로그인 시각만 갱신된 경우는 제외
+    if raw or update_fields == frozenset(["last_login"]):
+        return
+    invalidate_team_performance()
+    # 소속 부서가 바뀌면 비교 통계가 달라짐
+    invalidate_user_reports([instance.id])
+
+
+@receiver(users_onboarded)
+def invalidate_performance_on_onboarding(sender, **kwargs):
+    """직원 일괄 등록 시 팀 성과 캐시 무효화"""
+    invalidate_team_performance()
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_reports_on_task_change(
+    sender, instance, signal, raw=False, **kwargs
+):
+    """작업 변경 시 담당자(변경 전 담당자 포함)의 보고서 캐시 무효화"""
+    if raw:
+        return
+    assignee_ids = [instance.assignee_id]
+    if signal is post_save:
+        previous_key = getattr(instance, "_previous_rollup_key", None)
+        if previous_key is not None:
+            assignee_ids.append(previous_key[1])
+    invalidate_user_reports(assignee_ids)
+
+
+@receiver(post_save, sender=TaskEvaluation)
+@receiver(post_delete, sender=TaskEvaluation)
+@receiver(post_save, sender=TaskHistory)
+@receiver(post_delete, sender=TaskHistory)
+@receiver(post_save, sender=TaskTimeLog)
+@receiver(post_delete, sender=TaskTimeLog)
+def invalidate_reports_on_task_data_change(
+    sender, instance, raw=False, **kwargs
+):
+    """평가/상태 이력/작업 시간 변경 시 담당자의 보고서 캐시 무효화"""
+    if raw:
+        return
+    invalidate_user_reports(
+        Task.objects.filter(pk=instance.task_id).values_list(
+            "assignee_id", flat=True
+        )
+    )
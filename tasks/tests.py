@@ -1,14 +1,43 @@
+import csv
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from unittest.mock import patch
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models import Sum
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
+from django.utils import timezone
 from organizations.models import Department
-from .models import Task, TaskComment, TaskAttachment
+from .dashboard import build_workload_series
+from .models import (
+    Task,
+    TaskComment,
+    TaskAttachment,
+    TaskDailyStat,
+    TaskEvaluation,
+    TaskHistory,
+)
 
 User = get_user_model()
 
 
+def count_user_queries(context):
+    """사용자 테이블 조회 수 (팀 성과 집계 쿼리)"""
+    return sum(
+        1
+        for query in context.captured_queries
+        if User._meta.db_table in query["sql"]
+    )
+
+
 class TaskModelTest(TestCase):
     def setUp(self):
         self.department = Department.objects.create(
@@ -52,6 +81,28 @@ class TaskModelTest(TestCase):
         self.task.save()
         self.assertTrue(self.task.is_delayed)
 
+    def test_delayed_queryset(self):
+        Task.objects.create(
+            title="완료 작업",
+            description="테스트 설명",
+            status="DONE",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+
+        tasks = Task.objects.with_delay().order_by("id")
+        self.assertEqual(
+            [task.delayed for task in tasks],
+            [task.is_delayed for task in tasks],
+        )
+        self.assertEqual(
+            list(Task.objects.delayed().values_list("id", flat=True)),
+            [self.task.id],
+        )
+
 
 class TaskAPITest(APITestCase):
     def setUp(self):
@@ -100,3 +151,603 @@ class TaskAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["content"], "테스트 코멘트")
         self.assertEqual(response.data["author"], self.user.id)
+
+    def test_get_tasks_cursor_pagination(self):
+        for day in range(22, 25):
+            Task.objects.create(
+                title=f"커서 작업 {day}",
+                description="테스트 설명",
+                assignee=self.user,
+                reporter=self.user,
+                department=self.department,
+                start_date=f"2024-03-{day}T00:00:00Z",
+                due_date=f"2024-03-{day}T12:00:00Z",
+            )
+        url = reverse("task-list")
+
+        response = self.client.get(url, {"cursor": "", "page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        self.assertEqual(
+            [task["title"] for task in response.data["results"]],
+            ["테스트 작업", "커서 작업 22"],
+        )
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [task["title"] for task in response.data["results"]],
+            ["커서 작업 23", "커서 작업 24"],
+        )
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(
+            [task["title"] for task in response.data["results"]],
+            ["테스트 작업", "커서 작업 22"],
+        )
+
+    def test_get_tasks_cursor_pagination_with_count(self):
+        url = reverse("task-list")
+        response = self.client.get(url, {"cursor": "", "with_count": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_task_list_comment_summary_query_count(self):
+        for index in range(3):
+            task = Task.objects.create(
+                title=f"코멘트 작업 {index}",
+                description="테스트 설명",
+                assignee=self.user,
+                reporter=self.user,
+                department=self.department,
+                start_date="2024-03-22T00:00:00Z",
+                due_date="2024-03-23T00:00:00Z",
+            )
+            for _ in range(2):
+                TaskComment.objects.create(
+                    task=task, author=self.user, content="코멘트"
+                )
+        url = reverse("task-list")
+
+        # 페이지 조회 + 전체 개수 조회
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.data["results"][-1]
+        self.assertNotIn("comments", result)
+        self.assertEqual(result["comment_count"], 2)
+        self.assertIsNotNone(result["last_comment_at"])
+
+    def test_dashboard(self):
+        url = reverse("task-dashboard")
+
+        # 롤업 집계 1회 + 지연 집계 1회 + 작업 부하 3회 + 작업 목록 조회 1회
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["stats"]["total"]["count"], 1)
+        self.assertEqual(response.data["stats"]["delayed"]["count"], 1)
+        self.assertEqual(len(response.data["workload_stats"]), 7)
+        self.assertEqual(
+            [task["title"] for task in response.data["delayed_tasks"]],
+            ["테스트 작업"],
+        )
+
+    def test_dashboard_delayed_trend(self):
+        # 지난주에도 이미 지연된 작업이면 지연 추이는 그대로
+        response = self.client.get(
+            reverse("task-dashboard"), {"sections": "stats,workload_stats"}
+        )
+
+        delayed = response.data["stats"]["delayed"]
+        self.assertEqual(delayed["count"], 1)
+        self.assertEqual(delayed["trend"], 0)
+
+        today = timezone.now().date()
+        self.assertEqual(
+            response.data["workload_stats"],
+            build_workload_series(
+                self.user,
+                today - timedelta(days=7),
+                today - timedelta(days=1),
+            ),
+        )
+
+    def test_dashboard_delayed_count_matches_list(self):
+        # 보류 작업과 오늘 이미 마감이 지난 작업도 목록과 통계에 함께 포함
+        now = timezone.now()
+        for title, status_, due_date in [
+            ("보류 작업", "HOLD", now - timedelta(days=2)),
+            ("오늘 마감", "TODO", now - timedelta(minutes=1)),
+            ("완료 작업", "DONE", now - timedelta(days=2)),
+        ]:
+            Task.objects.create(
+                title=title,
+                description="테스트 설명",
+                status=status_,
+                assignee=self.user,
+                reporter=self.user,
+                department=self.department,
+                start_date=now - timedelta(days=3),
+                due_date=due_date,
+            )
+
+        response = self.client.get(
+            reverse("task-dashboard"), {"sections": "stats,delayed_tasks"}
+        )
+
+        titles = [task["title"] for task in response.data["delayed_tasks"]]
+        self.assertEqual(
+            response.data["stats"]["delayed"]["count"], len(titles)
+        )
+        self.assertCountEqual(titles, ["테스트 작업", "보류 작업", "오늘 마감"])
+
+    def test_dashboard_sections(self):
+        url = reverse("task-dashboard")
+
+        response = self.client.get(url, {"sections": "stats,priority_stats"})
+        self.assertEqual(
+            set(response.data.keys()), {"stats", "priority_stats"}
+        )
+
+        response = self.client.get(url, {"sections": "unknown"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_workload_stats_range(self):
+        url = reverse("task-workload-stats")
+
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                url,
+                {"start": "2024-01-15", "end": "2024-04-10", "bucket": "month"},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["date"] for row in response.data],
+            ["2024-01-01", "2024-02-01", "2024-03-01", "2024-04-01"],
+        )
+        self.assertEqual(response.data[0]["total"], 0)
+        self.assertEqual(response.data[2]["total"], 1)
+        self.assertEqual(response.data[2]["delayed"], 1)
+
+    def test_workload_stats_range_limit(self):
+        url = reverse("task-workload-stats")
+        response = self.client.get(
+            url, {"start": "2023-01-01", "end": "2024-06-01"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_workload(self):
+        url = reverse("task-workload")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"date": "2024-03-20"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["tasks_count"], 1)
+
+    def test_workload_matrix(self):
+        Task.objects.create(
+            title="긴 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-18T01:00:00Z",
+            due_date="2024-03-20T05:00:00Z",
+        )
+        url = reverse("task-workload")
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                url, {"start": "2024-03-17", "end": "2024-03-22"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["dates"]), 6)
+        self.assertEqual(
+            response.data["users"][0]["counts"], [0, 1, 1, 2, 1, 0]
+        )
+
+    def test_calendar_overlap_and_conditional_get(self):
+        # 조회 기간 전체에 걸친 작업
+        Task.objects.create(
+            title="장기 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-02-01T00:00:00Z",
+            due_date="2024-04-30T00:00:00Z",
+        )
+        url = reverse("task-calendar")
+        params = {"start_date": "2024-03-10", "end_date": "2024-03-16"}
+
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [task["title"] for task in response.data], ["장기 작업"]
+        )
+
+        response = self.client.get(
+            url, params, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_calendar_etag_changes_when_task_becomes_delayed(self):
+        now = timezone.now()
+        Task.objects.create(
+            title="마감 임박 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date=now - timedelta(days=1),
+            due_date=now + timedelta(hours=1),
+        )
+        url = reverse("task-calendar")
+        params = {
+            "start_date": (now - timedelta(days=2)).date().isoformat(),
+            "end_date": (now + timedelta(days=2)).date().isoformat(),
+        }
+        response = self.client.get(url, params)
+        etag = response["ETag"]
+        last_modified = response["Last-Modified"]
+
+        # 행 변경 없이 마감일이 지나면 304가 아닌 새 응답
+        later = now + timedelta(hours=2)
+        with patch("django.utils.timezone.now", return_value=later):
+            response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.data[0]["is_delayed"])
+
+            response = self.client.get(
+                url, params, HTTP_IF_MODIFIED_SINCE=last_modified
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_update_dates_conflict(self):
+        other = Task.objects.create(
+            title="다른 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-25T00:00:00Z",
+            due_date="2024-03-27T00:00:00Z",
+        )
+        url = reverse("task-update-dates", args=[self.task.id])
+
+        response = self.client.post(
+            url,
+            {
+                "start_date": "2024-03-26T00:00:00Z",
+                "due_date": "2024-03-28T00:00:00Z",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["conflicts"][0]["id"], other.id)
+
+        # 마감일과 시작일이 맞닿는 경우는 충돌이 아님
+        response = self.client.post(
+            url,
+            {
+                "start_date": "2024-03-27T00:00:00Z",
+                "due_date": "2024-03-28T00:00:00Z",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_batch_update_dates(self):
+        second = Task.objects.create(
+            title="두 번째 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-22T00:00:00Z",
+            due_date="2024-03-23T00:00:00Z",
+        )
+        fixed = Task.objects.create(
+            title="고정 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-28T00:00:00Z",
+            due_date="2024-03-29T00:00:00Z",
+        )
+        url = reverse("task-batch-update-dates")
+        moves = [
+            {
+                "task": self.task.id,
+                "start_date": "2024-03-27T00:00:00Z",
+                "due_date": "2024-03-28T12:00:00Z",
+            },
+            {
+                "task": second.id,
+                "start_date": "2024-03-28T06:00:00Z",
+                "due_date": "2024-03-30T00:00:00Z",
+            },
+        ]
+
+        response = self.client.post(url, {"moves": moves}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        conflicts = {
+            item["task"]: [task["id"] for task in item["conflicting_tasks"]]
+            for item in response.data["conflicts"]
+        }
+        self.assertEqual(
+            conflicts,
+            {
+                self.task.id: [second.id, fixed.id],
+                second.id: [self.task.id, fixed.id],
+            },
+        )
+
+        # 충돌이 없으면 모두 변경
+        moves[0]["due_date"] = "2024-03-28T00:00:00Z"
+        moves[1]["start_date"] = "2024-03-29T00:00:00Z"
+        response = self.client.post(url, {"moves": moves}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        second.refresh_from_db()
+        self.assertEqual(
+            second.start_date.isoformat(), "2024-03-29T00:00:00+00:00"
+        )
+
+    def test_team_performance(self):
+        cache.clear()
+        self.task.status = "DONE"
+        self.task.save()
+        Task.objects.create(
+            title="진행 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-22T00:00:00Z",
+            due_date="2024-03-23T00:00:00Z",
+        )
+        for score in [4, 2]:
+            TaskEvaluation.objects.create(
+                task=self.task,
+                evaluator=self.user,
+                difficulty="MEDIUM",
+                performance_score=score,
+                feedback="피드백",
+            )
+        url = reverse("task-team-performance")
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(count_user_queries(context), 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        member = response.data["members"][0]
+        self.assertEqual(member["task_count"], 2)
+        self.assertEqual(member["completion_rate"], 50.0)
+        self.assertEqual(member["average_score"], 3.0)
+
+        # 캐시된 결과 사용
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        self.assertEqual(count_user_queries(context), 0)
+
+        # 평가가 추가되면 다시 계산
+        TaskEvaluation.objects.create(
+            task=self.task,
+            evaluator=self.user,
+            difficulty="MEDIUM",
+            performance_score=5,
+            feedback="피드백",
+        )
+        response = self.client.get(url)
+        self.assertEqual(
+            response.data["members"][0]["average_score"], round(11 / 3, 1)
+        )
+
+    def test_export_tasks(self):
+        Task.objects.create(
+            title="다른 사람 작업",
+            description="테스트 설명",
+            assignee=User.objects.create_user(
+                username="other",
+                password="testpass123",
+                employee_id="EMP002",
+                department=self.department,
+            ),
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-22T00:00:00Z",
+            due_date="2024-03-23T00:00:00Z",
+        )
+        url = reverse("task-export")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        rows = (
+            b"".join(response.streaming_content)
+            .decode("utf-8-sig")
+            .splitlines()
+        )
+        # 권한 범위 내 작업만 (헤더 + 자신의 작업 1건)
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(rows[0].startswith("ID,제목,상태"))
+        self.assertIn("테스트 작업", rows[1])
+
+    def test_export_other_department_is_scoped(self):
+        other_department = Department.objects.create(
+            name="다른부서", code="TEST002"
+        )
+        other = User.objects.create_user(
+            username="other",
+            password="testpass123",
+            employee_id="EMP002",
+            department=other_department,
+        )
+        Task.objects.create(
+            title="다른 부서 작업",
+            description="테스트 설명",
+            assignee=other,
+            reporter=other,
+            department=other_department,
+            start_date="2024-03-22T00:00:00Z",
+            due_date="2024-03-23T00:00:00Z",
+        )
+
+        # 부서를 지정해도 조회 범위 밖의 작업은 내보내지 않음
+        response = self.client.get(
+            reverse("task-export"), {"department": other_department.id}
+        )
+
+        rows = (
+            b"".join(response.streaming_content)
+            .decode("utf-8-sig")
+            .splitlines()
+        )
+        self.assertEqual(len(rows), 1)
+
+    def test_export_escapes_formulas(self):
+        Task.objects.filter(assignee=self.user).update(
+            title='=HYPERLINK("http://example.com")'
+        )
+
+        response = self.client.get(reverse("task-export"))
+
+        content = b"".join(response.streaming_content).decode("utf-8-sig")
+        row = next(csv.reader(StringIO(content.splitlines()[1])))
+        self.assertEqual(row[1], '\'=HYPERLINK("http://example.com")')
+
+
+class TaskDailyStatTest(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="testuser",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+        )
+        self.task = Task.objects.create(
+            title="테스트 작업",
+            description="테스트 설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+
+    def get_counts(self):
+        return dict(
+            TaskDailyStat.objects.values_list("status")
+            .annotate(total=Sum("task_count"))
+            .filter(total__gt=0)
+        )
+
+    def get_totals(self):
+        """롤업 키별 누적 작업 수"""
+        return {
+            key[:-1]: key[-1]
+            for key in TaskDailyStat.objects.values_list(
+                "department_id", "assignee_id", "status", "priority"
+            )
+            .annotate(total=Sum("task_count"))
+            .filter(total__gt=0)
+        }
+
+    def test_rollup_follows_status_changes(self):
+        self.assertEqual(self.get_counts(), {"TODO": 1})
+
+        self.task.status = "DONE"
+        self.task.save()
+        self.assertEqual(self.get_counts(), {"DONE": 1})
+
+        Task.objects.get(id=self.task.id).delete()
+        self.assertEqual(self.get_counts(), {})
+
+    def test_save_without_rollup_fields_skips_lookup(self):
+        # 롤업 필드를 저장하지 않으면 이전 롤업 키를 조회하지 않음
+        self.task.title = "제목 변경"
+        with CaptureQueriesContext(connection) as context:
+            self.task.save(update_fields=["title"])
+
+        self.assertFalse(
+            any(
+                query["sql"].startswith("SELECT")
+                and 'FROM "tasks_task"' in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+        self.assertEqual(self.get_counts(), {"TODO": 1})
+
+    def test_rebuild_matches_incremental(self):
+        TaskHistory.objects.create(
+            task=self.task,
+            changed_by=self.user,
+            previous_status="TODO",
+            new_status="IN_PROGRESS",
+        )
+        self.task.status = "IN_PROGRESS"
+        self.task.save()
+        incremental = self.get_counts()
+
+        call_command("rebuild_task_stats", stdout=StringIO())
+
+        self.assertEqual(self.get_counts(), incremental)
+        self.assertEqual(incremental, {"IN_PROGRESS": 1})
+
+    def test_rebuild_matches_changes_without_history(self):
+        # 이력 없이 바뀐 상태/담당 부서도 재계산 결과가 증분 롤업과 같음
+        other = Department.objects.create(name="다른부서", code="TEST002")
+        TaskHistory.objects.create(
+            task=self.task,
+            changed_by=self.user,
+            previous_status="TODO",
+            new_status="IN_PROGRESS",
+        )
+        self.task.status = "IN_PROGRESS"
+        self.task.save()
+        # 이력 없이 검토 상태로 변경 (관리자 수정 등)
+        self.task.status = "REVIEW"
+        self.task.save()
+        task = Task.objects.get(id=self.task.id)
+        task.priority = "HIGH"
+        task.department = other
+        task.save()
+        incremental = self.get_totals()
+
+        call_command("rebuild_task_stats", stdout=StringIO())
+
+        self.assertEqual(self.get_totals(), incremental)
+
+    def test_rebuild_drops_deleted_tasks(self):
+        Task.objects.get(id=self.task.id).delete()
+
+        call_command("rebuild_task_stats", stdout=StringIO())
+
+        self.assertEqual(self.get_counts(), {})
+        self.assertFalse(TaskDailyStat.objects.exists())
+
+    def test_migration_backfills_existing_tasks(self):
+        # 롤업 도입 전부터 있던 작업도 마이그레이션 후 집계됨
+        TaskDailyStat.objects.all().delete()
+        name = "0007_taskdailystat_backfill"
+        migration = import_module(f"tasks.migrations.{name}")
+        state = MigrationLoader(connection).project_state(("tasks", name))
+
+        # 마이그레이션 시점의 모델로 실행
+        migration.backfill_daily_stats(state.apps, None)
+
+        self.assertEqual(self.get_counts(), {"TODO": 1})
@@ -1,5 +1,6 @@
 from rest_framework import viewsets, filters
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import (
     Task,
@@ -8,10 +9,16 @@ from .models import (
     TaskHistory,
     TaskTimeLog,
     TaskEvaluation,
+    get_delayed_q,
+)
+from organizations.scope import (
+    HEADQUARTERS_RANKS,
+    get_department_subtree_ids,
+    get_visible_department_ids,
 )
-from organizations.models import Department
 from .serializers import (
     TaskSerializer,
+    TaskListSerializer,
     TaskCommentSerializer,
     TaskAttachmentSerializer,
     TaskHistorySerializer,
@@ -20,19 +27,41 @@ from .serializers import (
     TaskCalendarSerializer,
 )
 from .filters import TaskFilter
+from .search import search_tasks
+from .export import TASK_EXPORT_COLUMNS, export_rows, stream_csv
+from .performance import get_team_performance
+from .schedule import (
+    MAX_SCHEDULE_MOVES,
+    find_batch_conflicts,
+    find_schedule_conflicts,
+    parse_schedule_datetime,
+)
+from .scope import filter_by_scope
+from .pagination import TaskCursorPagination
+from .dashboard import (
+    DASHBOARD_SECTIONS,
+    MAX_WORKLOAD_RANGE_DAYS,
+    WORKLOAD_BUCKETS,
+    build_dashboard,
+    build_workload_matrix,
+    build_workload_series,
+)
+from calendar import timegm
 from datetime import datetime
+import hashlib
 from django.utils import timezone
-from django.utils.dateparse import parse_datetime
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.utils.dateparse import parse_date, parse_datetime
 from notifications.models import Notification
 from datetime import timedelta
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Q, Count, FilteredRelation
 from django.contrib.auth import get_user_model
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Value, CharField
-from django.db.models.functions import Concat
-import math
-from django.db.models import Avg
+from django.db.models import Value
+from django.db.models import Max
 from rest_framework.permissions import IsAuthenticated
 
 User = get_user_model()
@@ -51,7 +80,7 @@ class StandardResultsSetPagination(PageNumberPagination):
                 "count": count,
                 "next": self.get_next_link(),
                 "previous": self.get_previous_link(),
-                "total_pages": math.ceil(count / self.page_size),
+                "total_pages": self.page.paginator.num_pages,
                 "current_page": self.page.number,
                 "results": data,
             }
@@ -77,29 +106,7 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         # 단일 작업 조회 (retrieve)인 경우
         if self.action == "retrieve":
-            # ADMIN은 모든 작업 접근 가능
-            if user.role == "ADMIN":
-                return queryset
-
-            # DIRECTOR/GENERAL_MANAGER는 본부 내 모든 작업 접근 가능
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                if user.department.parent is None:  # 본부장인 경우
-                    dept_ids = [user.department.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=user.department
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    return queryset.filter(department_id__in=dept_ids)
-                else:  # 팀장인 경우
-                    return queryset.filter(department=user.department)
-
-            # MANAGER는 팀 내 작업만 접근 가능
-            elif user.role == "MANAGER":
-                return queryset.filter(department=user.department)
-
-            # EMPLOYEE는 자신의 작업만 접근 가능
-            else:
-                return queryset.filter(assignee=user)
+            return filter_by_scope(queryset, user)
 
         # 목록 조회 (list)인 경우
         department_id = self.request.query_params.get("department")
@@ -109,7 +116,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         if assignee_id:
             queryset = queryset.filter(assignee_id=assignee_id)
             # 본부장/이사는 모든 직원의 작업을 볼 수 있음
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
+            if user.rank in HEADQUARTERS_RANKS:
                 return queryset
             # 팀장은 자신의 팀원의 작업만 볼 수 있음
             elif user.role == "MANAGER":
@@ -118,63 +125,23 @@ class TaskViewSet(viewsets.ModelViewSet):
             else:
                 return queryset.filter(assignee=user)
 
-        # 부서 필터링
+        # 부서 필터링 (조회 범위 안에서만 좁힘)
         if department_id:
             try:
-                department_id = int(department_id)
-                selected_dept = Department.objects.get(id=department_id)
-
-                if selected_dept.parent is None:  # 본부인 경우
-                    child_depts = Department.objects.filter(
-                        parent=department_id
-                    )
-                    dept_ids = [department_id] + list(
-                        child_depts.values_list("id", flat=True)
-                    )
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:
-                    queryset = queryset.filter(department_id=department_id)
-
-            except (Department.DoesNotExist, ValueError) as e:
-                print(f"Error: {e}")
+                # 본부인 경우 산하 팀 포함
+                dept_ids = get_department_subtree_ids(int(department_id))
+            except ValueError:
                 return Task.objects.none()
+            if not dept_ids:
+                return Task.objects.none()
+            queryset = queryset.filter(department_id__in=dept_ids)
 
-        # 일반적인 작업 목록 조회 (assignee_id가 없고 department_id도 없는 경우)
-        elif user.role != "ADMIN":
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                if (
-                    user.department.parent is None
-                ):  # 본부장/이사가 본부 소속인 경우
-                    dept_ids = [user.department.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=user.department
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:  # 팀 소속인 경우
-                    queryset = queryset.filter(department=user.department)
-            elif user.role == "MANAGER":
-                queryset = queryset.filter(department=user.department)
-            else:
-                queryset = queryset.filter(assignee=user)
+        queryset = filter_by_scope(queryset, user)
 
         # 검색어 처리
         search = self.request.query_params.get("search", "")
         if search:
-            title_desc_search = Q(title__icontains=search) | Q(
-                description__icontains=search
-            )
-
-            queryset = queryset.annotate(
-                full_name=Concat(
-                    "assignee__last_name",
-                    "assignee__first_name",
-                    output_field=CharField(),
-                )
-            )
-
-            name_search = Q(full_name__icontains=search)
-            queryset = queryset.filter(title_desc_search | name_search)
+            queryset = search_tasks(queryset, search)
 
         # 나머지 필터링 로직
         status = self.request.query_params.get("status")
@@ -185,53 +152,58 @@ class TaskViewSet(viewsets.ModelViewSet):
         if priority:
             queryset = queryset.filter(priority=priority)
 
-        start_date = self.request.query_params.get("start_date")
-        end_date = self.request.query_params.get("end_date")
+        # 캘린더는 기간 겹침 조건으로 별도 필터링
+        if self.action != "calendar":
+            start_date = self.request.query_params.get("start_date")
+            end_date = self.request.query_params.get("end_date")
+
+            if start_date:
+                queryset = queryset.filter(start_date__gte=start_date)
+            if end_date:
+                queryset = queryset.filter(due_date__lte=end_date)
+
+        if self.action == "list":
+            queryset = TaskListSerializer.setup_eager_loading(queryset)
 
-        if start_date:
-            queryset = queryset.filter(start_date__gte=start_date)
-        if end_date:
-            queryset = queryset.filter(due_date__lte=end_date)
+        return queryset.order_by("start_date")
 
-        return queryset.distinct().order_by("start_date")
+    def get_serializer_class(self):
+        if self.action == "list":
+            return TaskListSerializer
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        # 검색 시 별도 정렬 요청이 없으면 관련도 순으로 정렬
+        if "search_rank" in queryset.query.annotations and not (
+            self.request.query_params.get("ordering")
+        ):
+            queryset = queryset.order_by("-search_rank", "start_date")
+        return queryset
+
+    @property
+    def paginator(self):
+        """?cursor= 파라미터가 있으면 키셋 페이지네이션 사용"""
+        if not hasattr(self, "_paginator"):
+            if "cursor" in self.request.query_params:
+                self._paginator = TaskCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def list(self, request, *args, **kwargs):
-        # 1. 전체 쿼리셋 가져오기
         queryset = self.filter_queryset(self.get_queryset())
 
-        # 2. 페이지네이션 적용 전의 전체 결과 저장
-        total_results = queryset.count()
-
-        # 3. 페이지네이션 적용
+        # 페이지네이션 적용 (전체 결과 수는 페이지네이터에서 한 번만 계산)
         page = self.paginate_queryset(queryset)
-
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            # 4. 페이지네이션된 응답에 전체 결과 수 포함
-            return Response(
-                {
-                    "count": total_results,  # 전체 결과 수 (21)
-                    "next": self.paginator.get_next_link(),
-                    "previous": self.paginator.get_previous_link(),
-                    "total_pages": math.ceil(
-                        total_results / self.paginator.page_size
-                    ),
-                    "current_page": self.paginator.page.number,
-                    "results": serializer.data,
-                }
-            )
+            return self.get_paginated_response(serializer.data)
 
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
-    def paginate_queryset(self, queryset):
-        # 페이지네이션 결과 깅
-        page = super().paginate_queryset(queryset)
-        if page is not None:
-            print(f"Page size: {len(page)}")
-            print(f"Total pages: {self.paginator.page.paginator.num_pages}")
-        return page
-
     def perform_update(self, serializer):
         old_instance = self.get_object()
         old_status = old_instance.status
@@ -368,7 +340,11 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"])
     def calendar(self, request):
-        """캘린더 뷰를 위한 작업 목록 조회"""
+        """
+        캘린더 뷰를 위한 작업 목록 조회
+        - 기간과 겹치는 작업 조회 (시작일 <= 기간 끝, 마감일 >= 기간 시작)
+        - ETag/Last-Modified로 변경이 없으면 304 응답
+        """
         start_date = request.query_params.get("start_date")
         end_date = request.query_params.get("end_date")
         assignee = request.query_params.get("assignee")
@@ -377,19 +353,26 @@ class TaskViewSet(viewsets.ModelViewSet):
         queryset = self.get_queryset()
 
         if start_date and end_date:
-            # 시간대를 포함한 datetime으로 변환
-            start_datetime = timezone.make_aware(
-                datetime.strptime(
-                    f"{start_date} 00:00:00", "%Y-%m-%d %H:%M:%S"
+            try:
+                start = parse_date(start_date)
+                end = parse_date(end_date)
+            except ValueError:
+                start = end = None
+            if not start or not end:
+                return Response(
+                    {"detail": "날짜 형식이 올바르지 않습니다."}, status=400
                 )
+
+            range_start = timezone.make_aware(
+                datetime.combine(start, datetime.min.time())
             )
-            end_datetime = timezone.make_aware(
-                datetime.strptime(f"{end_date} 23:59:59", "%Y-%m-%d %H:%M:%S")
+            range_end = timezone.make_aware(
+                datetime.combine(end + timedelta(days=1), datetime.min.time())
             )
-
+            # 기간 전체에 걸친 작업도 포함되도록 겹침 조건으로 조회
+            # (담당자/부서별 (start_date, due_date) 복합 인덱스 사용)
             queryset = queryset.filter(
-                Q(start_date__range=[start_datetime, end_datetime])
-                | Q(due_date__range=[start_datetime, end_datetime])
+                start_date__lt=range_end, due_date__gte=range_start
             )
 
         # 담당자 또는 부서 기준 필터링
@@ -398,21 +381,86 @@ class TaskViewSet(viewsets.ModelViewSet):
         elif department:
             queryset = queryset.filter(department=department)
 
+        # 작업 수와 최종 수정 시각으로 변경 여부 판단
+        # (삭제/기간 밖 이동은 작업 수, 수정/추가는 수정 시각으로 감지)
+        # is_delayed는 행 변경 없이 마감일이 지나면 바뀌므로
+        # 지연 작업 수와 가장 최근에 지난 마감일도 함께 반영
+        delayed_q = get_delayed_q()
+        summary = queryset.order_by().aggregate(
+            count=Count("id"),
+            delayed_count=Count("id", filter=delayed_q),
+            last_updated=Max("updated_at"),
+            last_delayed=Max("due_date", filter=delayed_q),
+        )
+        last_modified = max(
+            filter(None, [summary["last_updated"], summary["last_delayed"]]),
+            default=None,
+        )
+        etag = quote_etag(
+            hashlib.md5(
+                ":".join(
+                    [
+                        str(request.user.pk),
+                        request.get_full_path(),
+                        str(summary["count"]),
+                        str(summary["delayed_count"]),
+                        last_modified.isoformat() if last_modified else "",
+                    ]
+                ).encode()
+            ).hexdigest()
+        )
+        last_modified = (
+            timegm(last_modified.utctimetuple()) if last_modified else None
+        )
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+
         serializer = TaskCalendarSerializer(queryset, many=True)
-        return Response(serializer.data)
+        response = Response(serializer.data)
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        # 브라우저가 매번 재검증하도록 설정
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
     @action(detail=True, methods=["post"])
     def update_dates(self, request, pk=None):
         """작업 일정 업데이트 (드래그 앤 드롭)"""
         task = self.get_object()
-        new_start = request.data.get("start_date")
-        new_end = request.data.get("due_date")
+        try:
+            new_start = (
+                parse_schedule_datetime(request.data.get("start_date"))
+                or task.start_date
+            )
+            new_end = (
+                parse_schedule_datetime(request.data.get("due_date"))
+                or task.due_date
+            )
+        except ValueError:
+            return Response(
+                {"detail": "날짜 형식이 올바르지 않습니다."}, status=400
+            )
+
+        if new_start > new_end:
+            return Response(
+                {"detail": "시작일은 마감일보다 이후일 수 없습니다."},
+                status=400,
+            )
 
         # 일정 충돌 체크
-        if self.check_schedule_conflict(
+        conflicts = self.check_schedule_conflict(
             task.assignee, new_start, new_end, exclude_task=task
-        ):
-            return Response({"detail": "일정이 충돌합다."}, status=400)
+        )
+        if conflicts:
+            return Response(
+                {"detail": "일정이 충돌합니다.", "conflicts": conflicts},
+                status=400,
+            )
 
         serializer = self.get_serializer(task, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
@@ -420,29 +468,200 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         return Response(serializer.data)
 
+    def check_schedule_conflict(self, assignee, start, end, exclude_task=None):
+        """담당자의 기간이 겹치는 작업 목록 (충돌이 없으면 빈 목록)"""
+        if assignee is None:
+            return []
+        exclude_ids = [exclude_task.id] if exclude_task else []
+        return list(
+            find_schedule_conflicts(assignee, start, end, exclude_ids).values(
+                "id", "title", "start_date", "due_date"
+            )
+        )
+
+    @action(detail=False, methods=["post"])
+    def batch_update_dates(self, request):
+        """
+        여러 작업 일정 일괄 변경 (간트 차트 그룹 드래그)
+        - moves: [{"task": ID, "start_date": ..., "due_date": ...}, ...]
+        - dry_run: true이면 충돌 검사만 수행
+        모든 충돌을 한 번에 반환하고, 충돌이 있으면 변경하지 않음
+        """
+        moves = request.data.get("moves")
+        if not isinstance(moves, list) or not moves:
+            return Response({"detail": "moves가 필요합니다."}, status=400)
+        if len(moves) > MAX_SCHEDULE_MOVES:
+            return Response(
+                {
+                    "detail": (
+                        "한 번에 변경할 수 있는 작업은 최대"
+                        f" {MAX_SCHEDULE_MOVES}개입니다."
+                    )
+                },
+                status=400,
+            )
+
+        try:
+            task_ids = [int(move["task"]) for move in moves]
+        except (KeyError, TypeError, ValueError):
+            return Response(
+                {"detail": "작업 ID가 올바르지 않습니다."}, status=400
+            )
+        if len(set(task_ids)) != len(task_ids):
+            return Response(
+                {"detail": "같은 작업이 중복되었습니다."}, status=400
+            )
+
+        tasks = self.get_queryset().in_bulk(task_ids)
+        if len(tasks) != len(task_ids):
+            raise NotFound("작업을 찾을 수 없습니다.")
+
+        proposed = []
+        for task_id, move in zip(task_ids, moves):
+            task = tasks[task_id]
+            try:
+                start = (
+                    parse_schedule_datetime(move.get("start_date"))
+                    or task.start_date
+                )
+                due = (
+                    parse_schedule_datetime(move.get("due_date"))
+                    or task.due_date
+                )
+            except ValueError:
+                return Response(
+                    {
+                        "detail": "날짜 형식이 올바르지 않습니다.",
+                        "task": task_id,
+                    },
+                    status=400,
+                )
+            if start > due:
+                return Response(
+                    {
+                        "detail": "시작일은 마감일보다 이후일 수 없습니다.",
+                        "task": task_id,
+                    },
+                    status=400,
+                )
+            proposed.append((task, start, due))
+
+        conflicts = find_batch_conflicts(proposed)
+        if conflicts:
+            return Response(
+                {
+                    "detail": "일정이 충돌합니다.",
+                    "conflicts": [
+                        {"task": task_id, "conflicting_tasks": items}
+                        for task_id, items in conflicts.items()
+                    ],
+                },
+                status=400,
+            )
+
+        if str(request.data.get("dry_run", "")).lower() in ("1", "true"):
+            return Response({"conflicts": []})
+
+        with transaction.atomic():
+            for task, start, due in proposed:
+                task.start_date = start
+                task.due_date = due
+                task.save(
+                    update_fields=["start_date", "due_date", "updated_at"]
+                )
+
+        return Response(
+            TaskCalendarSerializer(
+                [task for task, _, _ in proposed], many=True
+            ).data
+        )
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        작업 목록 CSV 내보내기
+        목록 조회와 같은 필터/검색/권한을 적용하고 서버 측 커서로 스트리밍
+        """
+        queryset = self.filter_queryset(self.get_queryset()).with_delay()
+        return stream_csv(
+            f"tasks_{timezone.localdate():%Y%m%d}.csv",
+            export_rows(queryset, TASK_EXPORT_COLUMNS),
+        )
+
     @action(detail=False, methods=["get"])
     def workload(self, request):
-        """리소스 할당 상황 조회"""
-        date = request.query_params.get("date", datetime.now().date())
+        """
+        리소스 할당 상황 조회
+        - date: 해당 날짜의 사용자별 진행 중인 작업 수
+        - start/end: 사용자 × 날짜별 작업 수 매트릭스 (히트맵용)
+        """
         department_id = request.query_params.get("department")
 
-        queryset = User.objects.all()
+        users = User.objects.order_by("id")
         if department_id:
-            queryset = queryset.filter(department_id=department_id)
-
-        workload_data = []
-        for user in queryset:
-            tasks_count = Task.objects.filter(
-                assignee=user, start_date__lte=date, due_date__gte=date
-            ).count()
-            workload_data.append(
-                {
-                    "user_id": user.id,
-                    "user_name": f"{user.first_name} {user.last_name}",
-                    "tasks_count": tasks_count,
-                }
+            users = users.filter(department_id=department_id)
+
+        start = request.query_params.get("start")
+        end = request.query_params.get("end")
+        try:
+            if start or end:
+                start = parse_date(start or "")
+                end = parse_date(end or "")
+                if not start or not end:
+                    raise ValueError
+            else:
+                date = parse_date(
+                    request.query_params.get("date", "")
+                ) or timezone.localdate()
+        except ValueError:
+            return Response(
+                {"detail": "날짜 형식이 올바르지 않습니다."}, status=400
             )
 
+        # 기간 조회 (사용자 × 날짜 매트릭스)
+        if start:
+            if start > end:
+                return Response(
+                    {"detail": "start는 end보다 이후일 수 없습니다."},
+                    status=400,
+                )
+            if (end - start).days >= MAX_WORKLOAD_RANGE_DAYS:
+                return Response(
+                    {
+                        "detail": (
+                            "조회 기간은 최대"
+                            f" {MAX_WORKLOAD_RANGE_DAYS}일입니다."
+                        )
+                    },
+                    status=400,
+                )
+            return Response(build_workload_matrix(users, start, end))
+
+        # 단일 날짜 조회 (조인 조건에 기간을 포함한 그룹 집계 한 번)
+        day_start = timezone.make_aware(
+            datetime.combine(date, datetime.min.time())
+        )
+        day_end = day_start + timedelta(days=1)
+        users = users.annotate(
+            active_tasks=FilteredRelation(
+                "assigned_tasks",
+                condition=Q(
+                    assigned_tasks__start_date__lt=day_end,
+                    assigned_tasks__due_date__gte=day_start,
+                ),
+            ),
+            tasks_count=Count("active_tasks"),
+        ).values("id", "first_name", "last_name", "tasks_count")
+
+        workload_data = [
+            {
+                "user_id": user["id"],
+                "user_name": f"{user['first_name']} {user['last_name']}",
+                "tasks_count": user["tasks_count"],
+            }
+            for user in users
+        ]
+
         return Response(workload_data)
 
     @action(detail=True, methods=["get"])
@@ -459,303 +678,102 @@ class TaskViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def today_tasks(self, request):
         """대시보드용 오늘의 작업 조회 API"""
-        user = request.user
-        today = timezone.now().date()
-
-        # 기본 쿼리셋 (오늘이 시작일과 마감일 사이에 있는 작업)
-        queryset = Task.objects.filter(
-            start_date__date__lte=today,  # 시작일이 오늘이 나 이전
-            due_date__date__gte=today,  # 마감일이 오늘이거나 이후
-            status__in=[
-                "TODO",
-                "IN_PROGRESS",
-                "REVIEW",
-            ],  # 완료되지 않은 작업만
-        )
-
-        # 권한에 따른 필터링
-        if user.role != "ADMIN":
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                dept = Department.objects.get(id=user.department.id)
-                if dept.parent is None:  # 본부인 경우
-                    dept_ids = [dept.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=dept
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:  # 팀인 경우
-                    queryset = queryset.filter(department=user.department)
-            elif user.role == "MANAGER":
-                queryset = queryset.filter(department=user.department)
-            else:
-                queryset = queryset.filter(assignee=user)
-
-        serializer = TaskSerializer(queryset, many=True)
-        return Response(serializer.data)
+        data = build_dashboard(request.user, ["today_tasks"])
+        return Response(data["today_tasks"])
 
     @action(detail=False, methods=["get"])
     def delayed_tasks(self, request):
         """대시보드용 지연된 작업 조회 API"""
-        user = request.user
-        today = timezone.now().date()
-
-        # 기본 쿼셋 (마감일이 오늘 이전이고 직 완료되지 않 작업)
-        queryset = Task.objects.filter(
-            due_date__date__lt=today,  # 마감일이 오늘 이전인 작업
-            status__in=["TODO", "IN_PROGRESS", "REVIEW"],  # 완료되지 않은 작업
-        )
-
-        # 권한에 따른 필터링 (today_tasks와 동일한 로직)
-        if user.role != "ADMIN":
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                dept = Department.objects.get(id=user.department.id)
-                if dept.parent is None:
-                    dept_ids = [dept.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=dept
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:
-                    queryset = queryset.filter(department=user.department)
-            elif user.role == "MANAGER":
-                queryset = queryset.filter(department=user.department)
-            else:
-                queryset = queryset.filter(assignee=user)
-
-        serializer = TaskSerializer(queryset, many=True)
-        return Response(serializer.data)
+        data = build_dashboard(request.user, ["delayed_tasks"])
+        return Response(data["delayed_tasks"])
 
     @action(detail=False, methods=["get"], url_path="workload-stats")
     def workload_stats(self, request):
-        """작 부 통계"""
+        """
+        작업 부하 통계
+        start/end(YYYY-MM-DD, 기본: 최근 7일), bucket(day/week/month) 지원
+        """
         today = timezone.now().date()
-        start_date = today - timedelta(days=7)
+        bucket = request.query_params.get("bucket", "day")
+        if bucket not in WORKLOAD_BUCKETS:
+            return Response(
+                {"detail": "bucket은 day, week, month 중 하나여야 합니다."},
+                status=400,
+            )
 
-        # 권한에 따른 쿼리셋 필터링
-        if request.user.role == "ADMIN":
-            queryset = Task.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:  # 본부장인 경우
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = Task.objects.filter(department_id__in=dept_ids)
-            else:  # 팀장인 경우
-                queryset = Task.objects.filter(
-                    department=request.user.department
-                )
-        else:
-            queryset = Task.objects.filter(assignee=request.user)
-
-        # 일별 통계 계산
-        daily_stats = []
-        for i in range(7):
-            date = start_date + timedelta(days=i)
-            stats = {
-                "date": date.strftime("%Y-%m-%d"),
-                "total": queryset.filter(start_date__date=date).count(),
-                "completed": queryset.filter(
-                    completed_at__date=date, status="DONE"
-                ).count(),
-                "inProgress": queryset.filter(
-                    start_date__date=date, status="IN_PROGRESS"
-                ).count(),
-                "delayed": queryset.filter(
-                    due_date__date=date, status__in=["TODO", "IN_PROGRESS"]
-                ).count(),
-            }
-            daily_stats.append(stats)
+        try:
+            start = parse_date(request.query_params.get("start", "")) or (
+                today - timedelta(days=7)
+            )
+            end = parse_date(request.query_params.get("end", "")) or (
+                today - timedelta(days=1)
+            )
+        except ValueError:
+            return Response(
+                {"detail": "날짜 형식이 올바르지 않습니다."}, status=400
+            )
 
-        return Response(daily_stats)
+        if start > end:
+            return Response(
+                {"detail": "start는 end보다 이후일 수 없습니다."}, status=400
+            )
+        if (end - start).days >= MAX_WORKLOAD_RANGE_DAYS:
+            return Response(
+                {
+                    "detail": (
+                        f"조회 기간은 최대 {MAX_WORKLOAD_RANGE_DAYS}일입니다."
+                    )
+                },
+                status=400,
+            )
+
+        return Response(
+            build_workload_series(request.user, start, end, bucket)
+        )
 
     @action(detail=False, methods=["get"], url_path="priority-stats")
     def priority_stats(self, request):
         """우선순위별 작업 통계"""
-        # 권한에 따른 쿼리셋 필터링
-        if request.user.role == "ADMIN":
-            queryset = Task.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = Task.objects.filter(department_id__in=dept_ids)
-            else:
-                queryset = Task.objects.filter(
-                    department=request.user.department
-                )
-        else:
-            queryset = Task.objects.filter(assignee=request.user)
-
-        stats = []
-        total = queryset.count()
-        for priority, _ in Task.PRIORITY_CHOICES:
-            count = queryset.filter(priority=priority).count()
-            percentage = (count / total * 100) if total > 0 else 0
-            stats.append(
-                {
-                    "priority": priority,
-                    "count": count,
-                    "percentage": round(percentage, 1),
-                }
-            )
-        return Response(stats)
+        data = build_dashboard(request.user, ["priority_stats"])
+        return Response(data["priority_stats"])
 
     @action(detail=False, methods=["get"], url_path="upcoming-deadlines")
     def upcoming_deadlines(self, request):
-        """다가오는 감일 작업"""
-        today = timezone.now().date()
-        end_date = today + timedelta(days=7)  # 일주일 이내 마감
-
-        # 권한에 따른 쿼리셋 필터링
-        if request.user.role == "ADMIN":
-            queryset = Task.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = Task.objects.filter(department_id__in=dept_ids)
-            else:
-                queryset = Task.objects.filter(
-                    department=request.user.department
-                )
-        else:
-            queryset = Task.objects.filter(assignee=request.user)
-
-        upcoming_tasks = queryset.filter(
-            due_date__date__range=[today, end_date],
-            status__in=["TODO", "IN_PROGRESS"],
-        ).order_by("due_date")[
-            :5
-        ]  # 상위 5개만
-
-        serializer = TaskSerializer(upcoming_tasks, many=True)
-        return Response(serializer.data)
+        """다가오는 마감일 작업"""
+        data = build_dashboard(request.user, ["upcoming_deadlines"])
+        return Response(data["upcoming_deadlines"])
 
     @action(detail=False, methods=["get"], url_path="team-performance")
     def team_performance(self, request):
-        """팀 성과 통계"""
-        # 권한에 따른 팀원 목록 조회
-        if request.user.role == "ADMIN":
-            team_members = User.objects.filter(
-                is_active=True,
-                rank__in=[
-                    "STAFF",
-                    "SENIOR",
-                    "ASSISTANT_MANAGER",
-                    "MANAGER",
-                    "DEPUTY_GENERAL_MANAGER",
-                ],  # 본부장/이사 제외
-            )
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                team_members = User.objects.filter(
-                    department_id__in=dept_ids,
-                    is_active=True,
-                    rank__in=[
-                        "STAFF",
-                        "SENIOR",
-                        "ASSISTANT_MANAGER",
-                        "MANAGER",
-                        "DEPUTY_GENERAL_MANAGER",
-                    ],  # 본부장/이사 제외
-                )
-            else:
-                team_members = User.objects.filter(
-                    department=request.user.department,
-                    is_active=True,
-                    rank__in=[
-                        "STAFF",
-                        "SENIOR",
-                        "ASSISTANT_MANAGER",
-                        "MANAGER",
-                        "DEPUTY_GENERAL_MANAGER",
-                    ],  # 본부장/이사 제외
-                )
-        else:
-            team_members = User.objects.filter(
-                department=request.user.department,
-                is_active=True,
-                rank__in=[
-                    "STAFF",
-                    "SENIOR",
-                    "ASSISTANT_MANAGER",
-                    "MANAGER",
-                    "DEPUTY_GENERAL_MANAGER",
-                ],  # 본부장/이사 제외
-            )
-
-        # 각 팀원별 성과 계산
-        performance_data = []
-        for member in team_members:
-            # 전체 작업 수와 완료된 작업 수 계
-            member_tasks = Task.objects.filter(assignee=member)
-            total_tasks = member_tasks.count()
-            completed_tasks = member_tasks.filter(status="DONE").count()
-            completion_rate = (
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-            )
-
-            # 평가 점수 계산 - 완료된 작업만 대상으로
-            completed_task_ids = member_tasks.filter(
-                status="DONE"
-            ).values_list("id", flat=True)
-            evaluations = TaskEvaluation.objects.filter(
-                task_id__in=completed_task_ids
-            )
-            avg_score = (
-                evaluations.aggregate(Avg("performance_score"))[
-                    "performance_score__avg"
-                ]
-                or 0
-            )
-
-            performance_data.append(
-                {
-                    "user_id": member.id,
-                    "name": f"{member.last_name}{member.first_name}",
-                    "completion_rate": round(completion_rate, 1),
-                    "task_count": total_tasks,
-                    "average_score": round(avg_score, 1),
-                }
-            )
-
-        return Response({"members": performance_data})
+        """
+        팀 성과 통계
+        - 팀원별 성과는 그룹 집계 한 번으로 계산하고 캐시함
+        - refresh=true이면 캐시를 사용하지 않고 다시 계산
+        """
+        dept_ids = get_visible_department_ids(request.user)
+        if dept_ids is not None:
+            # 일반 직원은 소속 팀원 기준
+            dept_ids = dept_ids or [request.user.department_id]
+
+        refresh = request.query_params.get("refresh", "").lower() in (
+            "1",
+            "true",
+        )
+        return Response(
+            {"members": get_team_performance(dept_ids, refresh=refresh)}
+        )
 
     @action(detail=False, methods=["get"], url_path="recent")
     def recent_activities(self, request):
         """최근 작업 활동 내역"""
-        # 한에 따른 쿼리셋 터링
-        if request.user.role == "ADMIN":
+        # 권한에 따른 쿼리셋 필터링
+        dept_ids = get_visible_department_ids(request.user)
+        if dept_ids is None:
             queryset = TaskHistory.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = TaskHistory.objects.filter(
-                    task__department_id__in=dept_ids
-                )
-            else:
-                queryset = TaskHistory.objects.filter(
-                    task__department=request.user.department
-                )
+        elif dept_ids and request.user.rank in HEADQUARTERS_RANKS:
+            queryset = TaskHistory.objects.filter(
+                task__department_id__in=dept_ids
+            )
         else:
             queryset = TaskHistory.objects.filter(
                 Q(task__assignee=request.user) | Q(changed_by=request.user)
@@ -798,76 +816,31 @@ class TaskViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="stats")
     def stats(self, request):
         """작업 전반적인 통계"""
-        today = timezone.now().date()
-        last_week = today - timedelta(days=7)
+        data = build_dashboard(request.user, ["stats"])
+        return Response(data["stats"])
 
-        # 권한에 따른 쿼리셋 필터링
-        if request.user.role == "ADMIN":
-            queryset = Task.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = Task.objects.filter(department_id__in=dept_ids)
-            else:
-                queryset = Task.objects.filter(
-                    department=request.user.department
+    @action(detail=False, methods=["get"])
+    def dashboard(self, request):
+        """
+        대시보드 통합 조회 API
+        sections 파라미터(쉼표 구분)로 필요한 섹션만 선택 가능
+        """
+        sections = request.query_params.get("sections")
+        if sections:
+            sections = [s.strip() for s in sections.split(",") if s.strip()]
+            invalid = [s for s in sections if s not in DASHBOARD_SECTIONS]
+            if invalid:
+                return Response(
+                    {
+                        "detail": (
+                            f"지원하지 않는 섹션입니다: {', '.join(invalid)}"
+                        ),
+                        "sections": DASHBOARD_SECTIONS,
+                    },
+                    status=400,
                 )
-        else:
-            queryset = Task.objects.filter(assignee=request.user)
-
-        # 이번 주 통계
-        total_tasks = queryset.count()
-        in_progress_tasks = queryset.filter(status="IN_PROGRESS").count()
-        completed_tasks = queryset.filter(status="DONE").count()
-        delayed_tasks = queryset.filter(
-            due_date__date__lt=today, status__in=["TODO", "IN_PROGRESS"]
-        ).count()
-
-        # 지 주 통계
-        last_week_queryset = queryset.filter(created_at__date__lte=last_week)
-        last_week_total = last_week_queryset.count()
-        last_week_in_progress = last_week_queryset.filter(
-            status="IN_PROGRESS"
-        ).count()
-        last_week_completed = last_week_queryset.filter(status="DONE").count()
-        last_week_delayed = last_week_queryset.filter(
-            due_date__date__lt=last_week, status__in=["TODO", "IN_PROGRESS"]
-        ).count()
-
-        # 증감률 계산
-        def calculate_trend(current, previous):
-            if previous == 0:
-                return 100 if current > 0 else 0
-            return round(((current - previous) / previous) * 100, 1)
 
-        return Response(
-            {
-                "total": {
-                    "count": total_tasks,
-                    "trend": calculate_trend(total_tasks, last_week_total),
-                },
-                "in_progress": {
-                    "count": in_progress_tasks,
-                    "trend": calculate_trend(
-                        in_progress_tasks, last_week_in_progress
-                    ),
-                },
-                "completed": {
-                    "count": completed_tasks,
-                    "trend": calculate_trend(
-                        completed_tasks, last_week_completed
-                    ),
-                },
-                "delayed": {
-                    "count": delayed_tasks,
-                    "trend": calculate_trend(delayed_tasks, last_week_delayed),
-                },
-            }
-        )
+        return Response(build_dashboard(request.user, sections))
 
 
 class TaskCommentViewSet(viewsets.ModelViewSet):
@@ -999,28 +972,8 @@ class TaskEvaluationViewSet(viewsets.ModelViewSet):
         if task_id:
             queryset = queryset.filter(task_id=task_id)
 
-        # ADMIN은 모든 평가 조회 가능
-        if user.role == "ADMIN":
-            return queryset
-
-        # DIRECTOR/GENERAL_MANAGER는 본부 내 평가만 조회 가능
-        if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if user.department.parent is None:  # 본부장인 경우
-                dept_ids = [user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                return queryset.filter(task__department_id__in=dept_ids)
-            else:  # 팀장인 경우
-                return queryset.filter(task__department=user.department)
-
-        # MANAGER는 팀 내 평가만 조회 가능
-        if user.role == "MANAGER":
-            return queryset.filter(task__department=user.department)
-
-        # EMPLOYEE는 자신의 작업에 대한 평가만 조회 가능
-        return queryset.filter(task__assignee=user)
+        # 권한에 따른 필터링 (EMPLOYEE는 자신의 작업에 대한 평가만)
+        return filter_by_scope(queryset, user, prefix="task__")
 
     def perform_create(self, serializer):
         user = self.request.user
@@ -1062,7 +1015,7 @@ class TaskEvaluationViewSet(viewsets.ModelViewSet):
             return True
 
         # DIRECTOR/GENERAL_MANAGER는 본부 내 작업 평가 가능
-        if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
+        if user.rank in HEADQUARTERS_RANKS:
             if user.department.parent is None:  # 본부장인 경우
                 return (
                     task.department.id == user.department.id  # 직속 부서